@@ -130,6 +130,18 @@ def test_core_fetchmany(n):
                 data = row['id'], row['name'], row['description']
 
 
+@Profiler.profile
+def test_core_fetch_columns(n):
+    """Load Core results as columns using fetch_columns."""
+
+    with engine.connect() as conn:
+        result = conn.execute(Customer.__table__.select().limit(n))
+        while True:
+            ids, names, descriptions = result.fetch_columns(10000)
+            if not ids:
+                break
+
+
 @Profiler.profile
 def test_dbapi_fetchall_plus_append_objects(n):
     """Load rows using DBAPI fetchall(), generate an object for each row."""
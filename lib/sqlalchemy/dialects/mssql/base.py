@@ -1696,6 +1696,7 @@ class MSDialect(default.DefaultDialect):
     execution_ctx_cls = MSExecutionContext
     use_scope_identity = True
     max_identifier_length = 128
+    max_bind_parameters = 2100
     schema_name = "dbo"
 
     colspecs = {
@@ -30,7 +30,9 @@ on the URL, or as keyword arguments to :func:`.create_engine()` are:
 * ``arraysize`` - set the cx_oracle.arraysize value on cursors, defaulted
   to 50.  This setting is significant with cx_Oracle as the contents of LOB
   objects are only readable within a "live" row (e.g. within a batch of
-  50 rows).
+  50 rows).  The value may be overridden for individual statements using
+  the ``fetch_array_size`` execution option, e.g.
+  ``conn.execution_options(fetch_array_size=5000)``.
 
 * ``auto_convert_lobs`` - defaults to True; See :ref:`cx_oracle_lob`.
 
@@ -550,8 +552,9 @@ class OracleExecutionContext_cx_oracle(OracleExecutionContext):
 
     def create_cursor(self):
         c = self._dbapi_connection.cursor()
-        if self.dialect.arraysize:
-            c.arraysize = self.dialect.arraysize
+        arraysize = self.fetch_array_size or self.dialect.arraysize
+        if arraysize:
+            c.arraysize = arraysize
 
         return c
 
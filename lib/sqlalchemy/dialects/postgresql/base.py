@@ -2043,6 +2043,7 @@ class PGDialect(default.DefaultDialect):
     sequences_optional = True
     preexecute_autoincrement_sequences = True
     postfetch_lastrowid = False
+    update_from_returning = True
 
     supports_comments = True
     supports_default_values = True
@@ -2346,6 +2347,52 @@ class PGDialect(default.DefaultDialect):
             raise exc.NoSuchTableError(table_name)
         return table_oid
 
+    def _get_table_oids(self, connection, schema, table_names, info_cache):
+        """Fetch the oids for many tables in one query, as a dictionary
+        of table name to oid.
+
+        Tables which don't exist are omitted.
+
+        """
+        if table_names is None:
+            table_names = self.get_table_names(
+                connection, schema, info_cache=info_cache)
+        if not table_names:
+            return {}
+
+        # the get_multi_xyz() methods are typically called together
+        # for the same tables, see Inspector._prefetch_reflection()
+        cache_key = ('_get_table_oids', schema, tuple(table_names))
+        if info_cache is not None and cache_key in info_cache:
+            return info_cache[cache_key]
+
+        if schema is not None:
+            schema_where_clause = "n.nspname = :schema"
+        else:
+            schema_where_clause = "pg_catalog.pg_table_is_visible(c.oid)"
+        query = """
+            SELECT c.relname, c.oid
+            FROM pg_catalog.pg_class c
+            LEFT JOIN pg_catalog.pg_namespace n ON n.oid = c.relnamespace
+            WHERE (%s)
+            AND c.relname IN :table_names
+            AND c.relkind in ('r', 'v', 'm', 'f')
+        """ % schema_where_clause
+        s = sql.text(query).bindparams(
+            sql.bindparam(
+                'table_names', type_=sqltypes.Unicode, expanding=True))
+        s = s.columns(relname=sqltypes.Unicode, oid=sqltypes.Integer)
+        if schema is not None:
+            schema = util.text_type(schema)
+            s = s.bindparams(sql.bindparam('schema', type_=sqltypes.Unicode))
+        c = connection.execute(
+            s, table_names=[util.text_type(name) for name in table_names],
+            schema=schema)
+        table_oids = dict(c.fetchall())
+        if info_cache is not None:
+            info_cache[cache_key] = table_oids
+        return table_oids
+
     @reflection.cache
     def get_schema_names(self, connection, **kw):
         result = connection.execute(
@@ -2365,6 +2412,54 @@ class PGDialect(default.DefaultDialect):
             schema=schema if schema is not None else self.default_schema_name)
         return [name for name, in result]
 
+    def get_schema_fingerprint(self, connection, schema=None, **kw):
+        # any DDL against a table, column, constraint, index, comment,
+        # enum or domain rewrites the corresponding catalog rows,
+        # producing a new xmin
+        FINGERPRINT_SQL = """
+            SELECT md5(string_agg(k, ',' ORDER BY k)) FROM (
+                SELECT 'c' || c.oid || ':' || c.xmin::text AS k
+                FROM pg_catalog.pg_class c
+                JOIN pg_catalog.pg_namespace n ON n.oid = c.relnamespace
+                WHERE n.nspname = :schema
+                UNION ALL
+                SELECT 'a' || a.attrelid || ':' || a.attnum || ':' ||
+                    a.xmin::text
+                FROM pg_catalog.pg_attribute a
+                JOIN pg_catalog.pg_class c ON c.oid = a.attrelid
+                JOIN pg_catalog.pg_namespace n ON n.oid = c.relnamespace
+                WHERE n.nspname = :schema
+                UNION ALL
+                SELECT 'r' || r.oid || ':' || r.xmin::text
+                FROM pg_catalog.pg_constraint r
+                JOIN pg_catalog.pg_namespace n ON n.oid = r.connamespace
+                WHERE n.nspname = :schema
+                UNION ALL
+                SELECT 'd' || d.objoid || ':' || d.objsubid || ':' ||
+                    d.xmin::text
+                FROM pg_catalog.pg_description d
+                JOIN pg_catalog.pg_class c ON c.oid = d.objoid
+                JOIN pg_catalog.pg_namespace n ON n.oid = c.relnamespace
+                WHERE d.classoid = 'pg_catalog.pg_class'::regclass
+                AND n.nspname = :schema
+                UNION ALL
+                SELECT 't' || t.oid || ':' || t.xmin::text
+                FROM pg_catalog.pg_type t
+                JOIN pg_catalog.pg_namespace n ON n.oid = t.typnamespace
+                WHERE t.typtype IN ('d', 'e') AND n.nspname = :schema
+                UNION ALL
+                SELECT 'e' || e.oid || ':' || e.xmin::text
+                FROM pg_catalog.pg_enum e
+                JOIN pg_catalog.pg_type t ON t.oid = e.enumtypid
+                JOIN pg_catalog.pg_namespace n ON n.oid = t.typnamespace
+                WHERE n.nspname = :schema
+            ) keys
+        """
+        return connection.execute(
+            sql.text(FINGERPRINT_SQL),
+            schema=schema if schema is not None
+            else self.default_schema_name).scalar()
+
     @reflection.cache
     def _get_foreign_table_names(self, connection, schema=None, **kw):
         result = connection.execute(
@@ -2418,6 +2513,19 @@ class PGDialect(default.DefaultDialect):
 
         table_oid = self.get_table_oid(connection, table_name, schema,
                                        info_cache=kw.get('info_cache'))
+        return self._get_columns(
+            connection, {table_name: table_oid}, schema)[table_name]
+
+    def get_multi_columns(
+            self, connection, schema=None, table_names=None, **kw):
+        table_oids = self._get_table_oids(
+            connection, schema, table_names, kw.get('info_cache'))
+        return self._get_columns(connection, table_oids, schema)
+
+    def _get_columns(self, connection, table_oids, schema):
+        if not table_oids:
+            return {}
+
         SQL_COLS = """
             SELECT a.attname,
               pg_catalog.format_type(a.atttypid, a.atttypmod),
@@ -2431,18 +2539,19 @@ class PGDialect(default.DefaultDialect):
             FROM pg_catalog.pg_attribute a
             LEFT JOIN pg_catalog.pg_description pgd ON (
                 pgd.objoid = a.attrelid AND pgd.objsubid = a.attnum)
-            WHERE a.attrelid = :table_oid
+            WHERE a.attrelid IN :table_oids
             AND a.attnum > 0 AND NOT a.attisdropped
             ORDER BY a.attnum
         """
         s = sql.text(SQL_COLS,
                      bindparams=[
-                         sql.bindparam('table_oid', type_=sqltypes.Integer)],
+                         sql.bindparam('table_oids', type_=sqltypes.Integer,
+                                       expanding=True)],
                      typemap={
                          'attname': sqltypes.Unicode,
                          'default': sqltypes.Unicode}
                      )
-        c = connection.execute(s, table_oid=table_oid)
+        c = connection.execute(s, table_oids=list(table_oids.values()))
         rows = c.fetchall()
         domains = self._load_domains(connection)
         enums = dict(
@@ -2453,14 +2562,17 @@ class PGDialect(default.DefaultDialect):
         )
 
         # format columns
-        columns = []
+        columns = dict((table_oid, []) for table_oid in table_oids.values())
         for name, format_type, default, notnull, attnum, table_oid, \
                 comment in rows:
             column_info = self._get_column_info(
                 name, format_type, default, notnull, domains, enums,
                 schema, comment)
-            columns.append(column_info)
-        return columns
+            columns[table_oid].append(column_info)
+        return dict(
+            (table_name, columns[table_oid])
+            for table_name, table_oid in table_oids.items()
+        )
 
     def _get_column_info(self, name, format_type, default,
                          notnull, domains, enums, schema, comment):
@@ -2582,17 +2694,29 @@ class PGDialect(default.DefaultDialect):
     def get_pk_constraint(self, connection, table_name, schema=None, **kw):
         table_oid = self.get_table_oid(connection, table_name, schema,
                                        info_cache=kw.get('info_cache'))
+        return self._get_pk_constraints(
+            connection, {table_name: table_oid})[table_name]
+
+    def get_multi_pk_constraint(
+            self, connection, schema=None, table_names=None, **kw):
+        table_oids = self._get_table_oids(
+            connection, schema, table_names, kw.get('info_cache'))
+        return self._get_pk_constraints(connection, table_oids)
+
+    def _get_pk_constraints(self, connection, table_oids):
+        if not table_oids:
+            return {}
 
         if self.server_version_info < (8, 4):
             PK_SQL = """
-                SELECT a.attname
+                SELECT a.attname, t.oid
                 FROM
                     pg_class t
                     join pg_index ix on t.oid = ix.indrelid
                     join pg_attribute a
                         on t.oid=a.attrelid AND %s
                  WHERE
-                  t.oid = :table_oid and ix.indisprimary = 't'
+                  t.oid IN :table_oids and ix.indisprimary = 't'
                 ORDER BY a.attnum
             """ % self._pg_index_any("a.attnum", "ix.indkey")
 
@@ -2600,48 +2724,81 @@ class PGDialect(default.DefaultDialect):
             # unnest() and generate_subscripts() both introduced in
             # version 8.4
             PK_SQL = """
-                SELECT a.attname
+                SELECT a.attname, k.indrelid
                 FROM pg_attribute a JOIN (
-                    SELECT unnest(ix.indkey) attnum,
+                    SELECT ix.indrelid,
+                           unnest(ix.indkey) attnum,
                            generate_subscripts(ix.indkey, 1) ord
                     FROM pg_index ix
-                    WHERE ix.indrelid = :table_oid AND ix.indisprimary
-                    ) k ON a.attnum=k.attnum
-                WHERE a.attrelid = :table_oid
+                    WHERE ix.indrelid IN :table_oids AND ix.indisprimary
+                    ) k ON a.attrelid=k.indrelid AND a.attnum=k.attnum
                 ORDER BY k.ord
             """
-        t = sql.text(PK_SQL, typemap={'attname': sqltypes.Unicode})
-        c = connection.execute(t, table_oid=table_oid)
-        cols = [r[0] for r in c.fetchall()]
+        oids_param = sql.bindparam(
+            'table_oids', type_=sqltypes.Integer, expanding=True)
+        table_oid_values = list(table_oids.values())
+
+        t = sql.text(PK_SQL, bindparams=[oids_param],
+                     typemap={'attname': sqltypes.Unicode})
+        c = connection.execute(t, table_oids=table_oid_values)
+        cols = dict((table_oid, []) for table_oid in table_oid_values)
+        for attname, table_oid in c.fetchall():
+            cols[table_oid].append(attname)
 
         PK_CONS_SQL = """
-        SELECT conname
+        SELECT conname, r.conrelid
            FROM  pg_catalog.pg_constraint r
-           WHERE r.conrelid = :table_oid AND r.contype = 'p'
+           WHERE r.conrelid IN :table_oids AND r.contype = 'p'
            ORDER BY 1
         """
-        t = sql.text(PK_CONS_SQL, typemap={'conname': sqltypes.Unicode})
-        c = connection.execute(t, table_oid=table_oid)
-        name = c.scalar()
-
-        return {'constrained_columns': cols, 'name': name}
+        t = sql.text(PK_CONS_SQL, bindparams=[oids_param],
+                     typemap={'conname': sqltypes.Unicode})
+        c = connection.execute(t, table_oids=table_oid_values)
+        names = {}
+        for conname, table_oid in c.fetchall():
+            names.setdefault(table_oid, conname)
+
+        return dict(
+            (table_name,
+             {'constrained_columns': cols[table_oid],
+              'name': names.get(table_oid)})
+            for table_name, table_oid in table_oids.items()
+        )
 
     @reflection.cache
     def get_foreign_keys(self, connection, table_name, schema=None,
                          postgresql_ignore_search_path=False, **kw):
-        preparer = self.identifier_preparer
         table_oid = self.get_table_oid(connection, table_name, schema,
                                        info_cache=kw.get('info_cache'))
+        return self._get_foreign_keys(
+            connection, {table_name: table_oid}, schema,
+            postgresql_ignore_search_path)[table_name]
+
+    def get_multi_foreign_keys(
+            self, connection, schema=None, table_names=None,
+            postgresql_ignore_search_path=False, **kw):
+        table_oids = self._get_table_oids(
+            connection, schema, table_names, kw.get('info_cache'))
+        return self._get_foreign_keys(
+            connection, table_oids, schema, postgresql_ignore_search_path)
+
+    def _get_foreign_keys(self, connection, table_oids, schema,
+                          postgresql_ignore_search_path):
+        if not table_oids:
+            return {}
+
+        preparer = self.identifier_preparer
 
         FK_SQL = """
           SELECT r.conname,
                 pg_catalog.pg_get_constraintdef(r.oid, true) as condef,
-                n.nspname as conschema
+                n.nspname as conschema,
+                r.conrelid
           FROM  pg_catalog.pg_constraint r,
                 pg_namespace n,
                 pg_class c
 
-          WHERE r.conrelid = :table AND
+          WHERE r.conrelid IN :table_oids AND
                 r.contype = 'f' AND
                 c.oid = confrelid AND
                 n.oid = c.relnamespace
@@ -2659,12 +2816,15 @@ class PGDialect(default.DefaultDialect):
             r'[\s]?(INITIALLY (DEFERRED|IMMEDIATE)+)?'
         )
 
-        t = sql.text(FK_SQL, typemap={
-            'conname': sqltypes.Unicode,
-            'condef': sqltypes.Unicode})
-        c = connection.execute(t, table=table_oid)
-        fkeys = []
-        for conname, condef, conschema in c.fetchall():
+        t = sql.text(FK_SQL, bindparams=[
+            sql.bindparam('table_oids', type_=sqltypes.Integer,
+                          expanding=True)],
+            typemap={
+                'conname': sqltypes.Unicode,
+                'condef': sqltypes.Unicode})
+        c = connection.execute(t, table_oids=list(table_oids.values()))
+        fkeys = dict((table_oid, []) for table_oid in table_oids.values())
+        for conname, condef, conschema, table_oid in c.fetchall():
             m = re.search(FK_REGEX, condef).groups()
 
             constrained_columns, referred_schema, \
@@ -2714,8 +2874,11 @@ class PGDialect(default.DefaultDialect):
                     'match': match
                 }
             }
-            fkeys.append(fkey_d)
-        return fkeys
+            fkeys[table_oid].append(fkey_d)
+        return dict(
+            (table_name, fkeys[table_oid])
+            for table_name, table_oid in table_oids.items()
+        )
 
     def _pg_index_any(self, col, compare_to):
         if self.server_version_info < (8, 1):
@@ -2736,6 +2899,18 @@ class PGDialect(default.DefaultDialect):
     def get_indexes(self, connection, table_name, schema, **kw):
         table_oid = self.get_table_oid(connection, table_name, schema,
                                        info_cache=kw.get('info_cache'))
+        return self._get_indexes(
+            connection, {table_name: table_oid})[table_name]
+
+    def get_multi_indexes(
+            self, connection, schema=None, table_names=None, **kw):
+        table_oids = self._get_table_oids(
+            connection, schema, table_names, kw.get('info_cache'))
+        return self._get_indexes(connection, table_oids)
+
+    def _get_indexes(self, connection, table_oids):
+        if not table_oids:
+            return {}
 
         # cast indkey as varchar since it's an int2vector,
         # returned as a list by some drivers such as pypostgresql
@@ -2746,7 +2921,7 @@ class PGDialect(default.DefaultDialect):
                   i.relname as relname,
                   ix.indisunique, ix.indexprs, ix.indpred,
                   a.attname, a.attnum, NULL, ix.indkey%s,
-                  %s, am.amname
+                  %s, am.amname, t.oid
               FROM
                   pg_class t
                         join pg_index ix on t.oid = ix.indrelid
@@ -2759,7 +2934,7 @@ class PGDialect(default.DefaultDialect):
                             on i.relam = am.oid
               WHERE
                   t.relkind IN ('r', 'v', 'f', 'm')
-                  and t.oid = :table_oid
+                  and t.oid IN :table_oids
                   and ix.indisprimary = 'f'
               ORDER BY
                   t.relname,
@@ -2779,7 +2954,7 @@ class PGDialect(default.DefaultDialect):
                   i.relname as relname,
                   ix.indisunique, ix.indexprs, ix.indpred,
                   a.attname, a.attnum, c.conrelid, ix.indkey::varchar,
-                  i.reloptions, am.amname
+                  i.reloptions, am.amname, t.oid
               FROM
                   pg_class t
                         join pg_index ix on t.oid = ix.indrelid
@@ -2797,24 +2972,28 @@ class PGDialect(default.DefaultDialect):
                             on i.relam = am.oid
               WHERE
                   t.relkind IN ('r', 'v', 'f', 'm')
-                  and t.oid = :table_oid
+                  and t.oid IN :table_oids
                   and ix.indisprimary = 'f'
               ORDER BY
                   t.relname,
                   i.relname
             """
 
-        t = sql.text(IDX_SQL, typemap={
-            'relname': sqltypes.Unicode,
-            'attname': sqltypes.Unicode})
-        c = connection.execute(t, table_oid=table_oid)
+        t = sql.text(IDX_SQL, bindparams=[
+            sql.bindparam('table_oids', type_=sqltypes.Integer,
+                          expanding=True)],
+            typemap={
+                'relname': sqltypes.Unicode,
+                'attname': sqltypes.Unicode})
+        c = connection.execute(t, table_oids=list(table_oids.values()))
 
-        indexes = defaultdict(lambda: defaultdict(dict))
+        indexes_by_table = defaultdict(
+            lambda: defaultdict(lambda: defaultdict(dict)))
 
         sv_idx_name = None
         for row in c.fetchall():
             (idx_name, unique, expr, prd, col,
-             col_num, conrelid, idx_key, options, amname) = row
+             col_num, conrelid, idx_key, options, amname, table_oid) = row
 
             if expr:
                 if idx_name != sv_idx_name:
@@ -2831,6 +3010,7 @@ class PGDialect(default.DefaultDialect):
                     % idx_name)
                 sv_idx_name = idx_name
 
+            indexes = indexes_by_table[table_oid]
             has_idx = idx_name in indexes
             index = indexes[idx_name]
             if col is not None:
@@ -2851,22 +3031,27 @@ class PGDialect(default.DefaultDialect):
                 if amname and amname != 'btree':
                     index['amname'] = amname
 
-        result = []
-        for name, idx in indexes.items():
-            entry = {
-                'name': name,
-                'unique': idx['unique'],
-                'column_names': [idx['cols'][i] for i in idx['key']]
-            }
-            if 'duplicates_constraint' in idx:
-                entry['duplicates_constraint'] = idx['duplicates_constraint']
-            if 'options' in idx:
-                entry.setdefault(
-                    'dialect_options', {})["postgresql_with"] = idx['options']
-            if 'amname' in idx:
-                entry.setdefault(
-                    'dialect_options', {})["postgresql_using"] = idx['amname']
-            result.append(entry)
+        result = {}
+        for table_name, table_oid in table_oids.items():
+            result[table_name] = table_result = []
+            for name, idx in indexes_by_table[table_oid].items():
+                entry = {
+                    'name': name,
+                    'unique': idx['unique'],
+                    'column_names': [idx['cols'][i] for i in idx['key']]
+                }
+                if 'duplicates_constraint' in idx:
+                    entry['duplicates_constraint'] = \
+                        idx['duplicates_constraint']
+                if 'options' in idx:
+                    entry.setdefault(
+                        'dialect_options', {})["postgresql_with"] = \
+                        idx['options']
+                if 'amname' in idx:
+                    entry.setdefault(
+                        'dialect_options', {})["postgresql_using"] = \
+                        idx['amname']
+                table_result.append(entry)
         return result
 
     @reflection.cache
@@ -2874,80 +3059,139 @@ class PGDialect(default.DefaultDialect):
                                schema=None, **kw):
         table_oid = self.get_table_oid(connection, table_name, schema,
                                        info_cache=kw.get('info_cache'))
+        return self._get_unique_constraints(
+            connection, {table_name: table_oid})[table_name]
+
+    def get_multi_unique_constraints(
+            self, connection, schema=None, table_names=None, **kw):
+        table_oids = self._get_table_oids(
+            connection, schema, table_names, kw.get('info_cache'))
+        return self._get_unique_constraints(connection, table_oids)
+
+    def _get_unique_constraints(self, connection, table_oids):
+        if not table_oids:
+            return {}
 
         UNIQUE_SQL = """
             SELECT
                 cons.conname as name,
                 cons.conkey as key,
                 a.attnum as col_num,
-                a.attname as col_name
+                a.attname as col_name,
+                cons.conrelid as table_oid
             FROM
                 pg_catalog.pg_constraint cons
                 join pg_attribute a
                   on cons.conrelid = a.attrelid AND
                     a.attnum = ANY(cons.conkey)
             WHERE
-                cons.conrelid = :table_oid AND
+                cons.conrelid IN :table_oids AND
                 cons.contype = 'u'
         """
 
-        t = sql.text(UNIQUE_SQL, typemap={'col_name': sqltypes.Unicode})
-        c = connection.execute(t, table_oid=table_oid)
+        t = sql.text(UNIQUE_SQL, bindparams=[
+            sql.bindparam('table_oids', type_=sqltypes.Integer,
+                          expanding=True)],
+            typemap={'col_name': sqltypes.Unicode})
+        c = connection.execute(t, table_oids=list(table_oids.values()))
 
-        uniques = defaultdict(lambda: defaultdict(dict))
+        uniques_by_table = defaultdict(
+            lambda: defaultdict(lambda: defaultdict(dict)))
         for row in c.fetchall():
-            uc = uniques[row.name]
+            uc = uniques_by_table[row.table_oid][row.name]
             uc["key"] = row.key
             uc["cols"][row.col_num] = row.col_name
 
-        return [
-            {'name': name,
-             'column_names': [uc["cols"][i] for i in uc["key"]]}
-            for name, uc in uniques.items()
-        ]
+        return dict(
+            (table_name, [
+                {'name': name,
+                 'column_names': [uc["cols"][i] for i in uc["key"]]}
+                for name, uc in uniques_by_table[table_oid].items()
+            ])
+            for table_name, table_oid in table_oids.items()
+        )
 
     @reflection.cache
     def get_table_comment(self, connection, table_name, schema=None, **kw):
         table_oid = self.get_table_oid(connection, table_name, schema,
                                        info_cache=kw.get('info_cache'))
+        return self._get_table_comments(
+            connection, {table_name: table_oid})[table_name]
+
+    def get_multi_table_comment(
+            self, connection, schema=None, table_names=None, **kw):
+        table_oids = self._get_table_oids(
+            connection, schema, table_names, kw.get('info_cache'))
+        return self._get_table_comments(connection, table_oids)
+
+    def _get_table_comments(self, connection, table_oids):
+        if not table_oids:
+            return {}
 
         COMMENT_SQL = """
             SELECT
-                pgd.description as table_comment
+                pgd.description as table_comment,
+                pgd.objoid as table_oid
             FROM
                 pg_catalog.pg_description pgd
             WHERE
                 pgd.objsubid = 0 AND
-                pgd.objoid = :table_oid
+                pgd.objoid IN :table_oids
         """
 
-        c = connection.execute(sql.text(COMMENT_SQL), table_oid=table_oid)
-        return {"text": c.scalar()}
+        t = sql.text(COMMENT_SQL, bindparams=[
+            sql.bindparam('table_oids', type_=sqltypes.Integer,
+                          expanding=True)])
+        c = connection.execute(t, table_oids=list(table_oids.values()))
+        comments = dict(
+            (table_oid, comment) for comment, table_oid in c.fetchall())
+        return dict(
+            (table_name, {"text": comments.get(table_oid)})
+            for table_name, table_oid in table_oids.items()
+        )
 
     @reflection.cache
     def get_check_constraints(
             self, connection, table_name, schema=None, **kw):
         table_oid = self.get_table_oid(connection, table_name, schema,
                                        info_cache=kw.get('info_cache'))
+        return self._get_check_constraints(
+            connection, {table_name: table_oid})[table_name]
+
+    def get_multi_check_constraints(
+            self, connection, schema=None, table_names=None, **kw):
+        table_oids = self._get_table_oids(
+            connection, schema, table_names, kw.get('info_cache'))
+        return self._get_check_constraints(connection, table_oids)
+
+    def _get_check_constraints(self, connection, table_oids):
+        if not table_oids:
+            return {}
 
         CHECK_SQL = """
             SELECT
                 cons.conname as name,
-                cons.consrc as src
+                cons.consrc as src,
+                cons.conrelid as table_oid
             FROM
                 pg_catalog.pg_constraint cons
             WHERE
-                cons.conrelid = :table_oid AND
+                cons.conrelid IN :table_oids AND
                 cons.contype = 'c'
         """
 
-        c = connection.execute(sql.text(CHECK_SQL), table_oid=table_oid)
-
-        return [
-            {'name': name,
-             'sqltext': src[1:-1]}
-            for name, src in c.fetchall()
-            ]
+        t = sql.text(CHECK_SQL, bindparams=[
+            sql.bindparam('table_oids', type_=sqltypes.Integer,
+                          expanding=True)])
+        c = connection.execute(t, table_oids=list(table_oids.values()))
+
+        checks = dict((table_oid, []) for table_oid in table_oids.values())
+        for name, src, table_oid in c.fetchall():
+            checks[table_oid].append({'name': name, 'sqltext': src[1:-1]})
+        return dict(
+            (table_name, checks[table_oid])
+            for table_name, table_oid in table_oids.items()
+        )
 
     def _load_enums(self, connection, schema=None):
         schema = schema or self.default_schema_name
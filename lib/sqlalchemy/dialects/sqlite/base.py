@@ -1042,6 +1042,9 @@ class SQLiteDialect(default.DefaultDialect):
     supports_cast = True
     supports_multivalues_insert = True
 
+    # SQLITE_MAX_VARIABLE_NUMBER, as compiled by default
+    max_bind_parameters = 999
+
     default_paramstyle = 'qmark'
     execution_ctx_cls = SQLiteExecutionContext
     statement_compiler = SQLiteCompiler
@@ -1162,6 +1165,15 @@ class SQLiteDialect(default.DefaultDialect):
         rs = connection.execute(s)
         return [row[0] for row in rs]
 
+    def get_schema_fingerprint(self, connection, schema=None, **kw):
+        # incremented by SQLite upon every change to the schema
+        if schema is not None:
+            qschema = self.identifier_preparer.quote_identifier(schema)
+            s = "PRAGMA %s.schema_version" % qschema
+        else:
+            s = "PRAGMA schema_version"
+        return connection.execute(s).scalar()
+
     @reflection.cache
     def get_temp_table_names(self, connection, **kw):
         s = "SELECT name FROM sqlite_temp_master "\
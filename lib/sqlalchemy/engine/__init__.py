@@ -382,6 +382,20 @@ def create_engine(*args, **kwargs):
         this is configurable with the MySQLDB connection itself and the
         server configuration as well).
 
+    :param pool_idle_timeout=None: when set to a number of seconds,
+        connections which have been idle in a
+        :class:`~sqlalchemy.pool.QueuePool` for longer than this period
+        are closed on a subsequent checkout, while the pool holds more than
+        ``pool_min_size`` connections.  See
+        :paramref:`.QueuePool.idle_timeout`.
+
+        .. versionadded:: 1.2
+
+    :param pool_min_size=0: the number of connections below which
+        ``pool_idle_timeout`` will not close idle connections.
+
+        .. versionadded:: 1.2
+
     :param pool_reset_on_return='rollback': set the "reset on return"
         behavior of the pool, which is whether ``rollback()``,
         ``commit()``, or nothing is called upon connections
@@ -394,6 +408,25 @@ def create_engine(*args, **kwargs):
         up on getting a connection from the pool. This is only used
         with :class:`~sqlalchemy.pool.QueuePool`.
 
+    :param pool_use_lifo=False: use LIFO (last-in-first-out) when retrieving
+        connections from :class:`.QueuePool` instead of FIFO
+        (first-in-first-out), so that the most recently used connections
+        are reused and the remainder may be allowed to time out, either
+        on the server or by using ``pool_idle_timeout``.
+
+        .. versionadded:: 1.2
+
+    :param query_cache_size=500: size of the cache used to store
+        compiled forms of SQL statements, available as
+        :attr:`.Engine.query_cache`.  The cache is used for all Core and ORM
+        statements executed by the :class:`.Engine`, unless the
+        :paramref:`.Connection.execution_options.compiled_cache` execution
+        option specifies otherwise.  When the number of entries exceeds the
+        given size by half, the least recently used entries are discarded.
+        Set to zero or ``None`` to disable the cache.
+
+        .. versionadded:: 1.2
+
     :param strategy='plain': selects alternate engine implementations.
         Currently available are:
 
@@ -214,6 +214,12 @@ class Connection(Connectable):
           The format of this dictionary is not guaranteed to stay the
           same in future releases.
 
+          By default, the :attr:`.Engine.query_cache` established by
+          the :paramref:`.create_engine.query_cache_size` parameter is used;
+          passing ``None`` disables caching for the connection.
+
+          .. versionchanged:: 1.2 a bounded cache is used by default.
+
           Note that the ORM makes use of its own "compiled" caches for
           some operations, including flush operations.  The caching
           used by the ORM internally supersedes a cache dictionary
@@ -297,6 +303,19 @@ class Connection(Connectable):
           of many DBAPIs.  The flag is currently understood only by the
           psycopg2, mysqldb and pymysql dialects.
 
+        :param fetch_array_size: Available on: Connection, statement.
+          An integer number of rows to be fetched from the database
+          per round trip, applied to the DBAPI cursor as
+          ``cursor.arraysize`` when the statement is executed.  This
+          is significant for cx_Oracle, where it overrides the
+          ``arraysize`` setting of the dialect, as well as for
+          results which are streamed using ``stream_results``, which
+          are then fetched in batches of this size.  Larger values reduce
+          round trips for queries that return many rows, while smaller
+          values reduce the memory used by queries that return few.
+
+          .. versionadded:: 1.2.0
+
         :param schema_translate_map: Available on: Connection, Engine.
           A dictionary mapping schema names to schema names, that will be
           applied to the :paramref:`.Table.schema` element of each
@@ -1023,13 +1042,28 @@ class Connection(Connectable):
             keys = []
 
         dialect = self.dialect
-        if 'compiled_cache' in self._execution_options:
+        compiled_cache = self._execution_options.get(
+            'compiled_cache', self.engine._query_cache)
+        if compiled_cache is not None:
             key = (
                 dialect, elem, tuple(sorted(keys)),
                 self.schema_for_object.hash_key,
                 len(distilled_params) > 1
             )
-            compiled_sql = self._execution_options['compiled_cache'].get(key)
+            compiled_sql = compiled_cache.get(key)
+            if compiled_sql is None:
+                # look for a statement of the same structure, which
+                # may be a distinct object with different bound values
+                cache_key = elem._generate_cache_key()
+                if cache_key is not None:
+                    structural_key = (dialect, cache_key[0]) + key[2:]
+                    entry = compiled_cache.get(structural_key)
+                    if entry is not None:
+                        compiled_sql, key_elements = entry
+                        if compiled_sql.statement is not elem:
+                            compiled_sql = compiled_sql._adapt_to_statement(
+                                elem, key_elements, cache_key[1])
+
             if compiled_sql is None:
                 compiled_sql = elem.compile(
                     dialect=dialect, column_keys=keys,
@@ -1037,7 +1071,12 @@ class Connection(Connectable):
                     schema_translate_map=self.schema_for_object
                     if not self.schema_for_object.is_default else None
                 )
-                self._execution_options['compiled_cache'][key] = compiled_sql
+                compiled_cache[key] = compiled_sql
+                if cache_key is not None and \
+                        compiled_sql._supports_structural_cache(
+                            cache_key[1]):
+                    compiled_cache[structural_key] = \
+                        compiled_sql, cache_key[1]
         else:
             compiled_sql = elem.compile(
                 dialect=dialect, column_keys=keys,
@@ -1743,6 +1782,7 @@ class Engine(Connectable, log.Identified):
     _execution_options = util.immutabledict()
     _has_events = False
     _connection_cls = Connection
+    _query_cache = None
 
     schema_for_object = schema._schema_getter(None)
     """Return the ".schema" attribute for an object.
@@ -1762,7 +1802,7 @@ class Engine(Connectable, log.Identified):
 
     def __init__(self, pool, dialect, url,
                  logging_name=None, echo=None, proxy=None,
-                 execution_options=None
+                 execution_options=None, query_cache_size=500
                  ):
         self.pool = pool
         self.url = url
@@ -1774,9 +1814,30 @@ class Engine(Connectable, log.Identified):
         log.instance_logger(self, echoflag=echo)
         if proxy:
             interfaces.ConnectionProxy._adapt_listener(self, proxy)
+        if query_cache_size:
+            self._query_cache = util.LRUCache(query_cache_size)
         if execution_options:
             self.update_execution_options(**execution_options)
 
+    @property
+    def query_cache(self):
+        """The default cache of compiled SQL statements used by this
+        :class:`.Engine`, or ``None`` if caching is disabled.
+
+        The cache is a :class:`.util.LRUCache` sized according to the
+        :paramref:`.create_engine.query_cache_size` parameter, and is used
+        for all statements unless the ``compiled_cache`` execution option
+        specifies otherwise.  Its ``hits``, ``misses`` and ``evictions``
+        attributes count lookups that located a compiled statement, lookups
+        that did not, and compiled statements removed to keep the cache
+        within its size, respectively.   A statement that is located by
+        structure rather than by identity counts both a miss and a hit.
+
+        .. versionadded:: 1.2
+
+        """
+        return self._query_cache
+
     def update_execution_options(self, **opt):
         r"""Update the default execution_options dictionary
         of this :class:`.Engine`.
@@ -2187,6 +2248,7 @@ class OptionEngine(Engine):
         log.instance_logger(self, echoflag=self.echo)
         self.dispatch = self.dispatch._join(proxied.dispatch)
         self._execution_options = proxied._execution_options
+        self._query_cache = proxied._query_cache
         self.update_execution_options(**execution_options)
 
     def _get_pool(self):
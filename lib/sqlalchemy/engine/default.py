@@ -15,7 +15,7 @@ as the base class for their own corresponding classes.
 
 import re
 import random
-from . import reflection, interfaces, result
+from . import interfaces, result
 from ..sql import compiler, expression, schema
 from .. import types as sqltypes
 from .. import exc, util, pool, processors
@@ -58,6 +58,8 @@ class DefaultDialect(interfaces.Dialect):
     preexecute_autoincrement_sequences = False
     postfetch_lastrowid = True
     implicit_returning = False
+    insert_executemany_returning = False
+    update_from_returning = False
 
     supports_right_nested_joins = True
 
@@ -75,6 +77,10 @@ class DefaultDialect(interfaces.Dialect):
         ('pool_size', util.asint),
         ('max_overflow', util.asint),
         ('pool_threadlocal', util.asbool),
+        ('pool_use_lifo', util.asbool),
+        ('pool_idle_timeout', util.asint),
+        ('pool_min_size', util.asint),
+        ('query_cache_size', util.asint),
     ])
 
     # if the NUMERIC type
@@ -106,6 +112,10 @@ class DefaultDialect(interfaces.Dialect):
     # thanks to MySQL, sigh
     max_index_name_length = None
 
+    # maximum number of bound parameters
+    # in a single statement, if any
+    max_bind_parameters = None
+
     supports_sane_rowcount = True
     supports_sane_multi_rowcount = True
     dbapi_type_map = {}
@@ -379,8 +389,10 @@ class DefaultDialect(interfaces.Dialect):
         """
         return sqltypes.adapt_type(typeobj, self.colspecs)
 
+    @util.dependencies("sqlalchemy.engine.reflection")
     def reflecttable(
-            self, connection, table, include_columns, exclude_columns, **opts):
+            self, reflection, connection, table, include_columns,
+            exclude_columns, **opts):
         insp = reflection.Inspector.from_engine(connection)
         return insp.reflecttable(
             table, include_columns, exclude_columns, **opts)
@@ -396,6 +408,60 @@ class DefaultDialect(interfaces.Dialect):
                                   schema=schema, **kw)
         }
 
+    def get_multi_columns(
+            self, connection, schema=None, table_names=None, **kw):
+        return self._default_multi_reflect(
+            self.get_columns, connection, schema, table_names, kw)
+
+    def get_multi_pk_constraint(
+            self, connection, schema=None, table_names=None, **kw):
+        return self._default_multi_reflect(
+            self.get_pk_constraint, connection, schema, table_names, kw)
+
+    def get_multi_foreign_keys(
+            self, connection, schema=None, table_names=None, **kw):
+        return self._default_multi_reflect(
+            self.get_foreign_keys, connection, schema, table_names, kw)
+
+    def get_multi_indexes(
+            self, connection, schema=None, table_names=None, **kw):
+        return self._default_multi_reflect(
+            self.get_indexes, connection, schema, table_names, kw)
+
+    def get_multi_unique_constraints(
+            self, connection, schema=None, table_names=None, **kw):
+        return self._default_multi_reflect(
+            self.get_unique_constraints, connection, schema, table_names, kw)
+
+    def get_multi_check_constraints(
+            self, connection, schema=None, table_names=None, **kw):
+        return self._default_multi_reflect(
+            self.get_check_constraints, connection, schema, table_names, kw)
+
+    def get_multi_table_comment(
+            self, connection, schema=None, table_names=None, **kw):
+        return self._default_multi_reflect(
+            self.get_table_comment, connection, schema, table_names, kw)
+
+    def _default_multi_reflect(
+            self, single_fn, connection, schema, table_names, kw):
+        """Compatibility method, adapts a per-table reflection method
+        to the get_multi_xyz() form for those dialects which don't
+        implement it.
+
+        """
+        if table_names is None:
+            table_names = self.get_table_names(
+                connection, schema, info_cache=kw.get('info_cache'))
+        result = {}
+        for table_name in table_names:
+            try:
+                result[table_name] = single_fn(
+                    connection, table_name, schema, **kw)
+            except exc.NoSuchTableError:
+                pass
+        return result
+
     def validate_identifier(self, ident):
         if len(ident) > self.max_identifier_length:
             raise exc.IdentifierError(
@@ -943,14 +1009,38 @@ class DefaultExecutionContext(interfaces.ExecutionContext):
     def create_cursor(self):
         if self._use_server_side_cursor():
             self._is_server_side = True
-            return self.create_server_side_cursor()
+            cursor = self.create_server_side_cursor()
         else:
             self._is_server_side = False
-            return self._dbapi_connection.cursor()
+            cursor = self._dbapi_connection.cursor()
+
+        fetch_array_size = self.fetch_array_size
+        if fetch_array_size is not None:
+            self.set_fetch_array_size(cursor, fetch_array_size)
+        return cursor
 
     def create_server_side_cursor(self):
         raise NotImplementedError()
 
+    @property
+    def fetch_array_size(self):
+        """The ``fetch_array_size`` execution option in effect for
+        this execution, or None."""
+
+        return self.execution_options.get('fetch_array_size', None)
+
+    def set_fetch_array_size(self, cursor, size):
+        """Apply the ``fetch_array_size`` execution option to a newly
+        created DBAPI cursor.
+
+        The default implementation sets the DBAPI ``cursor.arraysize``
+        attribute, which is the number of rows ``cursor.fetchmany()``
+        fetches when no size is given.  Dialects override this to set
+        other driver-specific prefetch settings.
+
+        """
+        cursor.arraysize = size
+
     def pre_exec(self):
         pass
 
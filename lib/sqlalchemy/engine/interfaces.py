@@ -7,7 +7,7 @@
 
 """Define core interfaces used by the engine system."""
 
-from .. import util
+from .. import util, inspection
 
 # backwards compat
 from ..sql.compiler import Compiled, TypeCompiler
@@ -80,6 +80,10 @@ class Dialect(object):
     max_identifier_length
       The maximum length of identifier names.
 
+    max_bind_parameters
+      The maximum number of bound parameters which may be passed along
+      with a single statement, or ``None`` if there's no practical limit.
+
     supports_unicode_statements
       Indicate whether the DB-API can receive SQL statements as Python
       unicode strings
@@ -441,6 +445,134 @@ class Dialect(object):
 
         raise NotImplementedError()
 
+    def get_multi_columns(
+            self, connection, schema=None, table_names=None, **kw):
+        """Return information about columns in many tables at once.
+
+        Given a :class:`.Connection`, an optional string `schema` and an
+        optional list of string `table_names`, return a dictionary
+        mapping each table name to a list of column dictionaries as
+        returned by :meth:`.Dialect.get_columns`.  When `table_names` is
+        None, all tables in `schema` are returned.  Names which are not
+        present in the database may be omitted from the result.
+
+        The implementation in :class:`.DefaultDialect` calls
+        :meth:`.Dialect.get_columns` for each table; dialects may
+        override it to fetch the catalog for all tables in a fixed
+        number of queries.
+
+        .. versionadded:: 1.2
+
+        """
+
+        raise NotImplementedError()
+
+    def get_multi_pk_constraint(
+            self, connection, schema=None, table_names=None, **kw):
+        """Return information about primary key constraints in many
+        tables at once.
+
+        Returns a dictionary mapping each table name to a dictionary
+        as returned by :meth:`.Dialect.get_pk_constraint`; see
+        :meth:`.Dialect.get_multi_columns` for the arguments.
+
+        .. versionadded:: 1.2
+
+        """
+
+        raise NotImplementedError()
+
+    def get_multi_foreign_keys(
+            self, connection, schema=None, table_names=None, **kw):
+        """Return information about foreign keys in many tables at once.
+
+        Returns a dictionary mapping each table name to a list as
+        returned by :meth:`.Dialect.get_foreign_keys`; see
+        :meth:`.Dialect.get_multi_columns` for the arguments.
+
+        .. versionadded:: 1.2
+
+        """
+
+        raise NotImplementedError()
+
+    def get_multi_indexes(
+            self, connection, schema=None, table_names=None, **kw):
+        """Return information about indexes in many tables at once.
+
+        Returns a dictionary mapping each table name to a list as
+        returned by :meth:`.Dialect.get_indexes`; see
+        :meth:`.Dialect.get_multi_columns` for the arguments.
+
+        .. versionadded:: 1.2
+
+        """
+
+        raise NotImplementedError()
+
+    def get_multi_unique_constraints(
+            self, connection, schema=None, table_names=None, **kw):
+        """Return information about unique constraints in many tables
+        at once.
+
+        Returns a dictionary mapping each table name to a list as
+        returned by :meth:`.Dialect.get_unique_constraints`; see
+        :meth:`.Dialect.get_multi_columns` for the arguments.
+
+        .. versionadded:: 1.2
+
+        """
+
+        raise NotImplementedError()
+
+    def get_multi_check_constraints(
+            self, connection, schema=None, table_names=None, **kw):
+        """Return information about check constraints in many tables
+        at once.
+
+        Returns a dictionary mapping each table name to a list as
+        returned by :meth:`.Dialect.get_check_constraints`; see
+        :meth:`.Dialect.get_multi_columns` for the arguments.
+
+        .. versionadded:: 1.2
+
+        """
+
+        raise NotImplementedError()
+
+    def get_multi_table_comment(
+            self, connection, schema=None, table_names=None, **kw):
+        """Return the "comment" for many tables at once.
+
+        Returns a dictionary mapping each table name to a dictionary as
+        returned by :meth:`.Dialect.get_table_comment`; see
+        :meth:`.Dialect.get_multi_columns` for the arguments.
+
+        .. versionadded:: 1.2
+
+        """
+
+        raise NotImplementedError()
+
+    def get_schema_fingerprint(self, connection, schema=None, **kw):
+        """Return a value which identifies the current state of the
+        tables in `schema`.
+
+        The value should change whenever a table, column, constraint or
+        index in the schema is created, altered or dropped, and should be
+        cheap to fetch compared to reflecting the schema.  It is used by
+        :class:`~sqlalchemy.engine.reflection.ReflectionCache` to detect
+        whether previously reflected information is still current.
+
+        Raises ``NotImplementedError`` for dialects that don't support
+        fingerprints.
+
+        .. versionadded:: 1.2
+
+        """
+
+        raise NotImplementedError()
+
     def normalize_name(self, name):
         """convert the given name to lowercase if it is detected as
         case insensitive.
@@ -1168,6 +1300,12 @@ class Connectable(object):
         raise NotImplementedError()
 
 
+@inspection._inspects(Connectable)
+@util.dependencies("sqlalchemy.engine.reflection")
+def _inspect_connectable(reflection, bind):
+    return reflection.Inspector.from_engine(bind)
+
+
 class ExceptionContext(object):
     """Encapsulate information about an error condition in progress.
 
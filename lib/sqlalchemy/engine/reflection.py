@@ -31,8 +31,10 @@ from .. import util
 from ..sql.type_api import TypeEngine
 from ..util import deprecated
 from ..util import topological
-from .. import inspection
-from .base import Connectable
+from ..util import pickle
+import os
+import tempfile
+import sqlalchemy
 
 
 @util.decorator
@@ -40,15 +42,7 @@ def cache(fn, self, con, *args, **kw):
     info_cache = kw.get('info_cache', None)
     if info_cache is None:
         return fn(self, con, *args, **kw)
-    key = (
-        fn.__name__,
-        tuple(a for a in args if isinstance(a, util.string_types)),
-        tuple((k, v) for k, v in kw.items() if
-              isinstance(v,
-                         util.string_types + util.int_types + (float, )
-                         )
-              )
-    )
+    key = _cache_key(fn.__name__, args, kw)
     ret = info_cache.get(key)
     if ret is None:
         ret = fn(self, con, *args, **kw)
@@ -56,6 +50,19 @@ def cache(fn, self, con, *args, **kw):
     return ret
 
 
+def _cache_key(fn_name, args, kw):
+    return (
+        fn_name,
+        tuple(a for a in args if isinstance(a, util.string_types)),
+        tuple(sorted(
+            (k, v) for k, v in kw.items() if
+            isinstance(v,
+                       util.string_types + util.int_types + (float, )
+                       )
+        ))
+    )
+
+
 class Inspector(object):
     """Performs database schema inspection.
 
@@ -134,10 +141,6 @@ class Inspector(object):
             return bind.dialect.inspector(bind)
         return Inspector(bind)
 
-    @inspection._inspects(Connectable)
-    def _insp(bind):
-        return Inspector.from_engine(bind)
-
     @property
     def default_schema_name(self):
         """Return the default schema name presented by the dialect
@@ -364,9 +367,12 @@ class Inspector(object):
 
         """
 
-        col_defs = self.dialect.get_columns(self.bind, table_name, schema,
-                                            info_cache=self.info_cache,
-                                            **kw)
+        col_defs = self._get_prefetched(
+            'get_multi_columns', table_name, schema, kw)
+        if col_defs is None:
+            col_defs = self.dialect.get_columns(self.bind, table_name, schema,
+                                                info_cache=self.info_cache,
+                                                **kw)
         for col_def in col_defs:
             # make this easy and only return instances for coltype
             coltype = col_def['type']
@@ -407,6 +413,10 @@ class Inspector(object):
          use :class:`.quoted_name`.
 
         """
+        pk_cons = self._get_prefetched(
+            'get_multi_pk_constraint', table_name, schema, kw)
+        if pk_cons is not None:
+            return pk_cons
         return self.dialect.get_pk_constraint(self.bind, table_name, schema,
                                               info_cache=self.info_cache,
                                               **kw)
@@ -442,6 +452,10 @@ class Inspector(object):
 
         """
 
+        fkeys = self._get_prefetched(
+            'get_multi_foreign_keys', table_name, schema, kw)
+        if fkeys is not None:
+            return fkeys
         return self.dialect.get_foreign_keys(self.bind, table_name, schema,
                                              info_cache=self.info_cache,
                                              **kw)
@@ -476,6 +490,10 @@ class Inspector(object):
 
         """
 
+        indexes = self._get_prefetched(
+            'get_multi_indexes', table_name, schema, kw)
+        if indexes is not None:
+            return indexes
         return self.dialect.get_indexes(self.bind, table_name,
                                         schema,
                                         info_cache=self.info_cache, **kw)
@@ -503,6 +521,10 @@ class Inspector(object):
 
         """
 
+        constraints = self._get_prefetched(
+            'get_multi_unique_constraints', table_name, schema, kw)
+        if constraints is not None:
+            return constraints
         return self.dialect.get_unique_constraints(
             self.bind, table_name, schema, info_cache=self.info_cache, **kw)
 
@@ -522,6 +544,10 @@ class Inspector(object):
 
         """
 
+        comment = self._get_prefetched(
+            'get_multi_table_comment', table_name, schema, kw)
+        if comment is not None:
+            return comment
         return self.dialect.get_table_comment(
             self.bind, table_name, schema, info_cache=self.info_cache,
             **kw)
@@ -549,9 +575,189 @@ class Inspector(object):
 
         """
 
+        constraints = self._get_prefetched(
+            'get_multi_check_constraints', table_name, schema, kw)
+        if constraints is not None:
+            return constraints
         return self.dialect.get_check_constraints(
             self.bind, table_name, schema, info_cache=self.info_cache, **kw)
 
+    def get_multi_columns(self, schema=None, table_names=None, **kw):
+        """Return information about columns in many tables at once.
+
+        Given an optional string `schema` and an optional list of string
+        `table_names`, return a dictionary mapping each table name to a
+        list of column dictionaries, as returned by
+        :meth:`.Inspector.get_columns`.  If `table_names` is omitted, all
+        tables in the schema are returned.  Names of tables which don't
+        exist may be omitted from the result.
+
+        Dialects such as PostgreSQL fetch this information for all
+        tables in a fixed number of catalog queries, rather than
+        querying once per table.  The result is also stored in this
+        :class:`.Inspector`, so that subsequent per-table calls such as
+        :meth:`.Inspector.get_columns` for the same tables don't query
+        the database again.  :meth:`.MetaData.reflect` makes use of
+        these methods automatically.
+
+        .. versionadded:: 1.2
+
+        .. seealso::
+
+            :meth:`.Inspector.get_multi_pk_constraint`
+
+            :meth:`.Inspector.get_multi_foreign_keys`
+
+            :meth:`.Inspector.get_multi_indexes`
+
+            :meth:`.Inspector.get_multi_unique_constraints`
+
+            :meth:`.Inspector.get_multi_check_constraints`
+
+            :meth:`.Inspector.get_multi_table_comment`
+
+        """
+        result = self._get_multi(
+            'get_multi_columns', schema, table_names, kw)
+        for col_defs in result.values():
+            for col_def in col_defs:
+                coltype = col_def['type']
+                if not isinstance(coltype, TypeEngine):
+                    col_def['type'] = coltype()
+        return result
+
+    def get_multi_pk_constraint(self, schema=None, table_names=None, **kw):
+        """Return information about primary key constraints in many
+        tables at once.
+
+        Returns a dictionary mapping each table name to a dictionary as
+        returned by :meth:`.Inspector.get_pk_constraint`; see
+        :meth:`.Inspector.get_multi_columns` for details.
+
+        .. versionadded:: 1.2
+
+        """
+        return self._get_multi(
+            'get_multi_pk_constraint', schema, table_names, kw)
+
+    def get_multi_foreign_keys(self, schema=None, table_names=None, **kw):
+        """Return information about foreign keys in many tables at once.
+
+        Returns a dictionary mapping each table name to a list as
+        returned by :meth:`.Inspector.get_foreign_keys`; see
+        :meth:`.Inspector.get_multi_columns` for details.
+
+        .. versionadded:: 1.2
+
+        """
+        return self._get_multi(
+            'get_multi_foreign_keys', schema, table_names, kw)
+
+    def get_multi_indexes(self, schema=None, table_names=None, **kw):
+        """Return information about indexes in many tables at once.
+
+        Returns a dictionary mapping each table name to a list as
+        returned by :meth:`.Inspector.get_indexes`; see
+        :meth:`.Inspector.get_multi_columns` for details.
+
+        .. versionadded:: 1.2
+
+        """
+        return self._get_multi(
+            'get_multi_indexes', schema, table_names, kw)
+
+    def get_multi_unique_constraints(
+            self, schema=None, table_names=None, **kw):
+        """Return information about unique constraints in many tables
+        at once.
+
+        Returns a dictionary mapping each table name to a list as
+        returned by :meth:`.Inspector.get_unique_constraints`; see
+        :meth:`.Inspector.get_multi_columns` for details.
+
+        .. versionadded:: 1.2
+
+        """
+        return self._get_multi(
+            'get_multi_unique_constraints', schema, table_names, kw)
+
+    def get_multi_check_constraints(
+            self, schema=None, table_names=None, **kw):
+        """Return information about check constraints in many tables
+        at once.
+
+        Returns a dictionary mapping each table name to a list as
+        returned by :meth:`.Inspector.get_check_constraints`; see
+        :meth:`.Inspector.get_multi_columns` for details.
+
+        .. versionadded:: 1.2
+
+        """
+        return self._get_multi(
+            'get_multi_check_constraints', schema, table_names, kw)
+
+    def get_multi_table_comment(self, schema=None, table_names=None, **kw):
+        """Return information about the comments of many tables at once.
+
+        Returns a dictionary mapping each table name to a dictionary as
+        returned by :meth:`.Inspector.get_table_comment`; see
+        :meth:`.Inspector.get_multi_columns` for details.
+
+        .. versionadded:: 1.2
+
+        """
+        return self._get_multi(
+            'get_multi_table_comment', schema, table_names, kw)
+
+    def _get_multi(self, fn_name, schema, table_names, kw):
+        if table_names is not None:
+            keys = [
+                (table_name, _cache_key(fn_name, (table_name, schema), kw))
+                for table_name in table_names
+            ]
+            if all(key in self.info_cache for table_name, key in keys):
+                # everything requested was fetched already
+                return dict(
+                    (table_name, self.info_cache[key])
+                    for table_name, key in keys
+                )
+
+        result = getattr(self.dialect, fn_name)(
+            self.bind, schema, table_names, info_cache=self.info_cache, **kw)
+
+        # store per-table entries, consulted by the per-table methods
+        for table_name, value in result.items():
+            self.info_cache[
+                _cache_key(fn_name, (table_name, schema), kw)] = value
+        return result
+
+    def _get_prefetched(self, fn_name, table_name, schema, kw):
+        return self.info_cache.get(
+            _cache_key(fn_name, (table_name, schema), kw))
+
+    def _prefetch_reflection(self, schema, table_names, dialect_kwargs):
+        """Fetch what :meth:`.Inspector.reflecttable` needs for the
+        given tables ahead of time, using the get_multi_xyz() methods.
+
+        The keyword arguments match those which reflecttable() passes
+        to each method for a :class:`.Table` with the given dialect
+        keyword arguments.
+
+        """
+        self.get_multi_columns(schema, table_names, **dialect_kwargs)
+        self.get_multi_pk_constraint(schema, table_names, **dialect_kwargs)
+        self.get_multi_foreign_keys(schema, table_names, **dialect_kwargs)
+        self.get_multi_indexes(schema, table_names)
+        for fn in (
+                self.get_multi_unique_constraints,
+                self.get_multi_check_constraints,
+                self.get_multi_table_comment):
+            try:
+                fn(schema, table_names)
+            except NotImplementedError:
+                # optional dialect feature
+                pass
+
     def reflecttable(self, table, include_columns, exclude_columns=(),
                      _extend_on=None):
         """Given a Table object, load its internal constructs based on
@@ -748,6 +954,7 @@ class Inspector(object):
                                 autoload=True, schema=referred_schema,
                                 autoload_with=self.bind,
                                 _extend_on=_extend_on,
+                                _reflect_inspector=self,
                                 **reflection_options
                                 )
                 for column in referred_columns:
@@ -758,6 +965,7 @@ class Inspector(object):
                                 autoload_with=self.bind,
                                 schema=sa_schema.BLANK_SCHEMA,
                                 _extend_on=_extend_on,
+                                _reflect_inspector=self,
                                 **reflection_options
                                 )
                 for column in referred_columns:
@@ -874,3 +1082,124 @@ class Inspector(object):
             return
         else:
             table.comment = comment_dict.get('text', None)
+
+
+class ReflectionCache(object):
+    """A file-based cache of database schema information, used by
+    :meth:`.MetaData.reflect` so that the database catalog need not be
+    queried each time an application starts.
+
+    E.g.::
+
+        from sqlalchemy.engine.reflection import ReflectionCache
+
+        cache = ReflectionCache("/var/cache/myapp/reflection.cache")
+
+        metadata = MetaData()
+        metadata.reflect(engine, reflection_cache=cache)
+
+    The file stores the information fetched by the :class:`.Inspector`
+    used by :meth:`.MetaData.reflect`, keyed on the database URL, with the
+    password omitted, and the schema name.  Along with it is stored a
+    "fingerprint" of the schema, which is fetched from the database each
+    time the cache is used; when it doesn't match, the stored information
+    is discarded and the schema is reflected from the database, after
+    which the file is updated.  Information for tables not yet in the file
+    is likewise fetched from the database and added to the file.
+
+    The fingerprint is produced by the
+    :meth:`.Dialect.get_schema_fingerprint` method, which is implemented by
+    the SQLite and PostgreSQL dialects.  On PostgreSQL, it covers the
+    tables, views, sequences, columns, constraints, indexes and comments
+    within the schema, as well as the enumerated types and domains
+    defined in it; a change to a type defined in another schema, which a
+    column of this schema refers to, isn't detected.  For other
+    databases, or to use a different means of detecting schema changes
+    such as a migration version number, pass a callable as
+    :paramref:`.ReflectionCache.fingerprint`.
+
+    The file is written with ``pickle``; a file written by a different
+    version of SQLAlchemy is ignored.  As with any pickle, the file
+    should not be writable by untrusted parties.
+
+    :param path: path of the cache file, which is created or replaced
+     when information is stored.
+
+    :param fingerprint: optional callable which is passed a
+     :class:`.Connection` and a schema name, which may be None for the
+     default schema, and returns a picklable value that changes whenever
+     the schema changes.
+
+    .. versionadded:: 1.2
+
+    """
+
+    format_version = 1
+
+    def __init__(self, path, fingerprint=None):
+        self.path = path
+        self.fingerprint = fingerprint
+
+    def _load(self, connection, schema):
+        """Return the current fingerprint and the stored info_cache for
+        the given schema, which is empty if the fingerprint doesn't match.
+
+        """
+        if self.fingerprint is not None:
+            fingerprint = self.fingerprint(connection, schema)
+        else:
+            fingerprint = connection.dialect.get_schema_fingerprint(
+                connection, schema)
+
+        entry = self._read().get(self._key(connection, schema))
+        if entry is not None and entry[0] == fingerprint:
+            return fingerprint, entry[1]
+        else:
+            return fingerprint, {}
+
+    def _store(self, connection, schema, fingerprint, info_cache):
+        entries = self._read()
+        entries[self._key(connection, schema)] = (fingerprint, info_cache)
+        self._write(entries)
+
+    def _key(self, connection, schema):
+        return repr(connection.engine.url), schema
+
+    @property
+    def _version(self):
+        return self.format_version, sqlalchemy.__version__
+
+    def _read(self):
+        if not os.path.exists(self.path):
+            return {}
+        try:
+            with open(self.path, 'rb') as file_:
+                version, entries = pickle.load(file_)
+        except Exception as err:
+            # a damaged cache file is no different from a missing one
+            util.warn(
+                "Ignoring unreadable reflection cache %s: %s" %
+                (self.path, err))
+            return {}
+        if version != self._version:
+            return {}
+        return entries
+
+    def _write(self, entries):
+        # write to a new file which then replaces the cache file, so that
+        # concurrent readers never see a partially written file
+        tmp_path = None
+        try:
+            fd, tmp_path = tempfile.mkstemp(
+                dir=os.path.dirname(os.path.abspath(self.path)),
+                prefix=".reflection-")
+            with os.fdopen(fd, 'wb') as file_:
+                pickle.dump(
+                    (self._version, entries), file_,
+                    pickle.HIGHEST_PROTOCOL)
+            getattr(os, 'replace', os.rename)(tmp_path, self.path)
+        except (IOError, OSError, pickle.PicklingError, TypeError) as err:
+            util.warn(
+                "Could not write reflection cache %s: %s" % (self.path, err))
+            if tmp_path is not None and os.path.exists(tmp_path):
+                os.remove(tmp_path)
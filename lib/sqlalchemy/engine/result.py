@@ -672,7 +672,9 @@ class ResultProxy(object):
         cursor_description = self._cursor_description()
         if cursor_description is not None:
             if self.context.compiled and \
-                    'compiled_cache' in self.context.execution_options:
+                    self.context.execution_options.get(
+                        'compiled_cache',
+                        self.context.engine._query_cache) is not None:
                 if self.context.compiled._cached_metadata:
                     self._metadata = self.context.compiled._cached_metadata
                 else:
@@ -1153,6 +1155,78 @@ class ResultProxy(object):
                 e, None, None,
                 self.cursor, self.context)
 
+    def fetch_columns(self, size=None, numpy=False):
+        """Fetch many rows, returning them as a list of columns.
+
+        Rows are fetched as with :meth:`.ResultProxy.fetchmany`, or
+        :meth:`.ResultProxy.fetchall` if ``size`` is None, however
+        rather than producing a row object for each row, the values are
+        delivered as one sequence per column, in the order given by
+        :meth:`.ResultProxy.keys`.   Result processing for each column
+        type is applied once per column over the whole batch::
+
+            result = conn.execute(select([table.c.id, table.c.data]))
+            while True:
+                ids, data = result.fetch_columns(10000)
+                if not ids:
+                    break
+
+        When all rows have been exhausted, each column is empty.
+
+        :param size: the maximum number of rows to fetch; defaults to
+          all remaining rows.
+
+        :param numpy: if True, each column is returned as a
+          ``numpy.ndarray`` rather than a list.  Requires that NumPy is
+          installed.
+
+        .. versionadded:: 1.2.0
+
+        """
+
+        if self._metadata is None:
+            return self._non_result(None)
+
+        if numpy:
+            import numpy as np
+
+        try:
+            rows = self._fetch_column_rows(size)
+            metadata = self._metadata
+            if rows:
+                columns = zip(*rows)
+            else:
+                columns = [() for key in metadata.keys]
+
+            l = []
+            for processor, column in zip(metadata._processors, columns):
+                if processor is not None:
+                    column = [processor(value) for value in column]
+                else:
+                    column = list(column)
+                if numpy:
+                    column = np.array(column)
+                l.append(column)
+            return l
+        except BaseException as e:
+            self.connection._handle_dbapi_exception(
+                e, None, None,
+                self.cursor, self.context)
+
+    def _fetch_column_rows(self, size):
+        if size is None:
+            rows = self._fetchall_impl()
+            self._soft_close()
+        else:
+            rows = self._fetchmany_impl(size)
+            if len(rows) == 0:
+                self._soft_close()
+        if self._echo:
+            log = self.context.engine.logger.debug
+            for row in rows:
+                log("Row %r", sql_util._repr_row(row))
+        return rows
+
     def fetchone(self):
         """Fetch one row, just like DB-API ``cursor.fetchone()``.
 
@@ -1248,8 +1322,15 @@ class BufferedRowResultProxy(ResultProxy):
                 stream_results=True, max_row_buffer=50
                 ).execute("select * from table")
 
+    When the ``fetch_array_size`` execution option is present, rows are
+    instead fetched in batches of exactly that size, starting with the
+    first.
+
     .. versionadded:: 1.0.6 Added the ``max_row_buffer`` option.
 
+    .. versionadded:: 1.2.0 ``fetch_array_size`` is used as a fixed
+       buffer size.
+
     .. seealso::
 
         :ref:`psycopg2_execution_options`
@@ -1258,6 +1339,11 @@ class BufferedRowResultProxy(ResultProxy):
     def _init_metadata(self):
         self._max_row_buffer = self.context.execution_options.get(
             'max_row_buffer', None)
+        fetch_array_size = self.context.execution_options.get(
+            'fetch_array_size', None)
+        if fetch_array_size is not None:
+            self._bufsize = fetch_array_size
+            self.size_growth = {}
         self.__buffer_rows()
         super(BufferedRowResultProxy, self)._init_metadata()
 
@@ -1410,6 +1496,14 @@ class BufferedColumnResultProxy(ResultProxy):
                 keymap[k] = (None, obj, index)
             metadata._keymap = keymap
 
+    def _fetch_column_rows(self, size):
+        # processors have been applied to each row already;
+        # the metadata carries None processors.
+        if size is None:
+            return self.fetchall()
+        else:
+            return self.fetchmany(size)
+
     def fetchall(self):
         # can't call cursor.fetchall(), since rows must be
         # fully processed before requesting more from the DBAPI.
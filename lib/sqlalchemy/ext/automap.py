@@ -700,7 +700,8 @@ class AutomapBase(object):
             collection_class=list,
             name_for_scalar_relationship=name_for_scalar_relationship,
             name_for_collection_relationship=name_for_collection_relationship,
-            generate_relationship=generate_relationship):
+            generate_relationship=generate_relationship,
+            reflection_cache=None):
         """Extract mapped classes and relationships from the :class:`.MetaData` and
         perform mappings.
 
@@ -744,13 +745,22 @@ class AutomapBase(object):
 
          .. versionadded:: 1.1
 
+        :param reflection_cache: When present in conjunction with the
+         :paramref:`.AutomapBase.prepare.reflect` flag, a
+         :class:`~sqlalchemy.engine.reflection.ReflectionCache` which is
+         passed to :meth:`.MetaData.reflect`, so that the database catalog
+         isn't queried while the schema is unchanged.
+
+         .. versionadded:: 1.2
+
         """
         if reflect:
             cls.metadata.reflect(
                 engine,
                 schema=schema,
                 extend_existing=True,
-                autoload_replace=False
+                autoload_replace=False,
+                reflection_cache=reflection_cache
             )
 
         table_to_map_config = dict(
@@ -263,9 +263,24 @@ class Result(object):
         return str(self._as_query())
 
     def __iter__(self):
+        if self.bq._spoiled:
+            return iter(self._as_query())
+
+        query, context = self._query_context()
+        return query._execute_and_instances(context)
+
+    def _query_context(self):
+        """Return the :class:`.Query` and :class:`.QueryContext` which
+        iteration would execute, without executing them."""
+
         bq = self.bq
         if bq._spoiled:
-            return iter(self._as_query())
+            query = self._as_query()
+            context = query._compile_context()
+            context.statement.use_labels = True
+            if query._autoflush and not query._populate_existing:
+                self.session._autoflush()
+            return query, context
 
         baked_context = bq._bakery.get(bq._cache_key, None)
         if baked_context is None:
@@ -281,7 +296,7 @@ class Result(object):
         if context.autoflush and not context.populate_existing:
             self.session._autoflush()
         return context.query.params(self._params).\
-            with_session(self.session)._execute_and_instances(context)
+            with_session(self.session), context
 
     def count(self):
         """return the 'count'.
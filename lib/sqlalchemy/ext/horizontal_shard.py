@@ -15,9 +15,14 @@ the source distribution.
 
 """
 
+import collections
+import heapq
+import sys
+
 from .. import util
+from ..util import queue as sqla_queue
 from ..orm.session import Session
-from ..orm.query import Query
+from ..orm.query import Query, QueryContext
 
 __all__ = ['ShardedSession', 'ShardedQuery']
 
@@ -27,7 +32,10 @@ class ShardedQuery(Query):
         super(ShardedQuery, self).__init__(*args, **kwargs)
         self.id_chooser = self.session.id_chooser
         self.query_chooser = self.session.query_chooser
+        self.shard_executor = self.session.shard_executor
         self._shard_id = None
+        self._merge_key = None
+        self._merge_reverse = False
 
     def set_shard(self, shard_id):
         """return a new query, limited to a single shard ID.
@@ -40,26 +48,179 @@ class ShardedQuery(Query):
         q._shard_id = shard_id
         return q
 
+    def merge_by(self, key, reverse=False):
+        """return a new query which merges the results of multiple
+        shards into a single ordering.
+
+        Each shard's results are assumed to already be in the order
+        given by ``key``, which is typically the case when the query
+        has an ORDER BY that corresponds to it; the results of all shards
+        are then combined using a k-way merge rather than being
+        concatenated::
+
+            q = sess.query(WeatherLocation).\\
+                order_by(WeatherLocation.city).\\
+                merge_by(lambda loc: loc.city)
+
+        :param key: a callable which, passed a single result row or
+          entity, returns the value to be compared.
+
+        :param reverse: if True, the results are merged in descending
+          order, corresponding to an ORDER BY that uses ``DESC``.
+
+        When used with :meth:`.Query.yield_per`, the results of all shards
+        are streamed and merged as they are consumed, with each shard's
+        cursor remaining open until the merge is complete.
+
+        .. versionadded:: 1.2.0
+
+        """
+
+        q = self._clone()
+        q._merge_key = key
+        q._merge_reverse = reverse
+        return q
+
     def _execute_and_instances(self, context):
-        def iter_for_shard(shard_id):
-            context.attributes['shard_id'] = shard_id
-            result = self._connection_from_session(
+        def execute_for_shard(shard_id):
+            return self._connection_from_session(
                 mapper=self._mapper_zero(),
                 shard_id=shard_id).execute(
                 context.statement,
                 self._params)
+
+        def iter_for_shard(shard_id, result):
+            context.attributes['shard_id'] = shard_id
             return self.instances(result, context)
 
         if self._shard_id is not None:
-            return iter_for_shard(self._shard_id)
+            return iter_for_shard(
+                self._shard_id, execute_for_shard(self._shard_id))
+
+        shard_ids = self.query_chooser(self)
+        if self.shard_executor is not None and len(shard_ids) > 1:
+            results = self._execute_shards_in_parallel(
+                context, shard_ids, buffered=not self._yield_per)
         else:
-            partial = []
-            for shard_id in self.query_chooser(self):
-                partial.extend(iter_for_shard(shard_id))
+            results = (
+                (shard_id, execute_for_shard(shard_id))
+                for shard_id in shard_ids
+            )
+
+        if self._yield_per:
+            return self._stream_shards(context, results)
+
+        # each shard is loaded as its result arrives
+        try:
+            if self._merge_key is not None:
+                return _merge_ordered(
+                    [list(iter_for_shard(shard_id, result))
+                     for shard_id, result in results],
+                    self._merge_key, self._merge_reverse)
+            else:
+                partial = []
+                for shard_id, result in results:
+                    partial.extend(iter_for_shard(shard_id, result))
+                return iter(partial)
+        finally:
+            results.close()
+
+    def _stream_shards(self, context, results):
+        """Return an iterator which loads rows from each shard's result
+        as it is consumed, in chunks of ``yield_per`` rows.
+
+        When merging, each shard's rows are loaded against its own copy
+        of the :class:`.QueryContext`, as the loads of all shards are
+        interleaved.
+
+        """
+        if self._merge_key is not None:
+            return _merge_ordered(
+                [self.instances(result, _shard_context(context, shard_id))
+                 for shard_id, result in results],
+                self._merge_key, self._merge_reverse)
+        else:
+            return self._iter_shards(context, results)
+
+    def _iter_shards(self, context, results):
+        for shard_id, result in results:
+            context.attributes['shard_id'] = shard_id
+            for row in self.instances(result, context):
+                yield row
+
+    def _execute_shards_in_parallel(self, context, shard_ids, buffered):
+        """Execute the statement against each shard using the
+        shard executor, yielding ``(shard_id, result)`` tuples as the
+        shards complete.
+
+        Connections are procured from the Session up front, so that the
+        worker threads don't interact with the Session itself.  Shards
+        which share a DBAPI connection are run one after the other within
+        a single task.  If ``buffered`` is True, each result is fully
+        fetched within the worker thread; otherwise rows are left to be
+        fetched as they are loaded.  The results of each task are yielded
+        as soon as it completes, so that they are loaded while other tasks
+        are still running; loading may emit further SQL, which takes place
+        only on connections whose task has completed.
+
+        If a task fails, or the results aren't consumed in full, the
+        tasks which were submitted are waited for and their results
+        closed, so that no connection is still in use by a worker.
 
-            # if some kind of in memory 'sorting'
-            # were done, this is where it would happen
-            return iter(partial)
+        """
+        groups = util.OrderedDict()
+        for shard_id in shard_ids:
+            conn = self._connection_from_session(
+                mapper=self._mapper_zero(),
+                shard_id=shard_id)
+            groups.setdefault(
+                id(conn.connection.connection), []).append((shard_id, conn))
+
+        completed = sqla_queue.Queue()
+
+        def run_group(group):
+            try:
+                results = []
+                for shard_id, conn in group:
+                    result = conn.execute(context.statement, self._params)
+                    if buffered:
+                        result = _BufferedShardResult(result)
+                    results.append((shard_id, result))
+                completed.put((results, None))
+            except Exception:
+                completed.put(((), sys.exc_info()))
+
+        pending = 0
+        exc_info = None
+        try:
+            for group in groups.values():
+                self.shard_executor.submit(run_group, group)
+                pending += 1
+        except Exception:
+            exc_info = sys.exc_info()
+
+        try:
+            while pending:
+                group_results, err = completed.get()
+                pending -= 1
+                if err is not None and exc_info is None:
+                    exc_info = err
+                if exc_info is not None:
+                    for shard_id, result in group_results:
+                        result.close()
+                else:
+                    for shard_result in group_results:
+                        yield shard_result
+        finally:
+            # the results were abandoned by the caller
+            while pending:
+                group_results, err = completed.get()
+                pending -= 1
+                for shard_id, result in group_results:
+                    result.close()
+
+        if exc_info is not None:
+            util.reraise(*exc_info)
 
     def get(self, ident, **kwargs):
         if self._shard_id is not None:
@@ -74,9 +235,91 @@ class ShardedQuery(Query):
                 return None
 
 
+class _BufferedShardResult(object):
+    """Proxies a :class:`.ResultProxy` whose rows have been fetched
+    in full by a worker thread of the shard executor."""
+
+    def __init__(self, result):
+        self._result = result
+        self._rows = collections.deque(result.fetchall())
+
+    def __getattr__(self, key):
+        return getattr(self._result, key)
+
+    def fetchall(self):
+        rows = list(self._rows)
+        self._rows.clear()
+        return rows
+
+    def fetchmany(self, size):
+        rows = self._rows
+        return [rows.popleft() for i in range(min(size, len(rows)))]
+
+    def close(self):
+        self._rows.clear()
+        self._result.close()
+
+
+def _shard_context(context, shard_id):
+    """Return a copy of a :class:`.QueryContext` with its own
+    ``attributes`` dictionary, targeted at the given shard."""
+
+    copy = QueryContext.__new__(QueryContext)
+    for key in QueryContext.__slots__:
+        if hasattr(context, key):
+            setattr(copy, key, getattr(context, key))
+    copy.attributes = dict(context.attributes)
+    copy.attributes['shard_id'] = shard_id
+    return copy
+
+
+class _Descending(object):
+    __slots__ = ('value', )
+
+    def __init__(self, value):
+        self.value = value
+
+    def __lt__(self, other):
+        return other.value < self.value
+
+    def __eq__(self, other):
+        return self.value == other.value
+
+
+def _merge_ordered(iterables, key, reverse):
+    """Merge already-sorted iterables into a single iterator, in the
+    style of ``heapq.merge()`` with the addition of ``key`` and
+    ``reverse``."""
+
+    if reverse:
+        def keyfn(item):
+            return _Descending(key(item))
+    else:
+        keyfn = key
+
+    heap = []
+    for idx, iterable in enumerate(iterables):
+        iterator = iter(iterable)
+        for item in iterator:
+            heap.append([keyfn(item), idx, item, iterator])
+            break
+    heapq.heapify(heap)
+
+    while heap:
+        entry = heap[0]
+        yield entry[2]
+        for item in entry[3]:
+            entry[0] = keyfn(item)
+            entry[2] = item
+            heapq.heapreplace(heap, entry)
+            break
+        else:
+            heapq.heappop(heap)
+
+
 class ShardedSession(Session):
     def __init__(self, shard_chooser, id_chooser, query_chooser, shards=None,
-                 query_cls=ShardedQuery, **kwargs):
+                 query_cls=ShardedQuery, shard_executor=None, **kwargs):
         """Construct a ShardedSession.
 
         :param shard_chooser: A callable which, passed a Mapper, a mapped
@@ -97,11 +340,30 @@ class ShardedSession(Session):
         :param shards: A dictionary of string shard names
           to :class:`~sqlalchemy.engine.Engine` objects.
 
+        :param shard_executor: An object with a ``submit()`` method, such
+          as a ``concurrent.futures.ThreadPoolExecutor``, which will be used
+          to execute a query against all shards returned by ``query_chooser``
+          at the same time, rather than one after the other.  Each shard
+          is executed on its own connection and its rows are fetched in
+          full by the worker; each shard's rows are then loaded as soon
+          as it completes, while other shards are still executing, and
+          are combined in the order in which the shards complete.  When
+          :meth:`.ShardedQuery.merge_by` is used, the loaded rows of all
+          shards are merged once the last shard is loaded.
+          When :meth:`.Query.yield_per` is used, workers only execute the
+          statement, and rows are fetched as the results are consumed.
+          The DBAPI connections in use must be usable from a thread other
+          than the one which created them, e.g. ``check_same_thread=False``
+          for pysqlite.
+
+          .. versionadded:: 1.2.0
+
         """
         super(ShardedSession, self).__init__(query_cls=query_cls, **kwargs)
         self.shard_chooser = shard_chooser
         self.id_chooser = id_chooser
         self.query_chooser = query_chooser
+        self.shard_executor = shard_executor
         self.__binds = {}
         self.connection_callable = self.connection
         if shards is not None:
@@ -20,6 +20,7 @@ from .mapper import (
     class_mapper,
     configure_mappers,
     reconstructor,
+    set_lazy_configure,
     validates
 )
 from .interfaces import (
@@ -65,6 +66,12 @@ from .scoping import (
 )
 from . import mapper as mapperlib
 from .query import AliasOption, Query, Bundle
+from .query_cache import (
+    QueryCache,
+    CacheBackend,
+    MemoryCacheBackend,
+    ClientCacheBackend
+)
 from ..util.langhelpers import public_factory
 from .. import util as _sa_util
 from . import strategies as _strategies
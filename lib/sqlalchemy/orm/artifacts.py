@@ -0,0 +1,320 @@
+# orm/artifacts.py
+# Copyright (C) 2005-2017 the SQLAlchemy authors and contributors
+# <see AUTHORS file>
+#
+# This module is part of SQLAlchemy and is released under
+# the MIT License: http://www.opensource.org/licenses/mit-license.php
+
+"""Export of the state derived as mappers are configured and used, so that
+it can be loaded by other processes rather than derived again.
+
+"""
+
+import os
+import tempfile
+
+import sqlalchemy
+from .dependency import DependencyProcessor
+from .interfaces import MapperProperty
+from .mapper import Mapper, _mapper_registry, configure_mappers
+from .relationships import RelationshipProperty
+from .. import schema, util
+from ..sql import expression
+from ..sql.annotation import Annotated
+from ..util import pickle, byte_buffer
+
+
+__all__ = ['ArtifactCache']
+
+
+class ArtifactCache(object):
+    """A file containing state derived from the configured mappers, which
+    is loaded by each process of an application in place of deriving it
+    again.
+
+    E.g., in a build step, once all mapped classes have been imported and
+    any representative use of the mappings, such as a test run, is
+    complete::
+
+        from sqlalchemy.orm.artifacts import ArtifactCache
+
+        ArtifactCache("/var/cache/myapp/mappers.cache").dump()
+
+    Then in each process, after all mapped classes have been imported and
+    before the mappers are used::
+
+        ArtifactCache("/var/cache/myapp/mappers.cache").load()
+
+    The file stores, for each :func:`.relationship`, the join condition
+    determined from the foreign keys and other arguments of the
+    relationship, along with the clauses used by its lazy loader, as well
+    as the order of operations established by the unit of work for each
+    combination of mappers which the exporting process has flushed.
+    Mapped classes are referred to by module and class name, and tables
+    and columns by name, so that the loaded state refers to the objects of
+    the loading process.
+
+    Each relationship also stores the arguments from which its join
+    condition was derived; when they don't match those present in the
+    loading process, the stored state for that relationship is not used.
+    Other state, such as compiled SQL statements, is not stored, as it
+    depends on the :class:`.Engine` in use.
+
+    The file is written with ``pickle``; a file written by a different
+    version of SQLAlchemy is ignored.  As with any pickle, the file
+    should not be writable by untrusted parties.
+
+    :param path: path of the file, which is created or replaced by
+     :meth:`.ArtifactCache.dump`.
+
+    .. versionadded:: 1.2
+
+    """
+
+    format_version = 1
+
+    def __init__(self, path):
+        self.path = path
+
+    def dump(self):
+        """Write the state of all configured mappers to the file,
+        configuring pending mappers first."""
+
+        configure_mappers()
+
+        refs = _References()
+        relationships = {}
+        flush_sorts = {}
+        for mapper, mapper_ref in refs.mappers.items():
+            entries = {}
+            for prop in mapper._props.values():
+                if isinstance(prop, RelationshipProperty) and \
+                        prop.parent is mapper and \
+                        prop._join_condition_inputs is not None:
+                    data = refs.dumps(prop._get_artifact())
+                    if data is not None:
+                        entries[prop.key] = data
+            if entries:
+                relationships[mapper_ref] = entries
+
+            # a flush involving several base mappers stores its ordering
+            # with each of them; it's written once
+            if mapper.base_mapper is mapper and \
+                    '_flush_sort_cache' in mapper.__dict__:
+                cache = mapper._flush_sort_cache
+                for key in list(cache):
+                    if key not in flush_sorts:
+                        flush_sorts[key] = (cache.get(key), [])
+                    flush_sorts[key][1].append(mapper_ref)
+
+        flush_sort_entries = []
+        for key, (value, mapper_refs) in flush_sorts.items():
+            data = refs.dumps((key, value))
+            if data is not None:
+                flush_sort_entries.append((tuple(mapper_refs), data))
+
+        self._write({
+            'relationships': relationships,
+            'flush_sorts': flush_sort_entries
+        })
+
+    def load(self):
+        """Make the state stored in the file available to the mappers
+        of this process.
+
+        The state for each relationship is used when the relationship is
+        first configured, and the flush orderings when the unit of work
+        first needs them.  Returns False if the file is missing,
+        unreadable or written by a different version of SQLAlchemy.
+
+        """
+
+        entries = self._read()
+        if entries is None:
+            return False
+
+        refs = _References()
+        by_ref = refs.mappers_by_ref
+        for mapper_ref, data in entries['relationships'].items():
+            mapper = by_ref.get(mapper_ref)
+            if mapper is not None:
+                mapper._relationship_artifacts = dict(
+                    (key, util.partial(refs.loads, value))
+                    for key, value in data.items())
+
+        loaders = {}
+        for mapper_refs, data in entries['flush_sorts']:
+            load_artifact = refs.memoized_loader(data)
+            for mapper_ref in mapper_refs:
+                loaders.setdefault(mapper_ref, []).append(load_artifact)
+        for mapper_ref, mapper_loaders in loaders.items():
+            mapper = by_ref.get(mapper_ref)
+            if mapper is not None:
+                mapper._flush_sort_artifacts = util.partial(
+                    _load_all, mapper_loaders)
+        return True
+
+    @property
+    def _version(self):
+        return self.format_version, sqlalchemy.__version__
+
+    def _read(self):
+        if not os.path.exists(self.path):
+            return None
+        try:
+            with open(self.path, 'rb') as file_:
+                version, entries = pickle.load(file_)
+        except Exception as err:
+            util.warn(
+                "Ignoring unreadable artifact cache %s: %s" %
+                (self.path, err))
+            return None
+        if version != self._version:
+            return None
+        return entries
+
+    def _write(self, entries):
+        # write to a new file which then replaces the cache file, so that
+        # concurrent readers never see a partially written file
+        tmp_path = None
+        try:
+            fd, tmp_path = tempfile.mkstemp(
+                dir=os.path.dirname(os.path.abspath(self.path)),
+                prefix=".artifacts-")
+            with os.fdopen(fd, 'wb') as file_:
+                pickle.dump(
+                    (self._version, entries), file_,
+                    pickle.HIGHEST_PROTOCOL)
+            getattr(os, 'replace', os.rename)(tmp_path, self.path)
+        except (IOError, OSError) as err:
+            util.warn(
+                "Could not write artifact cache %s: %s" % (self.path, err))
+            if tmp_path is not None and os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+
+class _Unresolvable(Exception):
+    """Raised for an object which can't be referred to by name."""
+
+
+class _References(object):
+    """Pickle and unpickle individual artifacts, referring to mappers,
+    dependency processors, tables and columns by name."""
+
+    def __init__(self):
+        self.mappers = {}
+        seen = {}
+        metadatas = set()
+        for mapper in list(_mapper_registry):
+            if mapper.non_primary:
+                continue
+            ref = (mapper.class_.__module__, mapper.class_.__name__)
+            seen.setdefault(ref, []).append(mapper)
+            for table in mapper.tables:
+                if isinstance(table, schema.Table):
+                    metadatas.add(table.metadata)
+
+        # classes which can't be told apart by name are left out
+        self.mappers_by_ref = {}
+        for ref, mappers in seen.items():
+            if len(mappers) == 1:
+                self.mappers[mappers[0]] = ref
+                self.mappers_by_ref[ref] = mappers[0]
+
+        self.tables = {}
+        ambiguous = set()
+        for metadata in metadatas:
+            for key, table in metadata.tables.items():
+                if key in self.tables:
+                    ambiguous.add(key)
+                self.tables[key] = table
+        for key in ambiguous:
+            del self.tables[key]
+
+    def _persistent_id(self, obj):
+        if isinstance(obj, Annotated):
+            # pickled as the annotations along with the element, which
+            # is then referred to by name
+            return None
+        elif isinstance(obj, Mapper):
+            if obj not in self.mappers:
+                raise _Unresolvable(obj)
+            return ('mapper', ) + self.mappers[obj]
+        elif isinstance(obj, DependencyProcessor):
+            return ('dependency', self._persistent_id(obj.parent), obj.key)
+        elif isinstance(obj, schema.Table):
+            if self.tables.get(obj.key) is not obj:
+                raise _Unresolvable(obj)
+            return ('table', obj.key)
+        elif isinstance(obj, schema.Column):
+            table = obj.table
+            if not isinstance(table, schema.Table) or \
+                    obj.key not in table.c or table.c[obj.key] is not obj:
+                raise _Unresolvable(obj)
+            return ('column', self._persistent_id(table), obj.key)
+        elif isinstance(obj, (MapperProperty, schema.SchemaItem,
+                              expression.FromClause)):
+            # other objects which must not be copied
+            raise _Unresolvable(obj)
+        else:
+            return None
+
+    def _persistent_load(self, pid):
+        type_ = pid[0]
+        if type_ == 'mapper':
+            if pid[1:] in self.mappers_by_ref:
+                return self.mappers_by_ref[pid[1:]]
+        elif type_ == 'dependency':
+            prop = self._persistent_load(pid[1])._props.get(pid[2])
+            if prop is not None and prop._dependency_processor is not None:
+                return prop._dependency_processor
+        elif type_ == 'table':
+            if pid[1] in self.tables:
+                return self.tables[pid[1]]
+        elif type_ == 'column':
+            table = self._persistent_load(pid[1])
+            if pid[2] in table.c:
+                return table.c[pid[2]]
+        raise _Unresolvable(pid)
+
+    def dumps(self, obj):
+        """Pickle the given object, or return None if it refers to objects
+        which can't be referred to by name."""
+
+        buf = byte_buffer()
+        pickler = pickle.Pickler(buf, pickle.HIGHEST_PROTOCOL)
+        pickler.persistent_id = self._persistent_id
+        try:
+            pickler.dump(obj)
+        except (_Unresolvable, pickle.PicklingError, TypeError,
+                AttributeError):
+            return None
+        return buf.getvalue()
+
+    def loads(self, data):
+        """Unpickle the given data, or return None if the objects it
+        refers to aren't present."""
+
+        unpickler = pickle.Unpickler(byte_buffer(data))
+        unpickler.persistent_load = self._persistent_load
+        try:
+            return unpickler.load()
+        except Exception:
+            # the objects referred to have changed since the
+            # artifact was written
+            return None
+
+    def memoized_loader(self, data):
+        """Return a callable which unpickles the given data once."""
+
+        loaded = []
+
+        def load():
+            if not loaded:
+                loaded.append(self.loads(data))
+            return loaded[0]
+        return load
+
+
+def _load_all(loaders):
+    return [obj for obj in (load() for load in loaders) if obj is not None]
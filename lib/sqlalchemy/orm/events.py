@@ -736,7 +736,9 @@ class MapperEvents(event.Events):
         application, but is actually called any time new mappers
         are to be affected by a :func:`.orm.configure_mappers`
         call.   If new mappings are constructed after existing ones have
-        already been used, this event will likely be called again.  To ensure
+        already been used, this event will likely be called again.  When
+        lazy configuration is enabled via :func:`.orm.set_lazy_configure`,
+        the event is called for each group of mappers configured.  To ensure
         that a particular event is only called once and no further, the
         ``once=True`` argument (new in 0.9.4) can be applied::
 
@@ -791,7 +793,9 @@ class MapperEvents(event.Events):
         application, but is actually called any time new mappers
         have been affected by a :func:`.orm.configure_mappers`
         call.   If new mappings are constructed after existing ones have
-        already been used, this event will likely be called again.  To ensure
+        already been used, this event will likely be called again.  When
+        lazy configuration is enabled via :func:`.orm.set_lazy_configure`,
+        the event is called for each group of mappers configured.  To ensure
         that a particular event is only called once and no further, the
         ``once=True`` argument (new in 0.9.4) can be applied::
 
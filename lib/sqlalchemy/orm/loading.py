@@ -14,9 +14,10 @@ as well as some of the attribute loading strategies.
 """
 from __future__ import absolute_import
 
+import weakref
 from .. import util
 from . import attributes, exc as orm_exc
-from ..sql import util as sql_util
+from ..sql import util as sql_util, expression
 from . import strategy_options
 from . import path_registry
 
@@ -231,6 +232,91 @@ def load_on_ident(query, key,
         return None
 
 
+def load_on_idents(query, keys, chunksize=500):
+    """Load the given identity keys from the database, emitting one
+    SELECT per ``chunksize`` keys.
+
+    Returns a dictionary of the given identity keys to instances, which
+    omits those keys for which no row was present.  Keys whose values
+    aren't of the Python type of the primary key columns, such as
+    strings given for an integer primary key, are matched to the loaded
+    rows by their values as coerced to that type.
+
+    """
+    mapper = query._mapper_zero()
+    pk_cols = mapper.primary_key
+
+    q = query._clone()
+    q._get_condition()
+    q._order_by = None
+
+    if query._for_update_arg is not None:
+        q._for_update_arg = query._for_update_arg
+        version_check = True
+    else:
+        version_check = False
+    q._get_options(version_check=version_check)
+
+    if len(pk_cols) == 1:
+        q._criterion = q._adapt_clause(
+            pk_cols[0].in_(
+                expression.bindparam('primary_keys', expanding=True)),
+            True, False)
+
+    result = {}
+    idents = [key[1] for key in keys]
+    while idents:
+        chunk = idents[0:chunksize]
+        idents = idents[chunksize:]
+
+        if len(pk_cols) == 1:
+            chunk_q = q.params(primary_keys=[ident[0] for ident in chunk])
+        else:
+            # "tuple IN" isn't available on all backends; use
+            # OR / AND for composite primary keys
+            chunk_q = q._clone()
+            chunk_q._criterion = chunk_q._adapt_clause(
+                expression.or_(*[
+                    expression.and_(*[
+                        col == value for col, value in zip(pk_cols, ident)
+                    ])
+                    for ident in chunk
+                ]),
+                True, False)
+
+        for instance in chunk_q:
+            result[attributes.instance_state(instance).key] = instance
+
+    for key in keys:
+        if key not in result:
+            loaded_key = mapper.identity_key_from_primary_key(
+                _coerce_ident(pk_cols, key[1]))
+            if loaded_key in result:
+                result[key] = result[loaded_key]
+    return result
+
+
+def _coerce_ident(pk_cols, ident):
+    """Coerce the values of a primary key identifier to the Python types
+    of the primary key columns, where they are known."""
+
+    coerced = []
+    for col, value in zip(pk_cols, ident):
+        try:
+            python_type = col.type.python_type
+        except NotImplementedError:
+            pass
+        else:
+            if value is not None and not isinstance(value, python_type):
+                try:
+                    value = python_type(value)
+                except Exception:
+                    # not convertible; the value is matched as given
+                    pass
+        coerced.append(value)
+    return coerced
+
+
 def _setup_entity_query(
     context, mapper, query_entity,
         path, adapter, column_collection,
@@ -339,12 +425,19 @@ def _instance_processor(
     load_path = context.query._current_path + path \
         if context.query._current_path.path else path
 
-    session_identity_map = context.session.identity_map
+    readonly = context.readonly
+    if readonly:
+        # instances are not associated with the Session; a dictionary
+        # local to the QueryContext takes the place of the identity map
+        session_identity_map = context.readonly_identities
+    else:
+        session_identity_map = context.session.identity_map
 
     populate_existing = context.populate_existing or mapper.always_refresh
     load_evt = bool(mapper.class_manager.dispatch.load)
     refresh_evt = bool(mapper.class_manager.dispatch.refresh)
-    persistent_evt = bool(context.session.dispatch.loaded_as_persistent)
+    persistent_evt = not readonly and \
+        bool(context.session.dispatch.loaded_as_persistent)
     if persistent_evt:
         loaded_as_persistent = context.session.dispatch.loaded_as_persistent
     instance_state = attributes.instance_state
@@ -421,9 +514,16 @@ def _instance_processor(
                 state = instance_state(instance)
                 state.key = identitykey
 
-                # attach instance to session.
-                state.session_id = session_id
-                session_identity_map._add_unpresent(state, identitykey)
+                if readonly:
+                    # not being in an identity map, the state needs no
+                    # cleanup when the instance is garbage collected;
+                    # a plain weakref avoids a reference cycle
+                    state.obj = weakref.ref(instance)
+                    session_identity_map[identitykey] = instance
+                else:
+                    # attach instance to session.
+                    state.session_id = session_id
+                    session_identity_map._add_unpresent(state, identitykey)
 
         # populate.  this looks at whether this state is new
         # for this load or was existing, and whether or not this
@@ -457,7 +557,9 @@ def _instance_processor(
                     if refresh_state and only_load_props:
                         state._commit(dict_, only_load_props)
                     else:
-                        state._commit_all(dict_, session_identity_map)
+                        state._commit_all(
+                            dict_,
+                            None if readonly else session_identity_map)
 
             if post_load:
                 post_load.add_state(state, True)
@@ -16,6 +16,8 @@ available in :class:`~sqlalchemy.orm.`.
 """
 from __future__ import absolute_import
 
+import logging
+import time
 import types
 import weakref
 from itertools import chain
@@ -38,6 +40,14 @@ import sys
 _mapper_registry = weakref.WeakKeyDictionary()
 _already_compiling = False
 
+# when True, mappers are configured in groups as they are first used;
+# see set_lazy_configure()
+_lazy_configure = False
+
+# incremented each time a new mapper is constructed, so that mappers
+# configured lazily know when to re-check their neighbors
+_configure_generation = 0
+
 _memoized_configured_property = util.group_expirable_memoized_property()
 
 
@@ -87,6 +97,12 @@ class Mapper(InspectionAttr):
 
     _new_mappers = False
 
+    _configured_generation = None
+
+    # loaders for state exported by ArtifactCache
+    _relationship_artifacts = None
+    _flush_sort_artifacts = None
+
     def __init__(self,
                  class_,
                  local_table=None,
@@ -665,6 +681,7 @@ class Mapper(InspectionAttr):
         # prevent this mapper from being constructed
         # while a configure_mappers() is occurring (and defer a
         # configure_mappers() until construction succeeds)
+        global _configure_generation
         _CONFIGURE_MUTEX.acquire()
         try:
             self.dispatch._events._new_mapper_instance(class_, self)
@@ -676,6 +693,7 @@ class Mapper(InspectionAttr):
             self._configure_polymorphic_setter()
             self._configure_pks()
             Mapper._new_mappers = True
+            _configure_generation += 1
             self._log("constructed")
             self._expire_memoizations()
         finally:
@@ -1221,6 +1239,22 @@ class Mapper(InspectionAttr):
         """
         configure_mappers()
 
+    def _check_configure(self):
+        """Configure pending mappers before this mapper is used.
+
+        Normally calls upon :func:`.configure_mappers`; when lazy
+        configuration is enabled via :func:`.set_lazy_configure`, only
+        those pending mappers which are linked to this one are configured.
+
+        """
+        if not Mapper._new_mappers:
+            return
+        if not _lazy_configure:
+            configure_mappers()
+        elif not self.configured or \
+                self._configured_generation != _configure_generation:
+            _configure_mappers(self)
+
     def dispose(self):
         # Disable any attribute-based compilation.
         self.configured = True
@@ -1747,13 +1781,16 @@ class Mapper(InspectionAttr):
                 "columns get mapped." %
                 (key, self, column.key, prop))
 
-    def _post_configure_properties(self):
+    def _post_configure_properties(self, _timings=None):
         """Call the ``init()`` method on all ``MapperProperties``
         attached to this mapper.
 
         This is a deferred configuration step which is intended
         to execute once all mappers have been constructed.
 
+        If a list is passed as ``_timings``, a ``(seconds, prop)`` tuple
+        is appended to it for each property initialized.
+
         """
 
         self._log("_post_configure_properties() started")
@@ -1762,7 +1799,12 @@ class Mapper(InspectionAttr):
             self._log("initialize prop %s", key)
 
             if prop.parent is self and not prop._configure_started:
-                prop.init()
+                if _timings is not None:
+                    start = time.time()
+                    prop.init()
+                    _timings.append((time.time() - start, prop))
+                else:
+                    prop.init()
 
             if prop._configure_finished:
                 prop.post_instrument_class(self)
@@ -1852,8 +1894,8 @@ class Mapper(InspectionAttr):
         """return a MapperProperty associated with the given key.
         """
 
-        if _configure_mappers and Mapper._new_mappers:
-            configure_mappers()
+        if _configure_mappers:
+            self._check_configure()
 
         try:
             return self._props[key]
@@ -1870,8 +1912,7 @@ class Mapper(InspectionAttr):
     @property
     def iterate_properties(self):
         """return an iterator of all MapperProperty objects."""
-        if Mapper._new_mappers:
-            configure_mappers()
+        self._check_configure()
         return iter(self._props.values())
 
     def _mappers_from_spec(self, spec, selectable):
@@ -1944,8 +1985,7 @@ class Mapper(InspectionAttr):
 
     @_memoized_configured_property
     def _with_polymorphic_mappers(self):
-        if Mapper._new_mappers:
-            configure_mappers()
+        self._check_configure()
         if not self.with_polymorphic:
             return []
         return self._mappers_from_spec(*self.with_polymorphic)
@@ -2069,6 +2109,19 @@ class Mapper(InspectionAttr):
             for table, columns in self._cols_by_table.items()
         )
 
+    @_memoized_configured_property
+    def _python_onupdate_cols(self):
+        return dict(
+            (
+                table,
+                frozenset([
+                    col.key for col in columns
+                    if col.onupdate is not None and
+                    not col.onupdate.is_clause_element])
+            )
+            for table, columns in self._cols_by_table.items()
+        )
+
     @property
     def selectable(self):
         """The :func:`.select` construct this :class:`.Mapper` selects from
@@ -2161,8 +2214,7 @@ class Mapper(InspectionAttr):
             :attr:`.Mapper.all_orm_descriptors`
 
         """
-        if Mapper._new_mappers:
-            configure_mappers()
+        self._check_configure()
         return util.ImmutableProperties(self._props)
 
     @_memoized_configured_property
@@ -2278,8 +2330,7 @@ class Mapper(InspectionAttr):
         return self._filter_properties(properties.CompositeProperty)
 
     def _filter_properties(self, type_):
-        if Mapper._new_mappers:
-            configure_mappers()
+        self._check_configure()
         return util.ImmutableProperties(util.OrderedDict(
             (k, v) for k, v in self._props.items()
             if isinstance(v, type_)
@@ -2721,6 +2772,14 @@ class Mapper(InspectionAttr):
         return util.LRUCache(self._compiled_cache_size,
                              size_alert=self._alert_lru_cache_limit)
 
+    @_memoized_configured_property
+    def _flush_sort_cache(self):
+        cache = util.LRUCache(100)
+        if self._flush_sort_artifacts is not None:
+            for key, value in self._flush_sort_artifacts():
+                cache[key] = value
+        return cache
+
     def _alert_lru_cache_limit(self, lru_cache):
         util.warn(
             "Compiled statement cache for mapper %s is "
@@ -2841,11 +2900,96 @@ def configure_mappers():
       mappings that haven't been produced yet, such as if they are in modules
       as yet unimported.
 
+    When lazy configuration is enabled using :func:`.set_lazy_configure`,
+    mappers are configured automatically only as needed by the mapper
+    being used; calling :func:`.configure_mappers` directly still configures
+    all pending mappers.
+
+    When the ``sqlalchemy.orm.mapper.Mapper`` logger is enabled for the
+    ``INFO`` level, the time spent in each configuration step is logged,
+    along with the mappers and properties that took the longest to
+    configure.
+
     """
 
     if not Mapper._new_mappers:
         return
 
+    _configure_mappers(None)
+
+
+def set_lazy_configure(enabled=True):
+    """Enable or disable lazy configuration of mappers.
+
+    By default, the first use of any mapper configures every mapper
+    constructed so far, as described at :func:`.configure_mappers`.
+    With lazy configuration enabled, the first use of a mapper
+    configures only the group of not-yet-configured mappers linked to
+    it, either through inheritance or through :func:`.relationship`
+    in either direction; mappers not linked to that one remain pending
+    until they are used themselves.   For applications with a large
+    number of mappings, of which a single process uses only a few,
+    this reduces the configuration work done up front.
+
+    Mappers which are linked only by string names which can't yet be
+    resolved are not considered to be linked.   :func:`.configure_mappers`
+    may still be called explicitly to configure all pending mappers at
+    once.
+
+    The :meth:`.MapperEvents.before_configured` and
+    :meth:`.MapperEvents.after_configured` events are emitted around
+    each group of mappers configured.
+
+    .. versionadded:: 1.2
+
+    """
+    global _lazy_configure
+    _lazy_configure = enabled
+
+
+def _mapper_neighbors(mapper):
+    """Return the mappers which must be configured along with the
+    given mapper."""
+
+    if mapper.inherits is not None:
+        yield mapper.inherits
+    if mapper.non_primary:
+        yield mapper.class_manager.mapper
+    for prop in list(mapper._props.values()):
+        if isinstance(prop, properties.RelationshipProperty):
+            try:
+                yield prop.mapper
+            except sa_exc.SQLAlchemyError:
+                # the target can't be resolved yet; the error
+                # is raised when the relationship is configured
+                pass
+
+
+def _linked_mappers(mapper):
+    """Return the set of not-yet-configured mappers linked to the
+    given mapper, including the mapper itself."""
+
+    pending = [m for m in list(_mapper_registry) if not m.configured]
+    links = util.defaultdict(set)
+    for m in pending:
+        for other in _mapper_neighbors(m):
+            links[m].add(other)
+            links[other].add(m)
+
+    linked = set([mapper])
+    stack = [mapper]
+    while stack:
+        for other in links[stack.pop()]:
+            if other not in linked and not other.configured:
+                linked.add(other)
+                stack.append(other)
+    return linked
+
+
+def _configure_mappers(from_mapper):
+    """Configure pending mappers; all of them if ``from_mapper`` is None,
+    else those linked to ``from_mapper``."""
+
     _CONFIGURE_MUTEX.acquire()
     try:
         global _already_compiling
@@ -2858,13 +3002,35 @@ def configure_mappers():
             if not Mapper._new_mappers:
                 return
 
+            if from_mapper is not None:
+                linked = _linked_mappers(from_mapper)
+                if all(m.configured for m in linked):
+                    for mapper in linked:
+                        mapper._configured_generation = \
+                            _configure_generation
+                    return
+
+            if Mapper.logger.isEnabledFor(logging.INFO):
+                timings = {}
+                start = time.time()
+            else:
+                timings = None
+
             Mapper.dispatch._for_class(Mapper).before_configured()
             # initialize properties on all mappers
             # note that _mapper_registry is unordered, which
             # may randomly conceal/reveal issues related to
             # the order of mapper compilation
 
-            for mapper in list(_mapper_registry):
+            if from_mapper is None:
+                mappers = list(_mapper_registry)
+            else:
+                # before_configured may have produced new mappers
+                generation = _configure_generation
+                linked = _linked_mappers(from_mapper)
+                mappers = [m for m in list(_mapper_registry) if m in linked]
+
+            for mapper in mappers:
                 if getattr(mapper, '_configure_failed', False):
                     e = sa_exc.InvalidRequestError(
                         "One or more mappers failed to initialize - "
@@ -2876,17 +3042,35 @@ def configure_mappers():
                     raise e
                 if not mapper.configured:
                     try:
-                        mapper._post_configure_properties()
+                        if timings is not None:
+                            mapper_start = time.time()
+                            prop_timings = []
+                        else:
+                            prop_timings = None
+                        mapper._post_configure_properties(prop_timings)
                         mapper._expire_memoizations()
                         mapper.dispatch.mapper_configured(
                             mapper, mapper.class_)
+                        if timings is not None:
+                            timings[mapper] = (
+                                time.time() - mapper_start,
+                                prop_timings)
                     except Exception:
                         exc = sys.exc_info()[1]
                         if not hasattr(exc, '_configure_failed'):
                             mapper._configure_failed = exc
                         raise
 
-            Mapper._new_mappers = False
+            if from_mapper is not None:
+                for mapper in mappers:
+                    mapper._configured_generation = generation
+
+            if from_mapper is None or \
+                    all(m.configured for m in list(_mapper_registry)):
+                Mapper._new_mappers = False
+
+            if timings is not None:
+                _log_configure_timings(time.time() - start, timings)
         finally:
             _already_compiling = False
     finally:
@@ -2894,6 +3078,30 @@ def configure_mappers():
     Mapper.dispatch._for_class(Mapper).after_configured()
 
 
+def _log_configure_timings(elapsed, timings, limit=5):
+    """Log a summary of the slowest mappers and properties configured
+    by a single configure step."""
+
+    mapper_times = sorted(
+        ((t, mapper) for mapper, (t, props) in timings.items()),
+        key=lambda item: item[0], reverse=True)
+    prop_times = sorted(
+        (item for t, props in timings.values() for item in props),
+        key=lambda item: item[0], reverse=True)
+
+    Mapper.logger.info(
+        "configured %d mappers in %.4f sec; slowest mappers: %s; "
+        "slowest properties: %s",
+        len(timings), elapsed,
+        ", ".join(
+            "%s (%.4f sec)" % (mapper.class_.__name__, t)
+            for t, mapper in mapper_times[:limit]),
+        ", ".join(
+            "%s (%.4f sec)" % (prop, t)
+            for t, prop in prop_times[:limit])
+    )
+
+
 def reconstructor(fn):
     """Decorate a method as the 'reconstructor' hook.
 
@@ -2979,8 +3187,7 @@ def _event_on_first_init(manager, cls):
 
     instrumenting_mapper = manager.info.get(_INSTRUMENTOR)
     if instrumenting_mapper:
-        if Mapper._new_mappers:
-            configure_mappers()
+        instrumenting_mapper._check_configure()
 
 
 def _event_on_init(state, args, kwargs):
@@ -2994,8 +3201,7 @@ def _event_on_init(state, args, kwargs):
 
     instrumenting_mapper = state.manager.info.get(_INSTRUMENTOR)
     if instrumenting_mapper:
-        if Mapper._new_mappers:
-            configure_mappers()
+        instrumenting_mapper._check_configure()
         if instrumenting_mapper._set_polymorphic_identity:
             instrumenting_mapper._set_polymorphic_identity(state)
 
@@ -23,6 +23,10 @@ from ..sql import expression
 from ..sql.base import _from_objects
 from . import loading
 
+# the largest number of records sent in one UPDATE..FROM..RETURNING,
+# further limited by the dialect's max_bind_parameters
+_UPDATE_FROM_RETURNING_CHUNKSIZE = 500
+
 
 def _bulk_insert(
         mapper, mappings, session_transaction, isstates, return_defaults,
@@ -675,7 +679,15 @@ def _emit_update_statements(base_mapper, uowtransaction,
         assert_singlerow = connection.dialect.supports_sane_rowcount
         assert_multirow = assert_singlerow and \
             connection.dialect.supports_sane_multi_rowcount
-        allow_multirow = has_all_defaults and not needs_version_id
+
+        # a versioned UPDATE may be batched into an executemany() when
+        # the new version is generated client side and the DBAPI reports
+        # the total rowcount across all parameter sets
+        allow_multirow = has_all_defaults and (
+            not needs_version_id or (
+                assert_multirow and
+                mapper.version_id_generator is not False)
+        )
 
         if not has_all_pks:
             statement = statement.return_defaults()
@@ -704,6 +716,18 @@ def _emit_update_statements(base_mapper, uowtransaction,
                         value_params)
                 rows += c.rowcount
                 check_rowcount = True
+        elif not allow_multirow and bookkeeping and has_all_pks and \
+                len(records) > 1 and \
+                connection.dialect.update_from_returning and \
+                connection.dialect.implicit_returning and \
+                table.implicit_returning and \
+                not mapper._python_onupdate_cols[table].difference(
+                    paramkeys):
+            rows = _emit_update_from_returning_statement(
+                base_mapper, uowtransaction, cached_connections,
+                mapper, table, connection, records, has_all_defaults,
+                needs_version_id)
+            check_rowcount = True
         else:
             if not allow_multirow:
                 check_rowcount = assert_singlerow
@@ -734,13 +758,15 @@ def _emit_update_statements(base_mapper, uowtransaction,
                 )
 
                 c = cached_connections[connection].\
-                    execute(statement, multiparams)
+                    execute(cached_stmt, multiparams)
 
                 rows += c.rowcount
 
-                for state, state_dict, params, mapper, \
-                        connection, value_params, \
-                        has_all_defaults, has_all_pks in records:
+                for (state, state_dict, params, mapper,
+                        connection, value_params,
+                        has_all_defaults, has_all_pks), \
+                        compiled_params in \
+                        zip(records, c.context.compiled_parameters):
                     if bookkeeping:
                         _postfetch(
                             mapper,
@@ -749,7 +775,7 @@ def _emit_update_statements(base_mapper, uowtransaction,
                             state,
                             state_dict,
                             c,
-                            c.context.compiled_parameters[0],
+                            compiled_params,
                             value_params)
 
         if check_rowcount:
@@ -784,6 +810,7 @@ def _emit_insert_statements(base_mapper, uowtransaction,
                 rec[7])):
 
         statement = cached_stmt
+        records = list(records)
 
         if not bookkeeping or \
                 (
@@ -792,7 +819,6 @@ def _emit_insert_statements(base_mapper, uowtransaction,
                     or not connection.dialect.implicit_returning
                 ) and has_all_pks and not hasvalue:
 
-            records = list(records)
             multiparams = [rec[2] for rec in records]
 
             c = cached_connections[connection].\
@@ -816,6 +842,15 @@ def _emit_insert_statements(base_mapper, uowtransaction,
                     else:
                         _postfetch_bulk_save(mapper_rec, state_dict, table)
 
+        elif not hasvalue and has_all_pks and len(records) > 1 and \
+                connection.dialect.insert_executemany_returning and \
+                connection.dialect.implicit_returning and \
+                table.implicit_returning:
+            _emit_insert_returning_statement(
+                base_mapper, uowtransaction, cached_connections,
+                mapper, table, statement, connection, records,
+                has_all_defaults)
+
         else:
             if not has_all_defaults and base_mapper.eager_defaults:
                 statement = statement.return_defaults()
@@ -858,6 +893,178 @@ def _emit_insert_statements(base_mapper, uowtransaction,
                         _postfetch_bulk_save(mapper_rec, state_dict, table)
 
 
+def _emit_insert_returning_statement(
+        base_mapper, uowtransaction, cached_connections,
+        mapper, table, statement, connection, records, has_all_defaults):
+    """Emit a single INSERT..RETURNING for a group of records collected
+    by _collect_insert_commands() which need server-generated default
+    values, using a dialect which returns rows for all parameter sets
+    of an executemany().
+
+    The order of the returned rows isn't guaranteed, so they are matched
+    to the records by primary key; records which need a server-generated
+    primary key are therefore inserted one at a time by the caller.
+
+    """
+    pks = mapper._pks_by_table[table]
+
+    returning = list(pks)
+    if not has_all_defaults and base_mapper.eager_defaults:
+        returning.extend(
+            table.c[key] for key in
+            sorted(mapper._server_default_cols[table]))
+    if mapper.version_id_col is not None and \
+            mapper.version_id_col in mapper._cols_by_table[table]:
+        returning.append(mapper.version_id_col)
+    returning = tuple(util.unique_list(returning))
+
+    returning_stmt = base_mapper._memo(
+        ('insert_returning', table, returning),
+        lambda: statement.returning(*returning))
+
+    result = cached_connections[connection].\
+        execute(returning_stmt, [rec[2] for rec in records])
+    rows_by_pk = dict(
+        (tuple(row[col] for col in pks), row) for row in result.fetchall()
+    )
+
+    for (state, state_dict, params, mapper_rec,
+            conn, value_params, has_all_pks, has_all_defaults), \
+            last_inserted_params in \
+            zip(records, result.context.compiled_parameters):
+
+        row = rows_by_pk.get(tuple(params[col.key] for col in pks))
+        if row is None:
+            raise orm_exc.FlushError(
+                "INSERT..RETURNING for table '%s' returned no row for "
+                "primary key %r" % (
+                    table.description,
+                    tuple(params[col.key] for col in pks)))
+
+        if state:
+            _postfetch(
+                mapper_rec,
+                uowtransaction,
+                table,
+                state,
+                state_dict,
+                result,
+                last_inserted_params,
+                value_params,
+                returned_row=row)
+        else:
+            _postfetch_bulk_save(mapper_rec, state_dict, table)
+
+
+def _emit_update_from_returning_statement(
+        base_mapper, uowtransaction, cached_connections,
+        mapper, table, connection, records, has_all_defaults,
+        needs_version_id):
+    """Emit UPDATE..FROM..RETURNING statements for a group of records
+    collected by _collect_update_commands() which would otherwise need
+    to be updated one row at a time, in order to check the version of
+    each row or to fetch server-generated values.
+
+    The parameter sets are delivered as a derived table of
+    UNION ALL'ed SELECTs which is joined to the target table on primary
+    key and, if present, the old version identifier.  Records are sent
+    in chunks limited by the dialect's
+    :attr:`.Dialect.max_bind_parameters`, and the statement for each
+    chunk size is memoized on the mapper.  The rows returned are matched
+    to the records by their new primary key and their total number is
+    returned as the matched rowcount.
+
+    """
+    pks = mapper._pks_by_table[table]
+    version_id_col = mapper.version_id_col
+    paramkeys = records[0][2]
+
+    set_cols = [
+        (col.key, col) for col in mapper._cols_by_table[table]
+        if col.key in paramkeys
+    ]
+    bind_cols = [(col._label, col) for col in pks] + set_cols
+    if needs_version_id:
+        bind_cols.append((version_id_col._label, version_id_col))
+
+    returning = list(pks)
+    if not has_all_defaults and base_mapper.eager_defaults:
+        returning.extend(
+            table.c[key] for key in
+            sorted(mapper._server_onupdate_default_cols[table]))
+    if needs_version_id:
+        returning.append(version_id_col)
+    returning = tuple(util.unique_list(returning))
+
+    def update_stmt(size):
+        data = sql.union_all(*[
+            sql.select([
+                sql.cast(
+                    sql.bindparam("p%d_%d" % (idx, pos), type_=col.type),
+                    col.type).label(key)
+                for pos, (key, col) in enumerate(bind_cols)
+            ])
+            for idx in range(size)
+        ]).alias()
+
+        criteria = [col == data.c[col._label] for col in pks]
+        if needs_version_id:
+            criteria.append(
+                version_id_col == data.c[version_id_col._label])
+
+        return table.update(sql.and_(*criteria)).values(
+            dict((col, data.c[key]) for key, col in set_cols)
+        ).returning(*returning)
+
+    chunksize = _UPDATE_FROM_RETURNING_CHUNKSIZE
+    limit = connection.dialect.max_bind_parameters
+    if limit is not None:
+        chunksize = max(min(chunksize, limit // len(bind_cols)), 1)
+
+    matched = 0
+    for start in range(0, len(records), chunksize):
+        chunk = records[start:start + chunksize]
+
+        statement = base_mapper._memo(
+            ('update_from_returning', table, tuple(bind_cols),
+             returning, len(chunk)),
+            lambda: update_stmt(len(chunk)))
+
+        params_by_bind = {}
+        for idx, rec in enumerate(chunk):
+            params = rec[2]
+            for pos, (key, col) in enumerate(bind_cols):
+                params_by_bind["p%d_%d" % (idx, pos)] = params[key]
+
+        result = cached_connections[connection].execute(
+            statement, params_by_bind)
+        rows_by_pk = dict(
+            (tuple(row[0:len(pks)]), row) for row in result.fetchall()
+        )
+
+        for state, state_dict, params, mapper_rec, conn, \
+                value_params, has_all_defaults_rec, has_all_pks in chunk:
+            row = rows_by_pk.get(tuple(
+                params[col.key] if col.key in params
+                else params[col._label]
+                for col in pks))
+            if row is not None:
+                _postfetch(
+                    mapper_rec,
+                    uowtransaction,
+                    table,
+                    state,
+                    state_dict,
+                    result,
+                    params,
+                    value_params,
+                    returned_row=row)
+
+        matched += len(rows_by_pk)
+
+    return matched
+
+
 def _emit_post_update_statements(base_mapper, uowtransaction,
                                  cached_connections, mapper, table, update):
     """Emit UPDATE statements corresponding to value lists collected
@@ -1019,15 +1226,28 @@ def _finalize_insert_update_commands(base_mapper, uowtransaction, states):
 
 
 def _postfetch(mapper, uowtransaction, table,
-               state, dict_, result, params, value_params):
+               state, dict_, result, params, value_params,
+               returned_row=None):
     """Expire attributes in need of newly persisted database state,
     after an INSERT or UPDATE statement has proceeded for that
-    state."""
+    state.
+
+    ``returned_row`` is the row delivered for this state by an
+    explicit RETURNING clause, if any; columns present in it are
+    populated rather than expired.
+
+    """
 
     prefetch_cols = result.context.compiled.prefetch
     postfetch_cols = result.context.compiled.postfetch
     returning_cols = result.context.compiled.returning
 
+    if returned_row is not None:
+        returned = set(returning_cols)
+        postfetch_cols = [
+            c for c in postfetch_cols
+            if c not in returned and c.key not in params]
+
     if mapper.version_id_col is not None and \
             mapper.version_id_col in mapper._cols_by_table[table]:
         prefetch_cols = list(prefetch_cols) + [mapper.version_id_col]
@@ -1037,7 +1257,10 @@ def _postfetch(mapper, uowtransaction, table,
         load_evt_attrs = []
 
     if returning_cols:
-        row = result.context.returned_defaults
+        if returned_row is not None:
+            row = returned_row
+        else:
+            row = result.context.returned_defaults
         if row is not None:
             for col in returning_cols:
                 # pk cols returned from insert are handled
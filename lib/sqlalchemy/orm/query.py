@@ -87,6 +87,7 @@ class Query(object):
     _statement = None
     _correlate = frozenset()
     _populate_existing = False
+    _readonly = False
     _invoke_all_eagers = True
     _version_check = False
     _autoflush = True
@@ -109,6 +110,8 @@ class Query(object):
     _orm_only_from_obj_alias = True
     _current_path = _path_registry
     _has_mapper_entities = False
+    _cache_results = False
+    _cache_ttl = None
 
     def __init__(self, entities, session=None):
         """Construct a :class:`.Query` directly.
@@ -869,24 +872,94 @@ class Query(object):
         """
         return self._get_impl(ident, loading.load_on_ident)
 
-    def _get_impl(self, ident, fallback_fn):
+    def get_many(self, idents):
+        """Return a list of instances corresponding to the given sequence
+        of primary key identifiers, with ``None`` in place of those which
+        aren't found.
+
+        E.g.::
+
+            users = session.query(User).get_many([5, 7, 10])
+
+            some_objects = session.query(VersionedFoo).get_many(
+                [(5, 10), (5, 11)])
+
+        :meth:`~.Query.get_many` behaves like :meth:`~.Query.get` called
+        for each identifier, returning objects which are present in the
+        identity map directly, except that the remaining objects, including
+        those which are present but expired, are loaded using as few
+        SELECT statements as possible.   Single-column primary keys are
+        loaded using an "expanding" IN expression for up to 500
+        identifiers at a time; composite primary keys are loaded using
+        OR'ed criteria for each identifier, in batches of the same size.
+
+        The returned list is in the same order as the given identifiers.
+
+        :param idents: a sequence of scalar or tuple values, each
+         representing a primary key as accepted by :meth:`~.Query.get`.
+
+        .. versionadded:: 1.2
+
+        .. seealso::
+
+            :meth:`.Session.get_many`
+
+        """
+        mapper = self._only_full_mapper_zero("get_many")
+        self._get_existing_condition()
+
+        use_identity_map = not self._populate_existing and \
+            not self._readonly and \
+            not mapper.always_refresh and \
+            self._for_update_arg is None
+        identity_map = self.session.identity_map
+
+        keys = [self._identity_key(mapper, ident, "get_many")
+                for ident in idents]
+
+        found = {}
+        to_load = []
+        for key in keys:
+            if key in found:
+                continue
+            instance = identity_map.get(key) if use_identity_map else None
+            if instance is not None and \
+                    not attributes.instance_state(instance).expired:
+                # reject calls for id in identity map but class
+                # mismatch.
+                found[key] = instance \
+                    if issubclass(instance.__class__, mapper.class_) \
+                    else None
+            else:
+                found[key] = None
+                to_load.append(key)
+
+        if to_load:
+            found.update(loading.load_on_idents(self, to_load))
+
+        return [found[key] for key in keys]
+
+    def _identity_key(self, mapper, ident, meth):
         # convert composite types to individual args
         if hasattr(ident, '__composite_values__'):
             ident = ident.__composite_values__()
 
         ident = util.to_list(ident)
 
-        mapper = self._only_full_mapper_zero("get")
-
         if len(ident) != len(mapper.primary_key):
             raise sa_exc.InvalidRequestError(
                 "Incorrect number of values in identifier to formulate "
-                "primary key for query.get(); primary key columns are %s" %
-                ','.join("'%s'" % c for c in mapper.primary_key))
+                "primary key for query.%s(); primary key columns are %s" %
+                (meth, ','.join("'%s'" % c for c in mapper.primary_key)))
+
+        return mapper.identity_key_from_primary_key(ident)
 
-        key = mapper.identity_key_from_primary_key(ident)
+    def _get_impl(self, ident, fallback_fn):
+        mapper = self._only_full_mapper_zero("get")
+        key = self._identity_key(mapper, ident, "get")
 
         if not self._populate_existing and \
+                not self._readonly and \
                 not mapper.always_refresh and \
                 self._for_update_arg is None:
 
@@ -957,6 +1030,71 @@ class Query(object):
         """
         self._populate_existing = True
 
+    @_generative()
+    def readonly(self):
+        """Return a :class:`.Query` that will load instances which are not
+        associated with the :class:`.Session`.
+
+        E.g.::
+
+            for user in session.query(User).readonly():
+                print(user.name)
+
+        Instances are produced in the :term:`detached` state; they are
+        neither placed in nor retrieved from the
+        :attr:`.Session.identity_map`, and changes made to them are not
+        tracked by the :class:`.Session`.  Within the result of a single
+        query, rows with the same identity still produce the same
+        instance.  This reduces the overhead of loading objects which
+        are only read, such as for reporting.
+
+        The :meth:`.InstanceEvents.load` event, and with it any
+        :func:`.reconstructor` method, is still invoked for each new
+        instance; the :meth:`.SessionEvents.loaded_as_persistent` event
+        is not, as the instances don't become persistent.
+
+        As the instances are detached, their lazy-loaded relationships and
+        deferred columns can't be loaded when first accessed; use eager
+        loading such as :func:`.joinedload`, :func:`.subqueryload` or
+        :func:`.selectinload` for relationships, which also produce
+        read-only instances.
+
+        .. versionadded:: 1.2
+
+        """
+        self._readonly = True
+
+    @_generative()
+    def cache(self, ttl=None):
+        """Return a :class:`.Query` whose results will be retrieved from and
+        stored in the :class:`.QueryCache` of the owning :class:`.Session`.
+
+        E.g.::
+
+            session = Session(bind=engine, query_cache=QueryCache())
+
+            countries = session.query(Country).\\
+                filter(Country.region == 'Europe').cache(ttl=3600).all()
+
+        If the :class:`.Session` has no :paramref:`.Session.query_cache`,
+        the query is executed normally.   Queries which use
+        :meth:`.Query.with_for_update` or :meth:`.Query.populate_existing`,
+        as well as those whose statement doesn't support structural cache
+        keys, such as those produced from textual SQL, also bypass the cache.
+
+        :param ttl: number of seconds after which the cached result
+         expires, overriding the :paramref:`.QueryCache.ttl` setting.
+
+        .. versionadded:: 1.2
+
+        .. seealso::
+
+            :class:`.QueryCache`
+
+        """
+        self._cache_results = True
+        self._cache_ttl = ttl
+
     @_generative()
     def _with_invoke_all_eagers(self, value):
         """Set the 'invoke all eagers' flag which causes joined- and
@@ -2858,6 +2996,9 @@ class Query(object):
         context.statement.use_labels = True
         if self._autoflush and not self._populate_existing:
             self.session._autoflush()
+        if self._cache_results and self.session.query_cache is not None:
+            return self.session.query_cache._iter(
+                self, context, self._cache_ttl)
         return self._execute_and_instances(context)
 
     def __str__(self):
@@ -4109,7 +4250,7 @@ class QueryContext(object):
         'eager_joins', 'create_eager_joins', 'propagate_options',
         'attributes', 'statement', 'from_clause', 'whereclause',
         'order_by', 'labels', '_for_update_arg', 'runid', 'partials',
-        'post_load_paths'
+        'post_load_paths', 'readonly', 'readonly_identities'
     )
 
     def __init__(self, query):
@@ -4135,6 +4276,8 @@ class QueryContext(object):
         self.session = query.session
         self.autoflush = query._autoflush
         self.populate_existing = query._populate_existing
+        self.readonly = query._readonly
+        self.readonly_identities = {} if query._readonly else None
         self.invoke_all_eagers = query._invoke_all_eagers
         self.version_check = query._version_check
         self.refresh_state = query._refresh_state
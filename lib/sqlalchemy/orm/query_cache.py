@@ -0,0 +1,517 @@
+# orm/query_cache.py
+# Copyright (C) 2005-2017 the SQLAlchemy authors and contributors
+# <see AUTHORS file>
+#
+# This module is part of SQLAlchemy and is released under
+# the MIT License: http://www.opensource.org/licenses/mit-license.php
+
+"""Second-level cache for the results of :class:`.Query` objects.
+
+A :class:`.QueryCache` is associated with a :class:`.Session` using the
+:paramref:`.Session.query_cache` parameter, and is consulted for those
+queries which have been marked using :meth:`.Query.cache`.
+
+"""
+
+import hashlib
+import time
+import weakref
+
+from . import attributes, query as query_mod
+from .base import _class_to_mapper
+from .. import event, exc as sa_exc, util
+from ..sql import expression, util as sql_util
+
+
+__all__ = ['QueryCache', 'CacheBackend', 'MemoryCacheBackend',
+           'ClientCacheBackend']
+
+
+class CacheBackend(object):
+    """Describe the interface used by :class:`.QueryCache` to store
+    and retrieve values.
+
+    The interface is modeled on that of a memcached client.  Values which
+    aren't present, or which have expired, are returned as ``None``.
+
+    .. versionadded:: 1.2
+
+    """
+
+    string_keys = False
+    """If True, :class:`.QueryCache` will send string keys to this backend,
+    rather than hashable tuples which are only meaningful within the
+    current process."""
+
+    def get(self, key):
+        """Return the value for the given key, or ``None``."""
+
+        raise NotImplementedError()
+
+    def get_multi(self, keys):
+        """Return a dictionary of the values present for the given keys."""
+
+        result = {}
+        for key in keys:
+            value = self.get(key)
+            if value is not None:
+                result[key] = value
+        return result
+
+    def set(self, key, value, ttl=None):
+        """Store a value, expiring after ``ttl`` seconds if given."""
+
+        raise NotImplementedError()
+
+    def delete(self, key):
+        """Remove the given key, if present."""
+
+        raise NotImplementedError()
+
+
+class MemoryCacheBackend(CacheBackend):
+    """An in-process :class:`.CacheBackend` which keeps up to ``size``
+    values, discarding those least recently used.
+
+    .. versionadded:: 1.2
+
+    """
+
+    def __init__(self, size=1000):
+        self._cache = util.LRUCache(size)
+
+    def get(self, key):
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+        expires, value = entry
+        if expires is not None and expires < time.time():
+            self.delete(key)
+            return None
+        return value
+
+    def set(self, key, value, ttl=None):
+        expires = time.time() + ttl if ttl else None
+        self._cache[key] = (expires, value)
+
+    def delete(self, key):
+        self._cache.pop(key, None)
+
+    def clear(self):
+        """Remove all values."""
+
+        self._cache.clear()
+
+
+class ClientCacheBackend(CacheBackend):
+    """A :class:`.CacheBackend` which delegates to a memcached-style
+    client object.
+
+    The client must provide ``get(key)``, ``set(key, value, ttl)`` and
+    ``delete(key)`` methods, and may additionally provide
+    ``get_multi(keys)`` or ``get_many(keys)``; the clients included with
+    python-memcached and pymemcache are both suitable.   Keys are hashed
+    using SHA1 and appended to ``prefix``.   Values are passed to the
+    client as is, so the client is responsible for serializing them; when
+    pickling is used, mapped classes must be importable by name.
+
+    .. versionadded:: 1.2
+
+    """
+
+    string_keys = True
+
+    def __init__(self, client, prefix="sqlalchemy:"):
+        self.client = client
+        self.prefix = prefix
+        self._client_get_multi = getattr(client, "get_multi", None) or \
+            getattr(client, "get_many", None)
+
+    def _mangle(self, key):
+        return self.prefix + hashlib.sha1(key.encode("utf-8")).hexdigest()
+
+    def get(self, key):
+        return self.client.get(self._mangle(key))
+
+    def get_multi(self, keys):
+        if self._client_get_multi is None:
+            return CacheBackend.get_multi(self, keys)
+        mangled = dict((self._mangle(key), key) for key in keys)
+        return dict(
+            (mangled[k], value)
+            for k, value in self._client_get_multi(list(mangled)).items()
+            if value is not None
+        )
+
+    def set(self, key, value, ttl=None):
+        self.client.set(self._mangle(key), value, int(ttl or 0))
+
+    def delete(self, key):
+        self.client.delete(self._mangle(key))
+
+
+class _CachePlan(object):
+    """Per-structure information used to produce cache keys."""
+
+    __slots__ = ('generation_keys', 'bind_positions', 'statement', '_string')
+
+    def __init__(self, statement, elements):
+        self.statement = statement
+        self.generation_keys = frozenset(
+            _generation_key(t) for t in sql_util.find_tables(statement)
+            if isinstance(t, expression.TableClause)
+        )
+        self.bind_positions = [
+            idx for idx, elem in enumerate(elements)
+            if isinstance(elem, expression.BindParameter)
+        ]
+        self._string = None
+
+    @property
+    def string(self):
+        if self._string is None:
+            self._string = util.text_type(self.statement)
+        return self._string
+
+
+class QueryCache(object):
+    """A second-level cache for the results of :class:`.Query` objects.
+
+    E.g.::
+
+        from sqlalchemy.orm import QueryCache, sessionmaker
+
+        cache = QueryCache(ttl=300)
+        Session = sessionmaker(bind=engine, query_cache=cache)
+
+        session = Session()
+        products = session.query(Product).\\
+            filter(Product.category == 'tools').cache().all()
+
+    Results are keyed on the structure of the SELECT statement produced by
+    the :class:`.Query`, as provided by the structural cache key of the
+    statement, along with the values of its bound parameters and the
+    loader strategies set up by options such as :func:`.selectinload`, so
+    that looking up a result doesn't require the statement to be compiled.
+
+    Mapped objects are stored as detached copies.  When a result is
+    retrieved from the cache, each object is merged into the
+    :class:`.Session` without emitting SQL, in the manner of
+    :meth:`.Session.merge` with ``load=False``; an object which is already
+    present in the identity map is returned as is.
+
+    Each table which a cached result depends upon is assigned a
+    "generation" token within the backend, which is made part of the
+    cache key.  When a :class:`.Session` using this cache commits changes
+    to mapped objects, or emits :meth:`.Query.update` or
+    :meth:`.Query.delete`, the generations of the affected tables are
+    replaced, invalidating all results which refer to them.   Until the
+    transaction is committed, queries against those tables bypass the cache
+    within that :class:`.Session`.   Changes made outside of the
+    :class:`.Session`, such as by Core statements or other applications,
+    need to be signaled using :meth:`.QueryCache.invalidate`.
+
+    :param backend: a :class:`.CacheBackend`.  Defaults to a
+     :class:`.MemoryCacheBackend`.
+
+    :param ttl: default number of seconds after which a cached result
+     expires.  Defaults to None, meaning results are kept until invalidated
+     or discarded by the backend.   May be overridden using
+     :paramref:`.Query.cache.ttl`.
+
+    :param plan_cache_size: number of distinct statement structures for
+     which key generation information is retained.
+
+    .. versionadded:: 1.2
+
+    """
+
+    def __init__(self, backend=None, ttl=None, plan_cache_size=500):
+        if backend is None:
+            backend = MemoryCacheBackend()
+        self.backend = backend
+        self.ttl = ttl
+        self.hits = self.misses = 0
+        self._plans = util.LRUCache(plan_cache_size)
+        self._pending = weakref.WeakKeyDictionary()
+
+    def invalidate(self, *entities):
+        """Invalidate all cached results which depend upon the given
+        mapped classes, mappers or :class:`.Table` objects."""
+
+        tables = set()
+        for entity in entities:
+            if isinstance(entity, expression.TableClause):
+                tables.add(entity)
+            else:
+                tables.update(_class_to_mapper(entity).tables)
+        self._bump(_generation_key(table) for table in tables)
+
+    def _listen(self, session):
+        """Establish invalidation hooks on the given :class:`.Session`."""
+
+        event.listen(session, "after_flush", self._after_flush)
+        event.listen(session, "after_bulk_update", self._after_bulk)
+        event.listen(session, "after_bulk_delete", self._after_bulk)
+        event.listen(session, "after_commit", self._after_commit)
+        event.listen(
+            session, "after_transaction_end", self._after_transaction_end)
+
+    def _after_flush(self, session, flush_context):
+        pending = self._pending.setdefault(session, set())
+        for mapper in set(state.mapper for state in flush_context.states):
+            pending.update(_mapper_generation_keys(mapper))
+
+    def _after_bulk(self, context):
+        self._pending.setdefault(context.session, set()).update(
+            _mapper_generation_keys(context.mapper))
+
+    def _after_commit(self, session):
+        pending = self._pending.pop(session, None)
+        if pending:
+            self._bump(pending)
+
+    def _after_transaction_end(self, session, transaction):
+        if transaction.parent is None:
+            self._pending.pop(session, None)
+
+    def _bump(self, generation_keys):
+        for key in generation_keys:
+            self.backend.set(key, _new_generation())
+
+    def _generations(self, generation_keys):
+        keys = sorted(generation_keys)
+        current = self.backend.get_multi(keys)
+        for key in keys:
+            if key not in current:
+                current[key] = generation = _new_generation()
+                self.backend.set(key, generation)
+        return tuple((key, current[key]) for key in keys)
+
+    def _plan(self, statement):
+        cache_key = statement._generate_cache_key()
+        if cache_key is None:
+            return None
+        key, elements = cache_key
+        plan = self._plans.get(key)
+        if plan is None:
+            self._plans[key] = plan = _CachePlan(statement, elements)
+        return plan, key, elements
+
+    def _iter(self, query, context, ttl):
+        """Return the result of ``query``, using the cache if possible.
+
+        Called by :meth:`.Query.__iter__` for queries which have been
+        marked using :meth:`.Query.cache`.
+
+        """
+        plan = None
+        if not query._populate_existing and not query._readonly and \
+                query._for_update_arg is None:
+            plan = self._plan(context.statement)
+
+        pending = self._pending.get(query.session)
+        if plan is None or (
+                pending and not pending.isdisjoint(plan[0].generation_keys)):
+            return query._execute_and_instances(context)
+
+        plan, structure, elements = plan
+
+        params = query._params
+        values = []
+        for idx in plan.bind_positions:
+            bind = elements[idx]
+            value = params.get(bind.key, bind.effective_value)
+            if isinstance(value, list):
+                value = tuple(value)
+            values.append(value)
+        values = tuple(values)
+
+        generations = self._generations(plan.generation_keys)
+        flags = (query._populate_existing, query._readonly)
+        if self.backend.string_keys:
+            entities = tuple(
+                (type(ent).__name__, ent._label_name)
+                for ent in query._entities)
+            key = "%s|%r|%r|%r|%r|%r" % (
+                plan.string, entities, _loader_key(query, True), flags,
+                values, generations)
+        else:
+            entities = tuple(
+                (type(ent), ent._label_name,
+                 getattr(ent, 'entity_zero', None))
+                for ent in query._entities)
+            try:
+                key = (structure, entities, _loader_key(query, False), flags,
+                       values, generations)
+                hash(key)
+            except TypeError:
+                return query._execute_and_instances(context)
+
+        cached = self.backend.get(key)
+        if cached is not None:
+            # results also depend on the tables of related objects
+            # which were loaded along with them
+            dependencies, rows = cached
+            dependency_keys = [key for key, generation in dependencies]
+            if not dependencies or (
+                    not (pending and
+                         not pending.isdisjoint(dependency_keys)) and
+                    self._generations(dependency_keys) == dependencies):
+                self.hits += 1
+                return _merge_rows(query, rows)
+
+        self.misses += 1
+        result = list(query._execute_and_instances(context))
+        snapshot = _snapshot(query, result)
+        if snapshot is not None:
+            rows, dependency_keys = snapshot
+            dependencies = self._generations(
+                dependency_keys.difference(plan.generation_keys))
+            if ttl is None:
+                ttl = self.ttl
+            self.backend.set(key, (dependencies, rows), ttl)
+        return iter(result)
+
+
+def _loader_key(query, string_keys):
+    """Return the loader strategies established by the options of the
+    given query, such as :func:`.selectinload`, which determine how
+    related objects are loaded without necessarily changing the SELECT
+    statement itself."""
+
+    loaders = []
+    for (token, path), loader in query._attributes.items():
+        if token != "loader":
+            continue
+
+        # the executor used to run the SELECTs doesn't change the result
+        local_opts = tuple(sorted(
+            (key, value) for key, value in loader.local_opts.items()
+            if key != "executor"))
+        if string_keys:
+            loaders.append(repr((
+                tuple(util.text_type(elem) for elem in path),
+                loader.strategy, local_opts)))
+        else:
+            loaders.append((path, loader.strategy, local_opts))
+
+    if string_keys:
+        return tuple(sorted(loaders))
+    else:
+        return frozenset(loaders)
+
+
+def _generation_key(table):
+    return "sqlalchemy.generation:%s" % table.fullname
+
+
+def _new_generation():
+    # uuid is imported on first use, as it isn't otherwise needed
+    # when the ORM is imported
+    import uuid
+    return uuid.uuid4().hex
+
+
+def _mapper_generation_keys(mapper):
+    tables = set(mapper.tables)
+    for prop in mapper.relationships:
+        if prop.secondary is not None:
+            tables.update(sql_util.find_tables(prop.secondary))
+    return set(_generation_key(table) for table in tables)
+
+
+def _snapshot(query, result):
+    """Produce detached copies of the mapped objects in the given
+    result, along with the generation keys of the tables they were
+    loaded from.
+
+    Returns ``None`` if the result can't be cached, which is the case
+    when objects have pending changes.
+
+    """
+    from .session import Session
+
+    mapped = [
+        idx for idx, ent in enumerate(query._entities)
+        if isinstance(ent, query_mod._MapperEntity)
+    ]
+    single_entity = len(query._entities) == 1
+
+    scratch = Session()
+    try:
+        def merge(instance):
+            return scratch._merge(
+                attributes.instance_state(instance),
+                attributes.instance_dict(instance),
+                load=False, _recursive={}, _resolve_conflict_map={})
+
+        if not mapped:
+            rows = [tuple(row) for row in result] \
+                if not single_entity else list(result)
+        elif single_entity:
+            rows = [merge(instance) for instance in result]
+        else:
+            rows = []
+            for row in result:
+                row = list(row)
+                for idx in mapped:
+                    if row[idx] is not None:
+                        row[idx] = merge(row[idx])
+                rows.append(tuple(row))
+    except sa_exc.InvalidRequestError:
+        # objects with pending changes can't be merged with
+        # load=False; don't cache them
+        return None
+    else:
+        keys = set()
+        for state in scratch.identity_map.all_states():
+            keys.update(_mapper_generation_keys(state.mapper))
+        return rows, keys
+    finally:
+        scratch.expunge_all()
+
+
+def _merge_rows(query, rows):
+    """Merge cached rows into the :class:`.Session` of the given query."""
+
+    session = query.session
+    identity_map = session.identity_map
+
+    def merge(instance):
+        state = attributes.instance_state(instance)
+        existing = identity_map.get(state.key)
+        if existing is not None:
+            return existing
+        return session._merge(
+            state, attributes.instance_dict(instance),
+            load=False, _recursive={}, _resolve_conflict_map={})
+
+    mapped = [
+        idx for idx, ent in enumerate(query._entities)
+        if isinstance(ent, query_mod._MapperEntity)
+    ]
+
+    autoflush = session.autoflush
+    try:
+        session.autoflush = False
+        if not mapped:
+            if len(query._entities) == 1:
+                return iter(list(rows))
+            result = rows
+        elif len(query._entities) == 1:
+            return iter([merge(instance) for instance in rows])
+        else:
+            result = []
+            for row in rows:
+                row = list(row)
+                for idx in mapped:
+                    if row[idx] is not None:
+                        row[idx] = merge(row[idx])
+                result.append(row)
+
+        keyed_tuple = util.lightweight_named_tuple(
+            'result', [ent._label_name for ent in query._entities])
+        return iter([keyed_tuple(row) for row in result])
+    finally:
+        session.autoflush = autoflush
@@ -91,6 +91,7 @@ class RelationshipProperty(StrategizedProperty):
     strategy_wildcard_key = 'relationship'
 
     _dependency_processor = None
+    _join_condition_inputs = None
 
     def __init__(self, argument,
                  secondary=None, primaryjoin=None,
@@ -116,7 +117,8 @@ class RelationshipProperty(StrategizedProperty):
                  bake_queries=True,
                  _local_remote_pairs=None,
                  query_class=None,
-                 info=None):
+                 info=None,
+                 selectin_chunk_size=None):
         """Provide a relationship between two mapped classes.
 
         This corresponds to a parent-child or associative table relationship.
@@ -761,6 +763,17 @@ class RelationshipProperty(StrategizedProperty):
 
               :ref:`relationship_primaryjoin`
 
+        :param selectin_chunk_size:
+          when using ``lazy="selectin"`` or the :func:`.orm.selectinload`
+          option, the maximum number of parent primary key values to be
+          placed in the IN clause of each SELECT.  Defaults to 500.
+          The effective size is further limited by the
+          :attr:`.Dialect.max_bind_parameters` of the dialect in use,
+          e.g. 999 for SQLite and 2100 for SQL Server, and may be
+          overridden per-query using :paramref:`.selectinload.chunk_size`.
+
+          .. versionadded:: 1.2.0
+
         :param single_parent:
           when True, installs a validator which will prevent objects
           from being associated with more than one parent at a time.
@@ -842,6 +855,7 @@ class RelationshipProperty(StrategizedProperty):
         self.doc = doc
         self.active_history = active_history
         self.join_depth = join_depth
+        self.selectin_chunk_size = selectin_chunk_size
         self.local_remote_pairs = _local_remote_pairs
         self.extension = extension
         self.bake_queries = bake_queries
@@ -1351,8 +1365,7 @@ class RelationshipProperty(StrategizedProperty):
 
         @util.memoized_property
         def property(self):
-            if mapperlib.Mapper._new_mappers:
-                mapperlib.Mapper._configure_all()
+            self.prop.parent._check_configure()
             return self.prop
 
     def _with_parent(self, instance, alias_secondary=True):
@@ -1707,6 +1720,20 @@ class RelationshipProperty(StrategizedProperty):
         self.target = self.mapper.mapped_table
 
     def _setup_join_conditions(self):
+        self._join_condition_inputs = inputs = self._get_join_inputs()
+
+        # state exported by ArtifactCache may be used in place of
+        # analyzing the join, provided it was derived from the same inputs
+        restored = None
+        artifacts = self.parent._relationship_artifacts
+        if artifacts:
+            load_artifact = artifacts.pop(self.key, None)
+            if load_artifact is not None:
+                artifact = load_artifact()
+                if artifact is not None and \
+                        _same_join_inputs(artifact[0], inputs):
+                    restored = artifact[1]
+
         self._join_condition = jc = JoinCondition(
             parent_selectable=self.parent.mapped_table,
             child_selectable=self.mapper.mapped_table,
@@ -1723,7 +1750,8 @@ class RelationshipProperty(StrategizedProperty):
             self_referential=self._is_self_referential,
             prop=self,
             support_sync=not self.viewonly,
-            can_be_synced_fn=self._columns_are_mapped
+            can_be_synced_fn=self._columns_are_mapped,
+            _restore=restored
         )
         self.primaryjoin = jc.primaryjoin
         self.secondaryjoin = jc.secondaryjoin
@@ -1735,6 +1763,52 @@ class RelationshipProperty(StrategizedProperty):
         self._calculated_foreign_keys = jc.foreign_key_columns
         self.secondary_synchronize_pairs = jc.secondary_synchronize_pairs
 
+    def _get_join_inputs(self):
+        """Return the arguments which determine the join condition of
+        this relationship, in a form that can be compared to those of
+        an exported artifact."""
+
+        tables = list(self.parent.tables) + list(self.mapper.tables)
+        if self.secondary is not None:
+            tables.append(self.secondary)
+        return (
+            self.mapper, list(self.parent.tables), list(self.mapper.tables),
+            self.primaryjoin, self.secondaryjoin, self.secondary,
+            self._user_defined_foreign_keys, self.local_remote_pairs,
+            self.remote_side, self.viewonly,
+            set(
+                (fk.parent, fk.target_fullname)
+                for table in tables
+                for fk in getattr(table, 'foreign_keys', ())
+            )
+        )
+
+    def _get_artifact(self):
+        """Return the join condition and lazy loader clauses derived for
+        this relationship, along with the inputs they were derived from,
+        for export by :class:`.ArtifactCache`."""
+
+        strategy = self._lazy_strategy
+        lazy_clauses = []
+        for lazywhere, bind_to_col, equated_columns in (
+                (strategy._lazywhere, strategy._bind_to_col,
+                 strategy._equated_columns),
+                (strategy._rev_lazywhere, strategy._rev_bind_to_col,
+                 strategy._rev_equated_columns)):
+            # bound parameter keys are regenerated when unpickled, so
+            # keep the parameters themselves rather than their keys
+            binds = [
+                (elem, bind_to_col[elem.key])
+                for elem in visitors.iterate(lazywhere, {})
+                if isinstance(elem, expression.BindParameter) and
+                elem.key in bind_to_col
+            ]
+            lazy_clauses.append((lazywhere, binds, equated_columns))
+        return (
+            self._join_condition_inputs,
+            self._join_condition._get_state() + (lazy_clauses, )
+        )
+
     def _check_conflicts(self):
         """Test that this relationship is legal, warn about
         inheritance conflicts."""
@@ -1946,7 +2020,24 @@ def _annotate_columns(element, annotations):
     return element
 
 
+def _same_join_inputs(a, b):
+    """Compare the join inputs of a relationship to those stored with an
+    exported artifact."""
+
+    if isinstance(a, (list, tuple)):
+        return isinstance(b, (list, tuple)) and len(a) == len(b) and \
+            all(_same_join_inputs(x, y) for x, y in zip(a, b))
+    elif isinstance(a, expression.ClauseElement):
+        return isinstance(b, expression.ClauseElement) and a.compare(b)
+    elif isinstance(b, expression.ClauseElement):
+        return False
+    else:
+        return a == b
+
+
 class JoinCondition(object):
+    _restored_lazy_clauses = None
+
     def __init__(self,
                  parent_selectable,
                  child_selectable,
@@ -1963,7 +2054,8 @@ class JoinCondition(object):
                  self_referential=False,
                  prop=None,
                  support_sync=True,
-                 can_be_synced_fn=lambda *c: True
+                 can_be_synced_fn=lambda *c: True,
+                 _restore=None
                  ):
         self.parent_selectable = parent_selectable
         self.parent_local_selectable = parent_local_selectable
@@ -1981,19 +2073,38 @@ class JoinCondition(object):
         self.self_referential = self_referential
         self.support_sync = support_sync
         self.can_be_synced_fn = can_be_synced_fn
-        self._determine_joins()
-        self._annotate_fks()
-        self._annotate_remote()
-        self._annotate_local()
-        self._annotate_parentmapper()
-        self._setup_pairs()
-        self._check_foreign_cols(self.primaryjoin, True)
-        if self.secondaryjoin is not None:
-            self._check_foreign_cols(self.secondaryjoin, False)
-        self._determine_direction()
-        self._check_remote_side()
+        if _restore is not None:
+            self._set_state(_restore)
+        else:
+            self._determine_joins()
+            self._annotate_fks()
+            self._annotate_remote()
+            self._annotate_local()
+            self._annotate_parentmapper()
+            self._setup_pairs()
+            self._check_foreign_cols(self.primaryjoin, True)
+            if self.secondaryjoin is not None:
+                self._check_foreign_cols(self.secondaryjoin, False)
+            self._determine_direction()
+            self._check_remote_side()
         self._log_joins()
 
+    def _get_state(self):
+        """Return the result of analyzing the join condition."""
+
+        return (self.primaryjoin, self.secondaryjoin, self.direction,
+                self.local_remote_pairs, self.synchronize_pairs,
+                self.secondary_synchronize_pairs)
+
+    def _set_state(self, state):
+        """Establish a result produced by :meth:`._get_state`, along with
+        the lazy clauses produced for it, in place of analysis."""
+
+        (self.primaryjoin, self.secondaryjoin, self.direction,
+         self.local_remote_pairs, self.synchronize_pairs,
+         self.secondary_synchronize_pairs, lazy_clauses) = state
+        self._restored_lazy_clauses = dict(zip((False, True), lazy_clauses))
+
     def _log_joins(self):
         if self.prop is None:
             return
@@ -2811,6 +2922,14 @@ class JoinCondition(object):
             target_adapter, dest_selectable
 
     def create_lazy_clause(self, reverse_direction=False):
+        if self._restored_lazy_clauses:
+            restored = self._restored_lazy_clauses.pop(
+                reverse_direction, None)
+            if restored is not None:
+                lazywhere, binds, equated_columns = restored
+                bind_to_col = {bind.key: col for bind, col in binds}
+                return lazywhere, bind_to_col, equated_columns
+
         binds = util.column_dict()
         equated_columns = util.column_dict()
 
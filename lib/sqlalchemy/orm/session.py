@@ -579,7 +579,8 @@ class Session(_SessionClassMethods):
         '__contains__', '__iter__', 'add', 'add_all', 'begin', 'begin_nested',
         'close', 'commit', 'connection', 'delete', 'execute', 'expire',
         'expire_all', 'expunge', 'expunge_all', 'flush', 'get_bind',
-        'is_modified', 'bulk_save_objects', 'bulk_insert_mappings',
+        'get_many', 'is_modified', 'bulk_save_objects',
+        'bulk_insert_mappings',
         'bulk_update_mappings',
         'merge', 'query', 'refresh', 'rollback',
         'scalar')
@@ -589,7 +590,8 @@ class Session(_SessionClassMethods):
                  autocommit=False, twophase=False,
                  weak_identity_map=True, binds=None, extension=None,
                  info=None,
-                 query_cls=query.Query):
+                 query_cls=query.Query,
+                 query_cache=None):
         r"""Construct a new Session.
 
         See also the :class:`.sessionmaker` function which is used to
@@ -692,6 +694,14 @@ class Session(_SessionClassMethods):
           objects, as returned by the :meth:`~.Session.query` method.
           Defaults to :class:`.Query`.
 
+        :param query_cache: a :class:`.QueryCache` which will be used to
+          store and retrieve the results of queries which are marked using
+          :meth:`.Query.cache`.   The cache listens for flushes and commits
+          on this :class:`.Session` in order to invalidate results which
+          are affected by the changes made.
+
+          .. versionadded:: 1.2
+
         :param twophase:  When ``True``, all transactions will be started as
             a "two phase" transaction, i.e. using the "two phase" semantics
             of the database in use along with an XID.  During a
@@ -738,6 +748,9 @@ class Session(_SessionClassMethods):
         self._enable_transaction_accounting = _enable_transaction_accounting
         self.twophase = twophase
         self._query_cls = query_cls
+        self.query_cache = query_cache
+        if query_cache is not None:
+            query_cache._listen(self)
         if info:
             self.info.update(info)
 
@@ -755,6 +768,13 @@ class Session(_SessionClassMethods):
 
     connection_callable = None
 
+    query_cache = None
+    """The :class:`.QueryCache` in use by this :class:`.Session`, if any.
+
+    .. versionadded:: 1.2
+
+    """
+
     transaction = None
     """The current active or inactive :class:`.SessionTransaction`."""
 
@@ -1327,6 +1347,18 @@ class Session(_SessionClassMethods):
 
         return self._query_cls(entities, self, **kwargs)
 
+    def get_many(self, entity, idents):
+        """Return a list of instances of the given mapped class
+        corresponding to the given sequence of primary key identifiers.
+
+        This is a shortcut for ``session.query(entity).get_many(idents)``;
+        see :meth:`.Query.get_many` for details.
+
+        .. versionadded:: 1.2
+
+        """
+        return self.query(entity).get_many(idents)
+
     @property
     @util.contextmanager
     def no_autoflush(self):
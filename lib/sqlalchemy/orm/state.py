@@ -50,6 +50,12 @@ class InstanceState(interfaces.InspectionAttr):
 
     """
 
+    # attributes present on every state are stored in slots; the
+    # remainder are set in the instance dictionary only when they differ
+    # from the class-level default.
+    __slots__ = (
+        '__dict__', '__weakref__', 'class_', 'manager', 'committed_state')
+
     session_id = None
     key = None
     runid = None
@@ -79,9 +85,13 @@ class InstanceState(interfaces.InspectionAttr):
         self.class_ = obj.__class__
         self.manager = manager
         self.obj = weakref.ref(obj, self._cleanup)
-        self.committed_state = {}
         self.expired_attributes = set()
 
+        # the dictionary of attribute values as they were before being
+        # modified; refers to a shared empty dictionary until the first
+        # modification.
+        self.committed_state = util.EMPTY_DICT
+
     expired_attributes = None
     """The set of keys which are 'expired' to be loaded by
        the manager's deferred scalar loader, assuming no pending
@@ -426,12 +436,14 @@ class InstanceState(interfaces.InspectionAttr):
         return self._pending_mutations[key]
 
     def __getstate__(self):
-        state_dict = {'instance': self.obj()}
+        state_dict = {'instance': self.obj(), 'class_': self.class_}
+        if self.committed_state:
+            state_dict['committed_state'] = self.committed_state
         state_dict.update(
             (k, self.__dict__[k]) for k in (
-                'committed_state', '_pending_mutations', 'modified',
+                '_pending_mutations', 'modified',
                 'expired', 'callables', 'key', 'parents', 'load_options',
-                'class_', 'expired_attributes'
+                'expired_attributes'
             ) if k in self.__dict__
         )
         if self.load_path:
@@ -453,7 +465,8 @@ class InstanceState(interfaces.InspectionAttr):
             self.obj = None
             self.class_ = state_dict['class_']
 
-        self.committed_state = state_dict.get('committed_state', {})
+        self.committed_state = state_dict.get(
+            'committed_state', util.EMPTY_DICT)
         self._pending_mutations = state_dict.get('_pending_mutations', {})
         self.parents = state_dict.get('parents', {})
         self.modified = state_dict.get('modified', False)
@@ -521,7 +534,7 @@ class InstanceState(interfaces.InspectionAttr):
 
         if self.modified:
             modified_set.discard(self)
-            self.committed_state.clear()
+            self.committed_state = util.EMPTY_DICT
             self.modified = False
 
         self._strong_obj = None
@@ -571,7 +584,8 @@ class InstanceState(interfaces.InspectionAttr):
             if impl.collection and old is not None:
                 impl._invalidate_collection(old)
 
-            self.committed_state.pop(key, None)
+            if self.committed_state:
+                self.committed_state.pop(key, None)
             if pending:
                 pending.pop(key, None)
 
@@ -651,6 +665,8 @@ class InstanceState(interfaces.InspectionAttr):
 
                     if previous not in (None, NO_VALUE, NEVER_SET):
                         previous = attr.copy(previous)
+                if not self.committed_state:
+                    self.committed_state = {}
                 self.committed_state[attr.key] = previous
 
         # assert self._strong_obj is None or self.modified
@@ -689,8 +705,9 @@ class InstanceState(interfaces.InspectionAttr):
         this step if a value was not populated in state.dict.
 
         """
-        for key in keys:
-            self.committed_state.pop(key, None)
+        if self.committed_state:
+            for key in keys:
+                self.committed_state.pop(key, None)
 
         self.expired = False
 
@@ -732,7 +749,7 @@ class InstanceState(interfaces.InspectionAttr):
         for state, dict_ in iter:
             state_dict = state.__dict__
 
-            state.committed_state.clear()
+            state.committed_state = util.EMPTY_DICT
 
             if '_pending_mutations' in state_dict:
                 del state_dict['_pending_mutations']
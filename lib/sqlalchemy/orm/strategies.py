@@ -12,6 +12,8 @@ from .. import exc as sa_exc, inspect
 from .. import util, log, event
 from ..sql import util as sql_util, visitors
 from .. import sql
+from ..engine import Engine, result as _result
+from ..util import queue as sqla_queue
 from . import (
     attributes, interfaces, exc as orm_exc, loading,
     unitofwork, util as orm_util, query
@@ -25,6 +27,7 @@ from .interfaces import (
 from .base import _SET_DEFERRED_EXPIRED, _DEFER_FOR_STATE
 from .session import _state_session
 import itertools
+import sys
 
 
 def _register_attribute(
@@ -1051,6 +1054,8 @@ class SubqueryLoader(AbstractRelationshipLoader):
         q = q._conditional_options(*orig_query._with_options)
         if orig_query._populate_existing:
             q._populate_existing = orig_query._populate_existing
+        if orig_query._readonly:
+            q._readonly = orig_query._readonly
 
         return q
 
@@ -1753,6 +1758,10 @@ class SelectInLoader(AbstractRelationshipLoader):
 
     _chunksize = 500
 
+    # bound parameters left over for criteria other than the
+    # parent primary keys, when limited by the dialect
+    _reserved_binds = 50
+
     def __init__(self, parent, strategy_key):
         super(SelectInLoader, self).__init__(parent, strategy_key)
         self.join_depth = self.parent_property.join_depth
@@ -1809,13 +1818,38 @@ class SelectInLoader(AbstractRelationshipLoader):
             elif selectin_path_w_prop.contains_mapper(self.mapper):
                 return
 
+        if loadopt is not None:
+            chunksize = loadopt.local_opts.get('chunk_size', None)
+            executor = loadopt.local_opts.get('executor', None)
+        else:
+            chunksize = executor = None
+
         loading.PostLoad.callable_for_path(
             context, selectin_path, self.key,
-            self._load_for_path, effective_entity)
+            self._load_for_path, effective_entity,
+            self._effective_chunksize(chunksize, result.dialect), executor)
+
+    def _effective_chunksize(self, chunksize, dialect):
+        """Return the number of parent primary keys to be loaded per
+        SELECT, limited by the number of bound parameters the dialect
+        accepts in a single statement."""
+
+        if chunksize is None:
+            chunksize = self.parent_property.selectin_chunk_size or \
+                self._chunksize
+
+        limit = dialect.max_bind_parameters
+        if limit is not None:
+            chunksize = min(
+                chunksize,
+                (limit - self._reserved_binds) // len(self._parent_pk_cols)
+            )
+        return max(chunksize, 1)
 
     @util.dependencies("sqlalchemy.ext.baked")
     def _load_for_path(
-            self, baked, context, path, states, load_only, effective_entity):
+            self, baked, context, path, states, load_only, effective_entity,
+            chunksize, executor):
 
         if load_only and self.key not in load_only:
             return
@@ -1857,6 +1891,11 @@ class SelectInLoader(AbstractRelationshipLoader):
                 lambda q: q.populate_existing()
             )
 
+        if orig_query._readonly:
+            q.add_criteria(
+                lambda q: q.readonly()
+            )
+
         if self.parent_property.order_by:
             def _setup_outermost_orderby(q):
                 # imitate the same method that
@@ -1879,18 +1918,35 @@ class SelectInLoader(AbstractRelationshipLoader):
         uselist = self.uselist
         _empty_result = () if uselist else None
 
-        while our_states:
-            chunk = our_states[0:self._chunksize]
-            our_states = our_states[self._chunksize:]
+        chunks = [
+            our_states[i:i + chunksize]
+            for i in range(0, len(our_states), chunksize)
+        ]
+
+        session = context.session
+        if executor is not None and len(chunks) > 1 and \
+                session.transaction is not None:
+            util.warn(
+                "Executor given for selectin loading of %s is not used, "
+                "as the Session is within a transaction; chunks are "
+                "loaded one after the other" % self)
+            executor = None
+
+        if executor is not None and len(chunks) > 1:
+            results = self._execute_chunks_in_parallel(
+                q, session, chunks, executor)
+        else:
+            results = (
+                (chunk, q(session).params(
+                    primary_keys=self._primary_keys(chunk)))
+                for chunk in chunks
+            )
 
+        for chunk, rows in results:
             data = {
                 k: [vv[1] for vv in v]
                 for k, v in itertools.groupby(
-                    q(context.session).params(
-                        primary_keys=[
-                            key[0] if self._zero_idx else key
-                            for key, state, overwrite in chunk]
-                    ),
+                    rows,
                     lambda x: x[0]
                 )
             }
@@ -1914,6 +1970,81 @@ class SelectInLoader(AbstractRelationshipLoader):
                     state.get_impl(self.key).set_committed_value(
                         state, state.dict, collection)
 
+    def _primary_keys(self, chunk):
+        return [
+            key[0] if self._zero_idx else key
+            for key, state, overwrite in chunk]
+
+    def _execute_chunks_in_parallel(self, q, session, chunks, executor):
+        """Execute the SELECT for each chunk using the executor,
+        returning ``(chunk, rows)`` tuples in chunk order.
+
+        As the Session is not within a transaction, each worker
+        executes its chunk on a connection of its own, checked out from
+        the Engine and released once rows are fetched in full.
+        Statements are compiled in the calling thread, so that workers
+        don't interact with the Session itself, and ORM loading takes
+        place after all chunks have completed.  If the Session is bound
+        to a :class:`.Connection` rather than an :class:`.Engine`, chunks
+        are executed one after the other, with a warning.
+
+        """
+        chunk_queries = []
+        for chunk in chunks:
+            query, qcontext = q(session).params(
+                primary_keys=self._primary_keys(chunk))._query_context()
+            bind = query._get_bind_args(qcontext, session.get_bind)
+            chunk_queries.append((chunk, query, qcontext, bind))
+
+        if not all(
+                isinstance(bind, Engine)
+                for chunk, query, qcontext, bind in chunk_queries):
+            util.warn(
+                "Executor given for selectin loading of %s is not used, "
+                "as the Session is bound to a Connection; chunks are "
+                "loaded one after the other" % self)
+            return (
+                (chunk, query._execute_and_instances(qcontext))
+                for chunk, query, qcontext, bind in chunk_queries
+            )
+
+        completed = sqla_queue.Queue()
+
+        def run_chunk(idx, query, qcontext, bind):
+            try:
+                with bind.connect() as conn:
+                    if query._execution_options:
+                        conn = conn.execution_options(
+                            **query._execution_options)
+                    result = _result.FullyBufferedResultProxy(
+                        conn.execute(qcontext.statement, query._params).
+                        context)
+                completed.put((idx, result, None))
+            except Exception:
+                completed.put((idx, None, sys.exc_info()))
+
+        for idx, (chunk, query, qcontext, bind) in enumerate(chunk_queries):
+            executor.submit(run_chunk, idx, query, qcontext, bind)
+
+        # wait for every chunk to complete before raising, so that
+        # no connection is still in use by a worker
+        results = {}
+        exc_info = None
+        for i in range(len(chunk_queries)):
+            idx, result, err = completed.get()
+            results[idx] = result
+            if err is not None and exc_info is None:
+                exc_info = err
+
+        if exc_info is not None:
+            util.reraise(*exc_info)
+
+        return [
+            (chunk, loading.instances(query, results[idx], qcontext))
+            for idx, (chunk, query, qcontext, bind)
+            in enumerate(chunk_queries)
+        ]
+
 
 def single_parent_validator(desc, prop):
     def _do_check(state, value, oldvalue, initiator):
@@ -930,7 +930,7 @@ def subqueryload_all(*keys):
 
 
 @loader_option()
-def selectinload(loadopt, attr):
+def selectinload(loadopt, attr, chunk_size=None, executor=None):
     """Indicate that the given attribute should be loaded using
     SELECT IN eager loading.
 
@@ -951,6 +951,34 @@ def selectinload(loadopt, attr):
         query(Order).options(
             lazyload(Order.items).selectinload(Item.keywords))
 
+        # load the "orders" collection 100 parent rows at a time
+        query(User).options(selectinload(User.orders, chunk_size=100))
+
+    :param chunk_size: maximum number of parent primary key values
+     to be placed in the IN clause of each SELECT; overrides the
+     :paramref:`.relationship.selectin_chunk_size` setting.  The
+     effective size is further limited by the
+     :attr:`.Dialect.max_bind_parameters` of the dialect in use.
+
+     .. versionadded:: 1.2.0
+
+    :param executor: an object with a ``submit()`` method, such as a
+     ``concurrent.futures.ThreadPoolExecutor``.  When more than one
+     chunk is to be loaded and the :class:`.Session` is not within a
+     transaction, i.e. it is in autocommit mode and :meth:`.Session.begin`
+     has not been called, each chunk is executed on its own connection
+     within the executor, rather than one after the other.  Rows are
+     fetched in full by the worker and objects are loaded once all
+     chunks have completed.  The DBAPI connections in use must be
+     usable from a thread other than the one which created them.
+
+     If the :class:`.Session` is within a transaction, or is bound to a
+     :class:`.Connection` rather than an :class:`.Engine`, the executor
+     can't be used; a warning is emitted and the chunks are loaded one
+     after the other on the Session's connection.
+
+     .. versionadded:: 1.2.0
+
     .. versionadded:: 1.2
 
     .. seealso::
@@ -960,17 +988,22 @@ def selectinload(loadopt, attr):
         :ref:`selectin_eager_loading`
 
     """
-    return loadopt.set_relationship_strategy(attr, {"lazy": "selectin"})
+    loader = loadopt.set_relationship_strategy(attr, {"lazy": "selectin"})
+    if chunk_size is not None:
+        loader.local_opts['chunk_size'] = chunk_size
+    if executor is not None:
+        loader.local_opts['executor'] = executor
+    return loader
 
 
 @selectinload._add_unbound_fn
-def selectinload(*keys):
-    return _UnboundLoad._from_keys(_UnboundLoad.selectinload, keys, False, {})
+def selectinload(*keys, **kw):
+    return _UnboundLoad._from_keys(_UnboundLoad.selectinload, keys, False, kw)
 
 
 @selectinload._add_unbound_all_fn
-def selectinload_all(*keys):
-    return _UnboundLoad._from_keys(_UnboundLoad.selectinload, keys, True, {})
+def selectinload_all(*keys, **kw):
+    return _UnboundLoad._from_keys(_UnboundLoad.selectinload, keys, True, kw)
 
 
 @loader_option()
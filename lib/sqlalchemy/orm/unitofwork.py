@@ -330,9 +330,7 @@ class UOWTransaction(object):
                 break
 
         # see if the graph of mapper dependencies has cycles.
-        self.cycles = cycles = topological.find_cycles(
-            self.dependencies,
-            list(self.postsort_actions.values()))
+        self.cycles = cycles = self._sort_mapper_actions()
 
         if cycles:
             # if yes, break the per-mapper actions into
@@ -364,6 +362,57 @@ class UOWTransaction(object):
                     ]
                    ).difference(cycles)
 
+    def _sort_mapper_actions(self):
+        """Find the cycles in the mapper-level graph of actions and,
+        if there are none, establish the order in which the actions
+        are to be executed.
+
+        The mapper-level graph is the same for each flush involving
+        the same mappers and dependency actions, so the result is
+        memoized on the base mappers involved, keyed to the
+        actions and dependencies expressed in terms of the keys of
+        :attr:`.postsort_actions`.
+
+        """
+        rec_keys = dict(
+            (rec, key) for key, rec in self.postsort_actions.items())
+        graph_key = (
+            frozenset(
+                (key, rec.disabled) for rec, key in rec_keys.items()),
+            frozenset(
+                (rec_keys.get(parent), rec_keys.get(child))
+                for parent, child in self.dependencies)
+        )
+        caches = [
+            base_mapper._flush_sort_cache for base_mapper in
+            set(mapper.base_mapper for mapper in self.mappers)]
+
+        for cache in caches:
+            cached = cache.get(graph_key)
+            if cached is not None:
+                break
+        else:
+            cycles = topological.find_cycles(
+                self.dependencies,
+                list(self.postsort_actions.values()))
+            if cycles:
+                sorted_keys = None
+            else:
+                sorted_keys = tuple(
+                    rec_keys[rec] for rec in topological.sort(
+                        self.dependencies,
+                        [rec for rec in rec_keys if not rec.disabled]))
+            cached = (frozenset(rec_keys[rec] for rec in cycles),
+                      sorted_keys)
+            for cache in caches:
+                cache[graph_key] = cached
+
+        cycle_keys, sorted_keys = cached
+        if sorted_keys is not None:
+            self._sorted_actions = [
+                self.postsort_actions[key] for key in sorted_keys]
+        return set(self.postsort_actions[key] for key in cycle_keys)
+
     def execute(self):
         postsort_actions = self._generate_actions()
 
@@ -383,9 +432,7 @@ class UOWTransaction(object):
                     n = set_.pop()
                     n.execute_aggregate(self, set_)
         else:
-            for rec in topological.sort(
-                    self.dependencies,
-                    postsort_actions):
+            for rec in self._sorted_actions:
                 rec.execute(self)
 
     def finalize_flush_changes(self):
@@ -17,6 +17,7 @@ regular DB-API connect() methods to be transparently managed by a
 SQLAlchemy connection pool.
 """
 
+import bisect
 import time
 import traceback
 import weakref
@@ -94,6 +95,98 @@ class _ConnDialect(object):
             "passed to the connection pool.")
 
 
+class PoolMetrics(object):
+    """Counters describing the activity of a :class:`.Pool`.
+
+    An instance of this class is present on every :class:`.Pool` as
+    :attr:`.Pool.metrics`, and is updated inline as connections are
+    checked out, checked in, connected and invalidated.   Reading the
+    counters is cheap and does not require any event listeners to be
+    established.
+
+    Counters are plain attributes incremented without locking, so under
+    concurrent use they are approximate to within a small number of
+    operations.   Checkout wait times include the time taken to establish
+    a new connection, when the pool creates one in order to satisfy the
+    checkout.   Metrics are local to a single :class:`.Pool`; as
+    :meth:`.Engine.dispose` replaces the engine's pool with a new one,
+    counters start again from zero when that method is called.
+
+    .. versionadded:: 1.2
+
+    """
+
+    wait_buckets = (.001, .01, .1, 1, 10)
+    """Upper bounds, in seconds, of the buckets used by
+    :attr:`.PoolMetrics.wait_histogram`.
+
+    The histogram includes one additional bucket for waits longer
+    than the last bound.
+
+    """
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        """Reset all counters to zero."""
+
+        self.checkouts = 0
+        self.checkins = 0
+        self.timeouts = 0
+        self.wait_time = 0.0
+        self.max_wait_time = 0.0
+        self.wait_histogram = [0] * (len(self.wait_buckets) + 1)
+        self.overflow_high_water = 0
+        self.invalidations = 0
+        self.soft_invalidations = 0
+        self.pre_ping_failures = 0
+        self.connects = 0
+        self.connect_time = 0.0
+        self.max_connect_time = 0.0
+
+    def _record_wait(self, elapsed):
+        self.wait_time += elapsed
+        if elapsed > self.max_wait_time:
+            self.max_wait_time = elapsed
+        self.wait_histogram[
+            bisect.bisect_left(self.wait_buckets, elapsed)] += 1
+
+    def _record_connect(self, elapsed):
+        self.connects += 1
+        self.connect_time += elapsed
+        if elapsed > self.max_connect_time:
+            self.max_connect_time = elapsed
+
+    def _record_overflow(self, overflow):
+        if overflow > self.overflow_high_water:
+            self.overflow_high_water = overflow
+
+    def as_dict(self):
+        """Return a dictionary snapshot of the current counters.
+
+        The ``wait_histogram`` key refers to a list of
+        ``(upper_bound, count)`` tuples, where the final bound is ``None``.
+
+        """
+        return {
+            "checkouts": self.checkouts,
+            "checkins": self.checkins,
+            "timeouts": self.timeouts,
+            "wait_time": self.wait_time,
+            "max_wait_time": self.max_wait_time,
+            "wait_histogram": list(
+                zip(self.wait_buckets + (None, ), self.wait_histogram)),
+            "overflow_high_water": self.overflow_high_water,
+            "invalidations": self.invalidations,
+            "soft_invalidations": self.soft_invalidations,
+            "pre_ping_failures": self.pre_ping_failures,
+            "connects": self.connects,
+            "connect_time": self.connect_time,
+            "max_connect_time": self.max_connect_time,
+        }
+
+
 class Pool(log.Identified):
 
     """Abstract base class for connection pools."""
@@ -247,6 +340,7 @@ class Pool(log.Identified):
         self._invalidate_time = 0
         self._use_threadlocal = use_threadlocal
         self._pre_ping = pre_ping
+        self.metrics = PoolMetrics()
         if reset_on_return in ('rollback', True, reset_rollback):
             self._reset_on_return = reset_rollback
         elif reset_on_return in ('none', None, False, reset_none):
@@ -438,6 +532,14 @@ class Pool(log.Identified):
     def status(self):
         raise NotImplementedError()
 
+    metrics = None
+    """A :class:`.PoolMetrics` object tracking checkouts, wait times,
+    timeouts, invalidations and connect latency for this pool.
+
+    .. versionadded:: 1.2
+
+    """
+
 
 class _ConnectionRecord(object):
 
@@ -480,6 +582,8 @@ class _ConnectionRecord(object):
 
     starttime = None
 
+    _checkin_time = 0
+
     connection = None
     """A reference to the actual DBAPI connection being tracked.
 
@@ -528,7 +632,14 @@ class _ConnectionRecord(object):
 
     @classmethod
     def checkout(cls, pool):
-        rec = pool._do_get()
+        metrics = pool.metrics
+        start = time.time()
+        try:
+            rec = pool._do_get()
+        except exc.TimeoutError:
+            metrics.timeouts += 1
+            raise
+        metrics._record_wait(time.time() - start)
         try:
             dbapi_connection = rec.get_connection()
         except:
@@ -544,6 +655,7 @@ class _ConnectionRecord(object):
                 rec, pool, ref, echo)
         )
         _refs.add(rec)
+        metrics.checkouts += 1
         if echo:
             pool.logger.debug("Connection %r checked out from pool",
                               dbapi_connection)
@@ -558,6 +670,7 @@ class _ConnectionRecord(object):
             finalizer(connection)
         if pool.dispatch.checkin:
             pool.dispatch.checkin(connection, self)
+        pool.metrics.checkins += 1
         pool._return_conn(self)
 
     @property
@@ -596,8 +709,10 @@ class _ConnectionRecord(object):
         if self.connection is None:
             return
         if soft:
+            self.__pool.metrics.soft_invalidations += 1
             self.__pool.dispatch.soft_invalidate(self.connection, self, e)
         else:
+            self.__pool.metrics.invalidations += 1
             self.__pool.dispatch.invalidate(self.connection, self, e)
         if e is not None:
             self.__pool.logger.info(
@@ -664,6 +779,7 @@ class _ConnectionRecord(object):
         try:
             self.starttime = time.time()
             connection = pool._invoke_creator(self)
+            pool.metrics._record_connect(time.time() - self.starttime)
             pool.logger.debug("Created new connection %r", connection)
             self.connection = connection
         except Exception as e:
@@ -810,6 +926,7 @@ class _ConnectionFairy(object):
 
                     result = pool._dialect.do_ping(fairy.connection)
                     if not result:
+                        pool.metrics.pre_ping_failures += 1
                         if fairy._echo:
                             pool.logger.debug(
                                 "Pool pre-ping on connection %s failed, "
@@ -1103,6 +1220,7 @@ class QueuePool(Pool):
     """
 
     def __init__(self, creator, pool_size=5, max_overflow=10, timeout=30,
+                 use_lifo=False, idle_timeout=None, min_size=0,
                  **kw):
         r"""
         Construct a QueuePool.
@@ -1135,6 +1253,34 @@ class QueuePool(Pool):
         :param timeout: The number of seconds to wait before giving up
           on returning a connection. Defaults to 30.
 
+        :param use_lifo: use LIFO (last-in-first-out) when retrieving
+          connections instead of FIFO (first-in-first-out). Using LIFO, a
+          server-side timeout scheme can reduce the number of connections
+          used during non-peak periods of use.   When planning for
+          server-side timeouts, ensure that a recycle or pre-ping strategy
+          is in use to gracefully handle stale connections.
+
+          .. versionadded:: 1.2.0
+
+        :param idle_timeout: when set to a number of seconds, connections
+          which have remained in the pool without being checked out for
+          longer than this period are closed when a connection is next
+          checked out, so that the pool shrinks during periods of lower
+          use.  Connections are closed starting with those which have been
+          idle longest, and only while the total number of connections
+          held by the pool exceeds ``min_size``.  Most useful in
+          conjunction with ``use_lifo``, as a FIFO pool cycles through
+          all of its connections.  Defaults to None, meaning idle
+          connections are not closed.
+
+          .. versionadded:: 1.2.0
+
+        :param min_size: the number of connections, checked in or checked
+          out, below which ``idle_timeout`` will not close connections.
+          Defaults to zero.
+
+          .. versionadded:: 1.2.0
+
         :param \**kw: Other keyword arguments including
           :paramref:`.Pool.recycle`, :paramref:`.Pool.echo`,
           :paramref:`.Pool.reset_on_return` and others are passed to the
@@ -1142,13 +1288,17 @@ class QueuePool(Pool):
 
         """
         Pool.__init__(self, creator, **kw)
-        self._pool = sqla_queue.Queue(pool_size)
+        self._pool = sqla_queue.Queue(pool_size, use_lifo=use_lifo)
         self._overflow = 0 - pool_size
         self._max_overflow = max_overflow
         self._timeout = timeout
+        self._idle_timeout = idle_timeout
+        self._min_size = min_size
         self._overflow_lock = threading.Lock()
 
     def _do_return_conn(self, conn):
+        if self._idle_timeout is not None:
+            conn._checkin_time = time.time()
         try:
             self._pool.put(conn, False)
         except sqla_queue.Full:
@@ -1157,7 +1307,36 @@ class QueuePool(Pool):
             finally:
                 self._dec_overflow()
 
+    def _trim_idle(self):
+        """Close connections which have been checked in for longer than
+        the idle timeout, oldest first, while the pool holds more than
+        ``min_size`` connections."""
+
+        cutoff = time.time() - self._idle_timeout
+        to_close = []
+        queue = self._pool
+
+        with queue.mutex:
+            # the queue always appends on the right, so the leftmost
+            # record is the one that was checked in longest ago,
+            # whether or not LIFO is in use.
+            records = queue.queue
+            while records and \
+                    records[0]._checkin_time < cutoff and \
+                    queue.maxsize + self._overflow > self._min_size:
+                to_close.append(records.popleft())
+                self._dec_overflow()
+
+        for rec in to_close:
+            self.logger.info(
+                "Closing connection %r idle for more than %s seconds",
+                rec.connection, self._idle_timeout)
+            rec.close()
+
     def _do_get(self):
+        if self._idle_timeout is not None:
+            self._trim_idle()
+
         use_overflow = self._max_overflow > -1
 
         try:
@@ -1185,10 +1364,12 @@ class QueuePool(Pool):
     def _inc_overflow(self):
         if self._max_overflow == -1:
             self._overflow += 1
+            self.metrics._record_overflow(self._overflow)
             return True
         with self._overflow_lock:
             if self._overflow < self._max_overflow:
                 self._overflow += 1
+                self.metrics._record_overflow(self._overflow)
                 return True
             else:
                 return False
@@ -1206,6 +1387,9 @@ class QueuePool(Pool):
         return self.__class__(self._creator, pool_size=self._pool.maxsize,
                               max_overflow=self._max_overflow,
                               timeout=self._timeout,
+                              use_lifo=self._pool.use_lifo,
+                              idle_timeout=self._idle_timeout,
+                              min_size=self._min_size,
                               recycle=self._recycle, echo=self.echo,
                               logging_name=self._orig_logging_name,
                               use_threadlocal=self._use_threadlocal,
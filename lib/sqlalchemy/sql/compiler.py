@@ -24,6 +24,7 @@ To generate user-defined SQL strings, see
 """
 
 import contextlib
+import copy
 import re
 from . import schema, sqltypes, operators, functions, visitors, \
     elements, selectable, crud
@@ -339,6 +340,15 @@ class SQLCompiler(Compiled):
     either implicitly or explicitly
     """
 
+    insert_single_values_expr = None
+    """When an INSERT is compiled with a single set of parameters inside
+    a VALUES expression, the string is assigned here, where it can be
+    used for insert batching schemes to rewrite the VALUES expression.
+
+    .. versionadded:: 1.2.0
+
+    """
+
     returning_precedes_values = False
     """set to True classwide to generate RETURNING
     clauses before the VALUES or WHERE clause (i.e. MSSQL)
@@ -385,6 +395,13 @@ class SQLCompiler(Compiled):
 
     """
 
+    _structurally_cacheable = True
+    """
+    if False, the compiled form embeds state that isn't represented by the
+    statement's cache key, such as bound values rendered inline, and may
+    not be shared with other statements of the same structure.
+    """
+
     insert_prefetch = update_prefetch = ()
 
     def __init__(self, dialect, statement, column_keys=None,
@@ -574,6 +591,70 @@ class SQLCompiler(Compiled):
         compiled object, for those values that are present."""
         return self.construct_params(_check=False)
 
+    def _supports_structural_cache(self, key_elements):
+        """Return True if this compiled object may be shared among
+        statements that produce the same cache key, given the
+        list of elements generated along with the key."""
+
+        if not self._structurally_cacheable:
+            return False
+        for element in key_elements:
+            if isinstance(element, elements._CacheKeyLiteral):
+                bind = self.binds.get(element.key)
+                if bind is None or not bind._is_crud or \
+                        bind.value is not element.value:
+                    return False
+        return True
+
+    def _adapt_to_statement(self, statement, key_elements, new_key_elements):
+        """Return a copy of this compiled object that refers to the
+        given statement, which produces the same cache key as the
+        compiled statement.
+
+        ``key_elements`` and ``new_key_elements`` are the element lists
+        generated along with the cache keys of the compiled and the new
+        statement, respectively; bound parameters and result columns
+        are re-targeted at their counterparts in the new statement.
+
+        """
+        translate = dict(
+            (id(orig), new)
+            for orig, new in zip(key_elements, new_key_elements))
+
+        compiled = copy.copy(self)
+        compiled.statement = statement
+        compiled._cached_metadata = None
+
+        bind_names = util.column_dict()
+        binds = {}
+        for bindparam, name in self.bind_names.items():
+            bind_names[translate.get(id(bindparam), bindparam)] = name
+        for name, bindparam in self.binds.items():
+            binds[name] = translate.get(id(bindparam), bindparam)
+
+        for orig, new in zip(key_elements, new_key_elements):
+            if isinstance(orig, elements._CacheKeyLiteral):
+                bindparam = self.binds[orig.key]
+                new_bind = bindparam._with_value(new.value)
+                bind_names[new_bind] = bind_names.pop(bindparam)
+                for name, existing in list(binds.items()):
+                    if existing is bindparam:
+                        binds[name] = new_bind
+
+        compiled.bind_names = bind_names
+        compiled.binds = binds
+
+        compiled._result_columns = [
+            (keyname, name, tuple(
+                translate.get(id(obj), obj) for obj in objects), type_)
+            for keyname, name, objects, type_ in self._result_columns
+        ]
+        if self.returning is not None:
+            compiled.returning = [
+                translate.get(id(col), col) for col in self.returning]
+
+        return compiled
+
     @util.dependencies("sqlalchemy.engine.result")
     def _create_result_map(self, result):
         """utility method used for unit tests only."""
@@ -1258,6 +1339,7 @@ class SQLCompiler(Compiled):
             name, expanding=bindparam.expanding, **kwargs)
 
     def render_literal_bindparam(self, bindparam, **kw):
+        self._structurally_cacheable = False
         value = bindparam.effective_value
         return self.render_literal_value(value, bindparam.type)
 
@@ -1567,6 +1649,9 @@ class SQLCompiler(Compiled):
         (i.e. sqlite < 3.7.16).
 
         """
+        # elements are cloned here and can't be re-targeted
+        self._structurally_cacheable = False
+
         cloned = {}
         column_translate = [{}]
 
@@ -2087,8 +2172,10 @@ class SQLCompiler(Compiled):
                 )
             )
         else:
-            text += " VALUES (%s)" % \
-                ', '.join([c[1] for c in crud_params])
+            insert_single_values_expr = ', '.join([c[1] for c in crud_params])
+            text += " VALUES (%s)" % insert_single_values_expr
+            if toplevel:
+                self.insert_single_values_expr = insert_single_values_expr
 
         if insert_stmt._post_values_clause is not None:
             post_values_clause = self.process(
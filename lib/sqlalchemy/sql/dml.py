@@ -12,9 +12,11 @@ Provide :class:`.Insert`, :class:`.Update` and :class:`.Delete`.
 from .base import Executable, _generative, _from_objects, DialectKWArgs, \
     ColumnCollection
 from .elements import ClauseElement, _literal_as_text, Null, and_, _clone, \
-    _column_as_key
+    BindParameter, _column_as_key, _is_literal, _NoCacheKey, \
+    _CacheKeyLiteral, _cache_key_for_clauses, _cache_key_for_optional, \
+    _cache_key_for_from, _cache_key_for_reference
 from .selectable import _interpret_as_from, _interpret_as_select, \
-    HasPrefixes, HasCTE
+    HasPrefixes, HasCTE, _prefix_cache_key
 from .. import util
 from .. import exc
 
@@ -184,6 +186,30 @@ class UpdateBase(
         self._hints = self._hints.union(
             {(selectable, dialect_name): text})
 
+    def _cache_key(self, anon_map, elements):
+        elements.append(self)
+
+        dialect_kwargs = []
+        for name, value in sorted(self.dialect_kwargs.items()):
+            if isinstance(value, ClauseElement):
+                value = value._cache_key(anon_map, elements)
+            dialect_kwargs.append((name, value))
+
+        return (
+            self.__class__,
+            _cache_key_for_from(self.table, anon_map, elements),
+            _cache_key_for_optional(
+                getattr(self, '_whereclause', None), anon_map, elements),
+            self._returning is not None and
+            _cache_key_for_clauses(self._returning, anon_map, elements),
+            _prefix_cache_key(self._prefixes, anon_map, elements),
+            frozenset(
+                (_cache_key_for_reference(f, anon_map), dialect, text)
+                for (f, dialect), text in self._hints.items()),
+            tuple(dialect_kwargs),
+            tuple(sorted(self._execution_options.items()))
+        )
+
 
 class ValuesBase(UpdateBase):
     """Supplies support for :meth:`.ValuesBase.values` to
@@ -197,6 +223,78 @@ class ValuesBase(UpdateBase):
     select = None
     _post_values_clause = None
 
+    def _cache_key(self, anon_map, elements):
+        key = super(ValuesBase, self)._cache_key(anon_map, elements)
+
+        if self._return_defaults in (True, False, None):
+            return_defaults = self._return_defaults
+        else:
+            return_defaults = _cache_key_for_clauses(
+                self._return_defaults, anon_map, elements)
+
+        return key + (
+            self._parameters_cache_key(anon_map, elements),
+            self._preserve_parameter_order,
+            self._parameter_ordering is not None and tuple(
+                _column_as_key(k) for k in self._parameter_ordering),
+            _cache_key_for_optional(self.select, anon_map, elements),
+            getattr(self, 'select_names', None) is not None and tuple(
+                _column_as_key(n) for n in self.select_names),
+            getattr(self, 'include_insert_from_select_defaults', False),
+            self.inline,
+            return_defaults,
+            _cache_key_for_optional(
+                self._post_values_clause, anon_map, elements)
+        )
+
+    def _parameters_cache_key(self, anon_map, elements):
+        """Return the cache key for the SET/VALUES parameters.
+
+        Literal values are rendered by the compiler as bound parameters
+        named after their column, so only their presence is part of the
+        key; the values themselves are added to the element list
+        as :class:`._CacheKeyLiteral` objects.
+
+        """
+        if self.parameters is None:
+            return None
+        elif self._has_multi_parameters:
+            raise _NoCacheKey(self)
+
+        entries = []
+        for k, value in self.parameters.items():
+            colkey = _column_as_key(k)
+            if colkey is None or not isinstance(
+                    k, util.string_types + (ClauseElement, )):
+                raise _NoCacheKey(self)
+
+            if isinstance(k, util.string_types):
+                param_key = colkey
+            else:
+                if getattr(k, 'table', None) is not self.table:
+                    # multi-table UPDATE; parameter names are qualified
+                    # by table name
+                    raise _NoCacheKey(self)
+                param_key = k._cache_key(anon_map, elements)
+
+            entries.append((colkey, param_key, value))
+
+        key = []
+        for colkey, param_key, value in sorted(
+                entries, key=lambda entry: entry[0]):
+            if _is_literal(value):
+                elements.append(_CacheKeyLiteral(colkey, value))
+                key.append((param_key, _CacheKeyLiteral))
+            elif isinstance(value, BindParameter) and \
+                    value.type._isnull and \
+                    (value.value is not None or value.callable is not None):
+                # the compiler assigns the column's type to a copy
+                # of the parameter, which would retain this value
+                raise _NoCacheKey(self)
+            else:
+                key.append((param_key, value._cache_key(anon_map, elements)))
+        return tuple(key)
+
     def __init__(self, table, values, prefixes):
         self.table = _interpret_as_from(table)
         self.parameters, self._has_multi_parameters = \
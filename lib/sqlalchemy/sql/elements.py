@@ -350,6 +350,49 @@ class ClauseElement(Visitable):
         """
         return []
 
+    def _generate_cache_key(self):
+        """Return a structural cache key for this :class:`.ClauseElement`.
+
+        The return value is a tuple ``(key, elements)``, where ``key`` is a
+        hashable structure which is equal for any two statements that
+        would produce the same SQL string, regardless of the literal values
+        present in their bound parameters, and ``elements`` is the list of
+        elements which were used to produce the key, in traversal order.
+        Two statements with equal keys have ``elements`` lists which
+        correspond to each other positionally; this is used to apply a
+        :class:`.Compiled` object produced for one statement to the other.
+
+        Returns ``None`` if this element, or any element it contains,
+        does not support structural cache keys.
+
+        .. versionadded:: 1.2
+
+        """
+        elements = []
+        try:
+            key = self._cache_key({}, elements)
+            hash(key)
+        except (_NoCacheKey, TypeError):
+            return None
+        return key, elements
+
+    def _cache_key(self, anon_map, elements):
+        """Return the structural cache key for this element.
+
+        ``anon_map`` is a dictionary shared across a single key generation,
+        used to number anonymous names in order of appearance as well as to
+        number FROM objects, so that a FROM object referred to more than once
+        is keyed as a reference to its first appearance.
+        ``elements`` is a list to which each structurally-keyed element is
+        appended.
+
+        The default implementation raises, indicating that the element
+        doesn't support structural caching; such statements fall back
+        to being cached by identity.
+
+        """
+        raise _NoCacheKey(self)
+
     def self_group(self, against=None):
         """Apply a 'grouping' to this :class:`.ClauseElement`.
 
@@ -1174,6 +1217,17 @@ class BindParameter(ColumnElement):
             and self.value == other.value \
             and self.callable == other.callable
 
+    def _cache_key(self, anon_map, elements):
+        # the value is not part of the key; it's delivered at execution
+        # time from the bindparam located in the "elements" list
+        elements.append(self)
+        return (
+            self.__class__,
+            _cache_key_for_name(self.key, anon_map),
+            self.type._static_cache_key,
+            self.unique, self.required, self.expanding, self.isoutparam
+        )
+
     def __getstate__(self):
         """execute a deferred value for serialization purposes."""
 
@@ -1185,6 +1239,15 @@ class BindParameter(ColumnElement):
         d['value'] = v
         return d
 
+    def __setstate__(self, state):
+        """generate a new unique key, as the pickled key is derived
+        from the id() of the original object."""
+
+        self.__dict__.update(state)
+        if self.unique:
+            self.key = self._identifying_key = _anonymous_label(
+                '%%(%d %s)s' % (id(self), self._orig_key or 'param'))
+
     def __repr__(self):
         return 'BindParameter(%r, %r, type_=%r)' % (self.key,
                                                     self.value, self.type)
@@ -1202,6 +1265,9 @@ class TypeClause(ClauseElement):
     def __init__(self, type):
         self.type = type
 
+    def _cache_key(self, anon_map, elements):
+        return (self.__class__, self.type._static_cache_key)
+
 
 class TextClause(Executable, ClauseElement):
     """Represent a literal SQL text fragment.
@@ -1640,6 +1706,18 @@ class TextClause(Executable, ClauseElement):
     def compare(self, other):
         return isinstance(other, TextClause) and other.text == self.text
 
+    def _cache_key(self, anon_map, elements):
+        elements.append(self)
+        return (
+            self.__class__, self.text,
+            tuple(
+                (name, self._bindparams[name]._cache_key(anon_map, elements))
+                for name in sorted(self._bindparams)
+            ),
+            self.type._static_cache_key,
+            tuple(sorted(self._execution_options.items()))
+        )
+
 
 class Null(ColumnElement):
     """Represent the NULL keyword in a SQL statement.
@@ -1651,6 +1729,9 @@ class Null(ColumnElement):
 
     __visit_name__ = 'null'
 
+    def _cache_key(self, anon_map, elements):
+        return (self.__class__, )
+
     @util.memoized_property
     def type(self):
         return type_api.NULLTYPE
@@ -1675,6 +1756,9 @@ class False_(ColumnElement):
 
     __visit_name__ = 'false'
 
+    def _cache_key(self, anon_map, elements):
+        return (self.__class__, )
+
     @util.memoized_property
     def type(self):
         return type_api.BOOLEANTYPE
@@ -1734,6 +1818,9 @@ class True_(ColumnElement):
 
     __visit_name__ = 'true'
 
+    def _cache_key(self, anon_map, elements):
+        return (self.__class__, )
+
     @util.memoized_property
     def type(self):
         return type_api.BOOLEANTYPE
@@ -1837,6 +1924,13 @@ class ClauseList(ClauseElement):
     def get_children(self, **kwargs):
         return self.clauses
 
+    def _cache_key(self, anon_map, elements):
+        elements.append(self)
+        return (
+            self.__class__, self.operator, self.group, self.group_contents,
+            _cache_key_for_clauses(self.clauses, anon_map, elements)
+        )
+
     @property
     def _from_objects(self):
         return list(itertools.chain(*[c._from_objects for c in self.clauses]))
@@ -2043,6 +2137,10 @@ class Tuple(ClauseList, ColumnElement):
     def _select_iterable(self):
         return (self, )
 
+    def _cache_key(self, anon_map, elements):
+        return ClauseList._cache_key(self, anon_map, elements) + \
+            (self.type._static_cache_key, )
+
     def _bind_param(self, operator, obj, type_=None):
         return Tuple(*[
             BindParameter(None, o, _compared_to_operator=operator,
@@ -2252,6 +2350,20 @@ class Case(ColumnElement):
         if self.else_ is not None:
             yield self.else_
 
+    def _cache_key(self, anon_map, elements):
+        elements.append(self)
+        return (
+            self.__class__,
+            _cache_key_for_optional(self.value, anon_map, elements),
+            tuple(
+                (x._cache_key(anon_map, elements),
+                 y._cache_key(anon_map, elements))
+                for x, y in self.whens
+            ),
+            _cache_key_for_optional(self.else_, anon_map, elements),
+            self.type._static_cache_key if self.type is not None else None
+        )
+
     @property
     def _from_objects(self):
         return list(itertools.chain(*[x._from_objects for x in
@@ -2373,6 +2485,14 @@ class Cast(ColumnElement):
     def get_children(self, **kwargs):
         return self.clause, self.typeclause
 
+    def _cache_key(self, anon_map, elements):
+        elements.append(self)
+        return (
+            self.__class__,
+            self.clause._cache_key(anon_map, elements),
+            self.type._static_cache_key
+        )
+
     @property
     def _from_objects(self):
         return self.clause._from_objects
@@ -2467,6 +2587,17 @@ class TypeCoerce(ColumnElement):
     def get_children(self, **kwargs):
         return self.clause,
 
+    def _cache_key(self, anon_map, elements):
+        elements.append(self)
+        # key on the typed expression, which is what's compiled; when
+        # the clause is a bound parameter, this is a copy of it that
+        # will be the one present in the compiled result
+        return (
+            self.__class__,
+            self.typed_expression._cache_key(anon_map, elements),
+            self.type._static_cache_key
+        )
+
     @property
     def _from_objects(self):
         return self.clause._from_objects
@@ -2504,6 +2635,13 @@ class Extract(ColumnElement):
     def get_children(self, **kwargs):
         return self.expr,
 
+    def _cache_key(self, anon_map, elements):
+        elements.append(self)
+        return (
+            self.__class__, self.field,
+            self.expr._cache_key(anon_map, elements)
+        )
+
     @property
     def _from_objects(self):
         return self.expr._from_objects
@@ -2529,6 +2667,10 @@ class _label_reference(ColumnElement):
     def _copy_internals(self, clone=_clone, **kw):
         self.element = clone(self.element, **kw)
 
+    def _cache_key(self, anon_map, elements):
+        elements.append(self)
+        return (self.__class__, self.element._cache_key(anon_map, elements))
+
     @property
     def _from_objects(self):
         return ()
@@ -2540,6 +2682,10 @@ class _textual_label_reference(ColumnElement):
     def __init__(self, element):
         self.element = element
 
+    def _cache_key(self, anon_map, elements):
+        elements.append(self)
+        return (self.__class__, self.element)
+
     @util.memoized_property
     def _text_clause(self):
         return TextClause._create_text(self.element)
@@ -2792,6 +2938,15 @@ class UnaryExpression(ColumnElement):
     def get_children(self, **kwargs):
         return self.element,
 
+    def _cache_key(self, anon_map, elements):
+        elements.append(self)
+        return (
+            self.__class__, self.operator, self.modifier,
+            self.wraps_column_expression,
+            self.element._cache_key(anon_map, elements),
+            self.type._static_cache_key
+        )
+
     def compare(self, other, **kw):
         """Compare this :class:`UnaryExpression` against the given
         :class:`.ClauseElement`."""
@@ -2991,6 +3146,16 @@ class BinaryExpression(ColumnElement):
     def get_children(self, **kwargs):
         return self.left, self.right
 
+    def _cache_key(self, anon_map, elements):
+        elements.append(self)
+        return (
+            self.__class__, self.operator,
+            self.left._cache_key(anon_map, elements),
+            self.right._cache_key(anon_map, elements),
+            tuple(sorted(self.modifiers.items())),
+            self.type._static_cache_key
+        )
+
     def compare(self, other, **kw):
         """Compare this :class:`BinaryExpression` against the
         given :class:`BinaryExpression`."""
@@ -3047,6 +3212,9 @@ class Slice(ColumnElement):
         assert against is operator.getitem
         return self
 
+    def _cache_key(self, anon_map, elements):
+        return (self.__class__, self.start, self.stop, self.step)
+
 
 class IndexExpression(BinaryExpression):
     """Represent the class of expressions that are like an "index" operation.
@@ -3080,6 +3248,14 @@ class Grouping(ColumnElement):
     def get_children(self, **kwargs):
         return self.element,
 
+    def _cache_key(self, anon_map, elements):
+        elements.append(self)
+        return (
+            self.__class__,
+            self.element._cache_key(anon_map, elements),
+            self.type._static_cache_key
+        )
+
     @property
     def _from_objects(self):
         return self.element._from_objects
@@ -3288,6 +3464,16 @@ class Over(ColumnElement):
         if self.order_by is not None:
             self.order_by = clone(self.order_by, **kw)
 
+    def _cache_key(self, anon_map, elements):
+        elements.append(self)
+        return (
+            self.__class__,
+            self.element._cache_key(anon_map, elements),
+            _cache_key_for_optional(self.partition_by, anon_map, elements),
+            _cache_key_for_optional(self.order_by, anon_map, elements),
+            self.range_, self.rows
+        )
+
     @property
     def _from_objects(self):
         return list(itertools.chain(
@@ -3387,6 +3573,14 @@ class WithinGroup(ColumnElement):
         if self.order_by is not None:
             self.order_by = clone(self.order_by, **kw)
 
+    def _cache_key(self, anon_map, elements):
+        elements.append(self)
+        return (
+            self.__class__,
+            self.element._cache_key(anon_map, elements),
+            _cache_key_for_optional(self.order_by, anon_map, elements)
+        )
+
     @property
     def _from_objects(self):
         return list(itertools.chain(
@@ -3502,6 +3696,14 @@ class FunctionFilter(ColumnElement):
         if self.criterion is not None:
             self.criterion = clone(self.criterion, **kw)
 
+    def _cache_key(self, anon_map, elements):
+        elements.append(self)
+        return (
+            self.__class__,
+            self.func._cache_key(anon_map, elements),
+            _cache_key_for_optional(self.criterion, anon_map, elements)
+        )
+
     @property
     def _from_objects(self):
         return list(itertools.chain(
@@ -3602,6 +3804,18 @@ class Label(ColumnElement):
     def get_children(self, **kwargs):
         return self.element,
 
+    def _cache_key(self, anon_map, elements):
+        elements.append(self)
+        resolve_label = getattr(self, '_resolve_label', None)
+        return (
+            self.__class__,
+            _cache_key_for_name(self.name, anon_map),
+            resolve_label is not None and
+            _cache_key_for_name(resolve_label, anon_map),
+            self.element._cache_key(anon_map, elements),
+            self.type._static_cache_key
+        )
+
     def _copy_internals(self, clone=_clone, anonymize_labels=False, **kw):
         self._element = clone(self._element, **kw)
         self.__dict__.pop('element', None)
@@ -3854,6 +4068,20 @@ class ColumnClause(Immutable, ColumnElement):
                              type_=type_,
                              unique=True)
 
+    def _cache_key(self, anon_map, elements):
+        elements.append(self)
+        table = self.table
+        return (
+            self.__class__,
+            _cache_key_for_name(self.name, anon_map),
+            self.key != self.name and
+            _cache_key_for_name(self.key, anon_map),
+            self.is_literal,
+            table is not None and
+            _cache_key_for_from(table, anon_map, elements),
+            self.type._static_cache_key
+        )
+
     def _make_proxy(self, selectable, name=None, attach=True,
                     name_is_truncatable=False, **kw):
         # propagate the "is_literal" flag only if we are keeping our name,
@@ -4139,6 +4367,92 @@ def _string_or_unprintable(element):
             return "unprintable element %r" % element
 
 
+class _NoCacheKey(Exception):
+    """Raised within cache key generation when an element that doesn't
+    support structural caching is encountered."""
+
+
+class _CacheKeyLiteral(object):
+    """Represent a literal value which is embedded in a construct without
+    a :class:`.BindParameter`, such as a value passed to
+    :meth:`.ValuesBase.values`, as an entry in a cache key's list of
+    elements.
+
+    The ``key`` is the name of the bound parameter that the compiler will
+    generate for the value.
+
+    """
+
+    __slots__ = 'key', 'value'
+
+    def __init__(self, key, value):
+        self.key = key
+        self.value = value
+
+
+def _cache_key_for_name(name, anon_map):
+    """Return a cache key for a name, numbering anonymous names
+    in order of appearance."""
+
+    if isinstance(name, _anonymous_label):
+        try:
+            return anon_map[name]
+        except KeyError:
+            key = anon_map[name] = (
+                'anon', _cache_key_counter(anon_map, 'anon'))
+            return key
+    else:
+        return name, name.__class__, getattr(name, 'quote', None)
+
+
+def _cache_key_for_clauses(clauses, anon_map, elements):
+    return tuple(
+        clause._cache_key(anon_map, elements) for clause in clauses)
+
+
+def _cache_key_for_optional(clause, anon_map, elements):
+    if clause is None:
+        return None
+    else:
+        return clause._cache_key(anon_map, elements)
+
+
+def _cache_key_counter(anon_map, kind):
+    """Return the next number of the given kind within the current key
+    generation."""
+
+    counter_key = ('count', kind)
+    num = anon_map.get(counter_key, 0)
+    anon_map[counter_key] = num + 1
+    return num
+
+
+def _cache_key_for_from(fromclause, anon_map, elements):
+    """Return the cache key for a FROM object.
+
+    FROM objects are typically referred to by many columns; each one after
+    its first appearance is keyed as a reference to that appearance, so
+    that a statement which refers to the same FROM object twice has a
+    different key than one which refers to two equivalent FROM objects.
+
+    """
+
+    memo_key = ('from', id(fromclause))
+    try:
+        return ('from_ref', anon_map[memo_key])
+    except KeyError:
+        anon_map[memo_key] = _cache_key_counter(anon_map, 'from')
+        return fromclause._cache_key(anon_map, elements)
+
+
+def _cache_key_for_reference(fromclause, anon_map):
+    """Return the cache key for a FROM object that is only referred to,
+    such as within a correlation or hint collection, without adding
+    its elements to the element list."""
+
+    return _cache_key_for_from(fromclause, dict(anon_map), [])
+
+
 def _expand_cloned(elements):
     """expand the given set of ClauseElements to be the set of all 'cloned'
     predecessors.
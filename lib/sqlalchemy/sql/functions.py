@@ -178,6 +178,17 @@ class FunctionElement(Executable, ColumnElement, FromClause):
         self._reset_exported()
         FunctionElement.clauses._reset(self)
 
+    def _cache_key(self, anon_map, elements):
+        elements.append(self)
+        return (
+            self.__class__,
+            getattr(self, 'name', None),
+            tuple(getattr(self, 'packagenames', ())),
+            self.clause_expr._cache_key(anon_map, elements),
+            self.type._static_cache_key,
+            tuple(sorted(self._execution_options.items()))
+        )
+
     def within_group_type(self, within_group):
         """For types that define their return type as based on the criteria
         within a WITHIN GROUP (ORDER BY) expression, called by the
@@ -562,6 +573,9 @@ class next_value(GenericFunction):
         self._bind = kw.get('bind', None)
         self.sequence = seq
 
+    def _cache_key(self, anon_map, elements):
+        return (self.__class__, id(self.sequence))
+
     @property
     def _from_objects(self):
         return []
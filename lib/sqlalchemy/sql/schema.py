@@ -495,6 +495,7 @@ class Table(DialectKWArgs, SchemaItem, TableClause):
         # this argument is only used with _init_existing()
         kwargs.pop('autoload_replace', True)
         _extend_on = kwargs.pop("_extend_on", None)
+        _reflect_inspector = kwargs.pop("_reflect_inspector", None)
 
         include_columns = kwargs.pop('include_columns', None)
 
@@ -519,16 +520,26 @@ class Table(DialectKWArgs, SchemaItem, TableClause):
         if autoload:
             self._autoload(
                 metadata, autoload_with,
-                include_columns, _extend_on=_extend_on)
+                include_columns, _extend_on=_extend_on,
+                _reflect_inspector=_reflect_inspector)
 
         # initialize all the column, etc. objects.  done after reflection to
         # allow user-overrides
         self._init_items(*args)
 
     def _autoload(self, metadata, autoload_with, include_columns,
-                  exclude_columns=(), _extend_on=None):
-
-        if autoload_with:
+                  exclude_columns=(), _extend_on=None,
+                  _reflect_inspector=None):
+
+        if _reflect_inspector is not None:
+            # an Inspector shared among several Table objects, e.g. by
+            # MetaData.reflect(), which has already fetched the
+            # information for many tables at once
+            _reflect_inspector.reflecttable(
+                self, include_columns, exclude_columns,
+                _extend_on=_extend_on
+            )
+        elif autoload_with:
             autoload_with.run_callable(
                 autoload_with.dialect.reflecttable,
                 self, include_columns, exclude_columns,
@@ -575,6 +586,7 @@ class Table(DialectKWArgs, SchemaItem, TableClause):
         autoload_replace = kwargs.pop('autoload_replace', True)
         schema = kwargs.pop('schema', None)
         _extend_on = kwargs.pop('_extend_on', None)
+        _reflect_inspector = kwargs.pop('_reflect_inspector', None)
 
         if schema and schema != self.schema:
             raise exc.ArgumentError(
@@ -608,7 +620,8 @@ class Table(DialectKWArgs, SchemaItem, TableClause):
                 exclude_columns = ()
             self._autoload(
                 self.metadata, autoload_with,
-                include_columns, exclude_columns, _extend_on=_extend_on)
+                include_columns, exclude_columns, _extend_on=_extend_on,
+                _reflect_inspector=_reflect_inspector)
 
         self._extra_kwargs(**kwargs)
         self._init_items(*args)
@@ -739,6 +752,11 @@ class Table(DialectKWArgs, SchemaItem, TableClause):
             else:
                 return []
 
+    def _cache_key(self, anon_map, elements):
+        # a Table is keyed on identity; the column names are included
+        # so that columns appended after the fact produce a new key.
+        return (id(self._deannotate()), tuple(self._columns.keys()))
+
     def exists(self, bind=None):
         """Return True if this table exists."""
 
@@ -1489,6 +1507,12 @@ class Column(SchemaItem, ColumnClause):
         else:
             return ColumnClause.get_children(self, **kwargs)
 
+    def _cache_key(self, anon_map, elements):
+        if isinstance(self.table, Table):
+            return (id(self._deannotate()), )
+        else:
+            return ColumnClause._cache_key(self, anon_map, elements)
+
 
 class ForeignKey(DialectKWArgs, SchemaItem):
     """Defines a dependency between two columns.
@@ -3789,6 +3813,7 @@ class MetaData(SchemaItem):
     def reflect(self, bind=None, schema=None, views=False, only=None,
                 extend_existing=False,
                 autoload_replace=True,
+                reflection_cache=None,
                 **dialect_kwargs):
         r"""Load all available table definitions from the database.
 
@@ -3834,6 +3859,14 @@ class MetaData(SchemaItem):
 
           .. versionadded:: 0.9.1
 
+        :param reflection_cache: an optional
+          :class:`~sqlalchemy.engine.reflection.ReflectionCache`, which
+          stores the information fetched from the database catalog in a
+          file, so that subsequent calls, typically in other processes,
+          don't need to query the catalog while the schema is unchanged.
+
+          .. versionadded:: 1.2
+
         :param \**dialect_kwargs: Additional keyword arguments not mentioned
          above are dialect specific, and passed in the form
          ``<dialectname>_<argname>``.  See the documentation regarding an
@@ -3867,12 +3900,20 @@ class MetaData(SchemaItem):
             if schema is not None:
                 reflect_opts['schema'] = schema
 
+            # a single Inspector serves all the reflection below, so that
+            # information is fetched for many tables at once, and can be
+            # restored from / saved to a reflection cache
+            insp = inspection.inspect(conn)
+            if reflection_cache is not None:
+                fingerprint, insp.info_cache = reflection_cache._load(
+                    conn, schema)
+                cached_keys = set(insp.info_cache)
+
             available = util.OrderedSet(
-                bind.engine.table_names(schema, connection=conn))
+                insp.get_table_names(
+                    schema or conn.dialect.default_schema_name))
             if views:
-                available.update(
-                    bind.dialect.get_view_names(conn, schema)
-                )
+                available.update(insp.get_view_names(schema))
 
             if schema is not None:
                 available_w_schema = util.OrderedSet(["%s.%s" % (schema, name)
@@ -3902,9 +3943,21 @@ class MetaData(SchemaItem):
                 load = [name for name in only if extend_existing or
                         name not in current]
 
+            if load:
+                # fetch columns, constraints and indexes for all the
+                # tables to be loaded at once; each Table then reflects
+                # itself from the Inspector's cache
+                insp._prefetch_reflection(schema, load, dialect_kwargs)
+                reflect_opts['_reflect_inspector'] = insp
+
             for name in load:
                 Table(name, self, **reflect_opts)
 
+            if reflection_cache is not None and \
+                    set(insp.info_cache) != cached_keys:
+                reflection_cache._store(
+                    conn, schema, fingerprint, insp.info_cache)
+
     def append_ddl_listener(self, event_name, listener):
         """Append a DDL event listener to this ``MetaData``.
 
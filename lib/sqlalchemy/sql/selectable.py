@@ -16,7 +16,9 @@ from .elements import _clone, \
     _literal_as_text, _interpret_as_column_or_from, _expand_cloned,\
     _select_iterables, _anonymous_label, _clause_element_as_expr,\
     _cloned_intersection, _cloned_difference, True_, \
-    _literal_as_label_reference, _literal_and_labels_as_label_reference
+    _literal_as_label_reference, _literal_and_labels_as_label_reference, \
+    _cache_key_for_name, _cache_key_for_clauses, _cache_key_for_optional, \
+    _cache_key_for_from, _cache_key_for_reference
 from .base import Immutable, Executable, _generative, \
     ColumnCollection, ColumnSet, _from_objects, Generative
 from . import type_api
@@ -63,6 +65,12 @@ class _OffsetLimitParam(BindParameter):
     def _limit_offset_value(self):
         return self.effective_value
 
+    def _cache_key(self, anon_map, elements):
+        # some dialects render LIMIT / OFFSET inline, so the value
+        # is part of the key
+        return BindParameter._cache_key(self, anon_map, elements) + \
+            (self.effective_value, )
+
 
 def _offset_or_limit_clause(element, name=None, type_=None):
     """Convert the given value to an "offset or limit" clause.
@@ -239,6 +247,13 @@ class Selectable(ClauseElement):
         return self
 
 
+def _prefix_cache_key(prefixes, anon_map, elements):
+    return tuple(
+        (clause._cache_key(anon_map, elements), dialect)
+        for clause, dialect in prefixes
+    )
+
+
 class HasPrefixes(object):
     _prefixes = ()
 
@@ -923,6 +938,16 @@ class Join(FromClause):
     def get_children(self, **kwargs):
         return self.left, self.right, self.onclause
 
+    def _cache_key(self, anon_map, elements):
+        elements.append(self)
+        return (
+            self.__class__,
+            _cache_key_for_from(self.left, anon_map, elements),
+            _cache_key_for_from(self.right, anon_map, elements),
+            self.onclause._cache_key(anon_map, elements),
+            self.isouter, self.full
+        )
+
     def _match_primaries(self, left, right):
         if isinstance(left, Join):
             left_right = left.right
@@ -1301,6 +1326,14 @@ class Alias(FromClause):
                 yield c
         yield self.element
 
+    def _cache_key(self, anon_map, elements):
+        elements.append(self)
+        return (
+            self.__class__,
+            _cache_key_for_name(self.name, anon_map),
+            _cache_key_for_from(self.element, anon_map, elements)
+        )
+
     @property
     def _from_objects(self):
         return [self]
@@ -1362,6 +1395,16 @@ class TableSample(Alias):
         else:
             return functions.func.system(self.sampling)
 
+    def _cache_key(self, anon_map, elements):
+        # sampling and seed may be rendered from plain values generated
+        # at compile time, so these are keyed on value when not
+        # expressions
+        return Alias._cache_key(self, anon_map, elements) + tuple(
+            value._cache_key(anon_map, elements)
+            if isinstance(value, ClauseElement) else value
+            for value in (self.sampling, self.seed)
+        )
+
 
 class CTE(Generative, HasSuffixes, Alias):
     """Represent a Common Table Expression.
@@ -1396,6 +1439,25 @@ class CTE(Generative, HasSuffixes, Alias):
             clone(elem, **kw) for elem in self._restates
         ])
 
+    def _cache_key(self, anon_map, elements):
+        elements.append(self)
+        return (
+            self.__class__,
+            _cache_key_for_name(self.name, anon_map),
+            self.recursive,
+            _cache_key_for_from(self.element, anon_map, elements),
+            self._cte_alias is not None and
+            _cache_key_for_from(self._cte_alias, anon_map, elements),
+            # restated CTEs are unordered; their contents are also
+            # present within the element itself, so they're keyed without
+            # contributing elements
+            frozenset(
+                _cache_key_for_reference(cte, anon_map)
+                for cte in self._restates
+            ),
+            _prefix_cache_key(self._suffixes, anon_map, elements)
+        )
+
     @util.dependencies("sqlalchemy.sql.dml")
     def _populate_column_collection(self, dml):
         if isinstance(self.element, dml.UpdateBase):
@@ -1639,6 +1701,13 @@ class FromGrouping(FromClause):
     def _copy_internals(self, clone=_clone, **kw):
         self.element = clone(self.element, **kw)
 
+    def _cache_key(self, anon_map, elements):
+        elements.append(self)
+        return (
+            self.__class__,
+            _cache_key_for_from(self.element, anon_map, elements)
+        )
+
     @property
     def _from_objects(self):
         return self.element._from_objects
@@ -1739,6 +1808,16 @@ class TableClause(Immutable, FromClause):
         else:
             return []
 
+    def _cache_key(self, anon_map, elements):
+        elements.append(self)
+        # column names are included as they determine the
+        # deduplication of column labels
+        return (
+            self.__class__,
+            _cache_key_for_name(self.name, anon_map),
+            tuple(self._columns.keys())
+        )
+
     @util.dependencies("sqlalchemy.sql.dml")
     def insert(self, dml, values=None, inline=False, **kwargs):
         """Generate an :func:`.insert` construct against this
@@ -1845,6 +1924,14 @@ class ForUpdateArg(ClauseElement):
         if self.of is not None:
             self.of = [clone(col, **kw) for col in self.of]
 
+    def _cache_key(self, anon_map, elements):
+        return (
+            self.__class__, self.nowait, self.read,
+            self.skip_locked, self.key_share,
+            self.of is not None and
+            _cache_key_for_clauses(self.of, anon_map, elements)
+        )
+
     def __init__(
             self, nowait=False, read=False, of=None,
             skip_locked=False, key_share=False):
@@ -2213,6 +2300,21 @@ class GenerativeSelect(SelectBase):
         if self._offset_clause is not None:
             self._offset_clause = clone(self._offset_clause, **kw)
 
+    def _generative_cache_key(self, anon_map, elements):
+        """Return the portion of the cache key common to all
+        :class:`.GenerativeSelect` constructs."""
+
+        return (
+            self.use_labels,
+            self._order_by_clause._cache_key(anon_map, elements),
+            self._group_by_clause._cache_key(anon_map, elements),
+            _cache_key_for_optional(self._limit_clause, anon_map, elements),
+            _cache_key_for_optional(self._offset_clause, anon_map, elements),
+            _cache_key_for_optional(
+                self._for_update_arg, anon_map, elements),
+            tuple(sorted(self._execution_options.items()))
+        )
+
 
 class CompoundSelect(GenerativeSelect):
     """Forms the basis of ``UNION``, ``UNION ALL``, and other
@@ -2454,6 +2556,13 @@ class CompoundSelect(GenerativeSelect):
             + [self._order_by_clause, self._group_by_clause] \
             + list(self.selects)
 
+    def _cache_key(self, anon_map, elements):
+        elements.append(self)
+        return (
+            self.__class__, self.keyword, self._auto_correlate,
+            _cache_key_for_clauses(self.selects, anon_map, elements)
+        ) + self._generative_cache_key(anon_map, elements)
+
     def bind(self):
         if self._bind:
             return self._bind
@@ -3021,6 +3130,55 @@ class Select(HasPrefixes, HasSuffixes, GenerativeSelect):
                     self._order_by_clause, self._group_by_clause)
              if x is not None]
 
+    def _cache_key(self, anon_map, elements):
+        elements.append(self)
+
+        if isinstance(self._distinct, list):
+            distinct = _cache_key_for_clauses(
+                self._distinct, anon_map, elements)
+        else:
+            distinct = self._distinct
+
+        # correlation and hints only refer to FROM objects which are
+        # otherwise present in the statement; their keys don't
+        # contribute additional elements
+        if self._correlate_except is None:
+            correlate_except = None
+        else:
+            correlate_except = frozenset(
+                _cache_key_for_reference(f, anon_map)
+                for f in self._correlate_except)
+
+        columns = _cache_key_for_clauses(self._raw_columns, anon_map, elements)
+
+        # selectables in the columns clause render the columns of their
+        # .c collection, which are targeted in the result
+        for c in self._raw_columns:
+            if c.is_selectable:
+                elements.extend(c._select_iterable)
+
+        return (
+            self.__class__,
+            columns,
+            tuple(
+                _cache_key_for_from(f, anon_map, elements)
+                for f in self._from_obj),
+            _cache_key_for_optional(self._whereclause, anon_map, elements),
+            _cache_key_for_optional(self._having, anon_map, elements),
+            distinct,
+            self._auto_correlate,
+            frozenset(
+                _cache_key_for_reference(f, anon_map)
+                for f in self._correlate),
+            correlate_except,
+            frozenset(
+                (_cache_key_for_reference(f, anon_map), dialect, text)
+                for (f, dialect), text in self._hints.items()),
+            self._statement_hints,
+            _prefix_cache_key(self._prefixes, anon_map, elements),
+            _prefix_cache_key(self._suffixes, anon_map, elements),
+        ) + self._generative_cache_key(anon_map, elements)
+
     @_generative
     def column(self, column):
         """return a new select() construct with the given column expression
@@ -3704,6 +3862,16 @@ class TextAsFrom(SelectBase):
         self._reset_exported()
         self.element = clone(self.element, **kw)
 
+    def _cache_key(self, anon_map, elements):
+        elements.append(self)
+        return (
+            self.__class__,
+            self.element._cache_key(anon_map, elements),
+            _cache_key_for_clauses(self.column_args, anon_map, elements),
+            self.positional,
+            tuple(sorted(self._execution_options.items()))
+        )
+
     def _scalar_type(self):
         return self.column_args[0].type
 
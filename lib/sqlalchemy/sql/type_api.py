@@ -25,6 +25,17 @@ INDEXABLE = None
 _resolve_value_to_type = None
 
 
+_simple_cache_types = util.string_types + util.int_types + (
+    float, bool, type(None))
+
+
+def _is_simple_cache_value(value):
+    if isinstance(value, tuple):
+        return all(isinstance(v, _simple_cache_types) for v in value)
+    else:
+        return isinstance(value, _simple_cache_types)
+
+
 class TypeEngine(Visitable):
     """The ultimate base class for all SQL datatypes.
 
@@ -358,6 +369,26 @@ class TypeEngine(Visitable):
 
         return x == y
 
+    @util.memoized_property
+    def _static_cache_key(self):
+        """Return a hashable key representing this type within a
+        statement cache key.
+
+        Types whose state consists only of simple scalar values are
+        keyed on that state, so that equivalent type objects produce
+        the same key; all others are keyed on identity.
+
+        """
+        cls = self.__class__
+        items = []
+        for k, v in sorted(self.__dict__.items()):
+            if isinstance(getattr(cls, k, None), util.memoized_property):
+                continue
+            if not _is_simple_cache_value(v):
+                return (cls, id(self))
+            items.append((k, v))
+        return (cls, ) + tuple(items)
+
     def get_dbapi_type(self, dbapi):
         """Return the corresponding type object from the underlying DB-API, if
         any.
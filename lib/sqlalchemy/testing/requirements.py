@@ -219,6 +219,30 @@ class SuiteRequirements(Requirements):
             "%(database)s %(does_support)s 'returning'"
         )
 
+    @property
+    def insert_executemany_returning(self):
+        """target platform supports RETURNING when INSERT is used with
+        multiple parameter sets, delivering rows for all of them."""
+
+        return exclusions.only_if(
+            lambda config:
+            config.db.dialect.insert_executemany_returning,
+            "%(database)s %(does_support)s 'RETURNING of multiple "
+            "parameter sets'"
+        )
+
+    @property
+    def update_from_returning(self):
+        """target platform supports UPDATE..FROM..RETURNING, used by the
+        ORM to batch UPDATE statements which need per-row results."""
+
+        return exclusions.only_if(
+            lambda config:
+            config.db.dialect.update_from_returning and
+            config.db.dialect.implicit_returning,
+            "%(database)s %(does_support)s 'UPDATE..FROM..RETURNING'"
+        )
+
     @property
     def tuple_in(self):
         """Target platform supports the syntax
@@ -333,6 +357,11 @@ class SuiteRequirements(Requirements):
     def comment_reflection(self):
         return exclusions.closed()
 
+    @property
+    def schema_fingerprint(self):
+        """target dialect implements Dialect.get_schema_fingerprint()."""
+        return exclusions.closed()
+
     @property
     def view_column_reflection(self):
         """target database must support retrieval of the columns in a view,
@@ -743,6 +772,13 @@ class SuiteRequirements(Requirements):
             "Python version 3.xx is required."
         )
 
+    @property
+    def asyncio(self):
+        return exclusions.skip_if(
+            lambda: sys.version_info < (3, 5),
+            "Python version 3.5 or greater is required."
+        )
+
     @property
     def cpython(self):
         return exclusions.only_if(
@@ -796,6 +832,12 @@ class SuiteRequirements(Requirements):
             lambda: not self._has_cextensions(), "C extensions not installed"
         )
 
+    @property
+    def numpy(self):
+        return exclusions.skip_if(
+            lambda: not self._has_numpy(), "NumPy not installed"
+        )
+
     def _has_sqlite(self):
         from sqlalchemy import create_engine
         try:
@@ -810,3 +852,10 @@ class SuiteRequirements(Requirements):
             return True
         except ImportError:
             return False
+
+    def _has_numpy(self):
+        try:
+            import numpy
+            return True
+        except ImportError:
+            return False
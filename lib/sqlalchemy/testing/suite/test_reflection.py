@@ -749,6 +749,56 @@ class ComponentReflectionTest(fixtures.TablesTest):
             id_ = {c['name']: c for c in cols}[cname]
             assert id_.get('autoincrement', True)
 
+    def _test_get_multi(self, schema=None):
+        table_names = ['users', 'email_addresses', 'dingalings']
+        insp = inspect(testing.db)
+        multi_insp = inspect(testing.db)
+
+        multi_cols = multi_insp.get_multi_columns(
+            schema=schema, table_names=table_names)
+        eq_(set(multi_cols), set(table_names))
+        for table_name in table_names:
+            eq_(
+                [
+                    (col['name'], col['nullable'])
+                    for col in multi_cols[table_name]
+                ],
+                [
+                    (col['name'], col['nullable'])
+                    for col in insp.get_columns(table_name, schema=schema)
+                ]
+            )
+
+        for multi_fn, fn in [
+            (multi_insp.get_multi_pk_constraint, insp.get_pk_constraint),
+            (multi_insp.get_multi_foreign_keys, insp.get_foreign_keys),
+            (multi_insp.get_multi_indexes, insp.get_indexes),
+        ]:
+            result = multi_fn(schema=schema, table_names=table_names)
+            for table_name in table_names:
+                eq_(result[table_name], fn(table_name, schema=schema))
+
+    @testing.requires.table_reflection
+    @testing.requires.primary_key_constraint_reflection
+    @testing.requires.foreign_key_constraint_reflection
+    def test_get_multi(self):
+        self._test_get_multi()
+
+    @testing.requires.table_reflection
+    @testing.requires.primary_key_constraint_reflection
+    @testing.requires.foreign_key_constraint_reflection
+    @testing.requires.schemas
+    def test_get_multi_with_schema(self):
+        self._test_get_multi(schema=testing.config.test_schema)
+
+    @testing.requires.table_reflection
+    def test_get_multi_all_tables(self):
+        insp = inspect(testing.db)
+        eq_(
+            set(insp.get_multi_columns()),
+            set(insp.get_table_names())
+        )
+
 
 class NormalizedNameTest(fixtures.TablesTest):
     __requires__ = 'denormalized_names',
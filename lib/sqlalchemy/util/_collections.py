@@ -170,6 +170,9 @@ class immutabledict(ImmutableContainer, dict):
         return "immutabledict(%s)" % dict.__repr__(self)
 
 
+EMPTY_DICT = immutabledict()
+
+
 class Properties(object):
     """Provide a __getattr__/__setattr__ interface over a dict."""
 
@@ -866,9 +869,16 @@ class LRUCache(dict):
     generally its not safe to do an "in" check first as the dictionary
     can change subsequent to that call.
 
+    The number of successful and unsuccessful calls to get(), as well
+    as the number of items removed in order to stay within the size
+    threshold, are tracked in the ``hits``, ``misses`` and ``evictions``
+    attributes.  These counters are approximate when the cache is
+    accessed concurrently.
+
     """
 
-    __slots__ = 'capacity', 'threshold', 'size_alert', '_counter', '_mutex'
+    __slots__ = 'capacity', 'threshold', 'size_alert', '_counter', '_mutex', \
+        'hits', 'misses', 'evictions'
 
     def __init__(self, capacity=100, threshold=.5, size_alert=None):
         self.capacity = capacity
@@ -876,6 +886,7 @@ class LRUCache(dict):
         self.size_alert = size_alert
         self._counter = 0
         self._mutex = threading.Lock()
+        self.hits = self.misses = self.evictions = 0
 
     def _inc_counter(self):
         self._counter += 1
@@ -885,8 +896,10 @@ class LRUCache(dict):
         item = dict.get(self, key, default)
         if item is not default:
             item[2] = self._inc_counter()
+            self.hits += 1
             return item[1]
         else:
+            self.misses += 1
             return default
 
     def __getitem__(self, key):
@@ -935,6 +948,8 @@ class LRUCache(dict):
                     except KeyError:
                         # deleted elsewhere; skip
                         continue
+                    else:
+                        self.evictions += 1
         finally:
             self._mutex.release()
 
@@ -879,6 +879,11 @@ class dependencies(object):
     associated directly with the few functions that cause the cycle,
     and not pollute the module-level namespace.
 
+    Each module is imported when the function is first called, once
+    :meth:`.dependencies.resolve_all` has been called for the package
+    containing it, so that modules needed only by rarely used functions
+    aren't imported along with the package.
+
     """
 
     def __init__(self, *deps):
@@ -921,13 +926,39 @@ class dependencies(object):
 
     @classmethod
     def resolve_all(cls, path):
-        for m in list(dependencies._unresolved):
-            if m._full_path.startswith(path):
-                m._resolve()
+        """Allow the dependencies within the given package to be imported,
+        which takes place when each is first used.
+
+        Called once the package itself is fully imported.
+
+        """
+        dependencies._resolvable.add(path)
+
+    @classmethod
+    def import_all(cls, path):
+        """Import all dependencies within the given package now, rather
+        than when each is first used."""
+
+        cls.resolve_all(path)
+
+        with dependencies._resolve_lock:
+            # importing a dependency may register further dependencies
+            while True:
+                pending = [
+                    m for m in dependencies._unresolved
+                    if m._full_path.startswith(path)]
+                if not pending:
+                    break
+                for m in pending:
+                    m._resolve()
 
     _unresolved = set()
+    _resolvable = set()
     _by_key = {}
 
+    # reentrant, as importing one dependency may resolve another
+    _resolve_lock = compat.threading.RLock()
+
     class _importlater(object):
         _unresolved = set()
 
@@ -944,7 +975,10 @@ class dependencies(object):
         def __init__(self, path, addtl):
             self._il_path = path
             self._il_addtl = addtl
-            dependencies._unresolved.add(self)
+            # __new__ returns the existing object for a path which was
+            # seen before; it remains resolved if it was already
+            if '_initial_import' not in self.__dict__:
+                dependencies._unresolved.add(self)
 
         @property
         def _full_path(self):
@@ -952,19 +986,30 @@ class dependencies(object):
 
         @memoized_property
         def module(self):
-            if self in dependencies._unresolved:
-                raise ImportError(
-                    "importlater.resolve_all() hasn't "
-                    "been called (this is %s %s)"
-                    % (self._il_path, self._il_addtl))
+            with dependencies._resolve_lock:
+                if self in dependencies._unresolved:
+                    full_path = self._full_path
+                    for path in dependencies._resolvable:
+                        if full_path.startswith(path):
+                            self._resolve()
+                            break
+                if self in dependencies._unresolved:
+                    raise ImportError(
+                        "importlater.resolve_all() hasn't "
+                        "been called (this is %s %s)"
+                        % (self._il_path, self._il_addtl))
 
             return getattr(self._initial_import, self._il_addtl)
 
         def _resolve(self):
-            dependencies._unresolved.discard(self)
-            self._initial_import = compat.import_(
-                self._il_path, globals(), locals(),
-                [self._il_addtl])
+            with dependencies._resolve_lock:
+                self._initial_import = compat.import_(
+                    self._il_path, globals(), locals(),
+                    [self._il_addtl])
+                # discard only once _initial_import is present, so that
+                # a concurrent caller never sees a "resolved" object
+                # without it
+                dependencies._unresolved.discard(self)
 
         def __getattr__(self, key):
             if key == 'module':
@@ -0,0 +1,81 @@
+import os
+import subprocess
+import sys
+
+import sqlalchemy
+from sqlalchemy.testing import fixtures, eq_
+
+
+class ImportTest(fixtures.TestBase):
+    """Import sqlalchemy in a new interpreter, checking which modules
+    are imported along with it."""
+
+    __requires__ = 'cpython',
+
+    def _run(self, code):
+        lib = os.path.dirname(os.path.dirname(
+            os.path.abspath(sqlalchemy.__file__)))
+        script = "import sys\nsys.path.insert(0, %r)\n%s" % (lib, code)
+        proc = subprocess.Popen(
+            [sys.executable, "-c", script],
+            stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        out, err = proc.communicate()
+        eq_(proc.returncode, 0, err.decode("utf-8", "replace"))
+        return out.decode("utf-8").split()
+
+    def _imported(self, module, candidates):
+        return self._run(
+            "import %s\n"
+            "for name in %r:\n"
+            "    if sys.modules.get(name) is not None:\n"
+            "        print(name)\n" % (module, list(candidates))
+        )
+
+    def test_core_import(self):
+        eq_(
+            self._imported("sqlalchemy", [
+                "sqlalchemy.engine.reflection",
+                "sqlalchemy.ext.baked",
+                "sqlalchemy.orm",
+                "sqlalchemy.dialects.sqlite",
+                "tempfile",
+            ]),
+            []
+        )
+
+    def test_orm_import(self):
+        eq_(
+            self._imported("sqlalchemy.orm", [
+                "sqlalchemy.engine.reflection",
+                "sqlalchemy.ext.baked",
+                "sqlalchemy.ext.declarative",
+                "sqlalchemy.orm.artifacts",
+                "tempfile",
+                "uuid",
+            ]),
+            []
+        )
+
+    def test_dependencies_resolve(self):
+        # the dependencies which are otherwise imported on first use
+        eq_(
+            self._run(
+                "import sqlalchemy.orm\n"
+                "from sqlalchemy import util\n"
+                "util.dependencies.import_all('sqlalchemy')\n"
+                "print(len(util.dependencies._unresolved))\n"
+            ),
+            ["0"]
+        )
+
+    def test_inspect_engine(self):
+        eq_(
+            self._run(
+                "from sqlalchemy import create_engine, inspect\n"
+                "e = create_engine('sqlite://')\n"
+                "e.execute('create table t (x integer)')\n"
+                "print(type(inspect(e)).__name__)\n"
+                "print(inspect(e).get_table_names()[0])\n"
+            ),
+            ["Inspector", "t"]
+        )
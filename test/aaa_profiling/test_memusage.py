@@ -1,7 +1,7 @@
 from sqlalchemy.testing import eq_
 from sqlalchemy.orm import mapper, relationship, create_session, \
     clear_mappers, sessionmaker, aliased,\
-    Session, subqueryload
+    Session, subqueryload, attributes
 from sqlalchemy.orm.mapper import _mapper_registry
 from sqlalchemy.orm.session import _sessions
 from sqlalchemy import testing
@@ -251,6 +251,56 @@ class MemUsageWBackendTest(EnsureZeroed):
         del m1, m2, m3
         assert_no_mappers()
 
+    def test_loaded_state_overhead(self):
+        metadata = MetaData(self.engine)
+
+        table1 = Table("mytable", metadata,
+                       Column('col1', Integer, primary_key=True,
+                              test_needs_autoincrement=True),
+                       Column('col2', String(30)))
+
+        metadata.create_all()
+        self.engine.execute(
+            table1.insert(), [{"col2": "a%d" % i} for i in range(500)])
+
+        m1 = mapper(A, table1)
+
+        def count_objects(alist):
+            return sum(
+                1 for a in alist
+                if attributes.instance_state(a).committed_state
+                is not util.EMPTY_DICT
+            )
+
+        sess = create_session()
+        alist = sess.query(A).all()
+
+        # unmodified objects share the empty committed_state dictionary
+        eq_(count_objects(alist), 0)
+
+        alist[0].col2 = 'modified'
+        alist[1].col2 = 'modified'
+        eq_(count_objects(alist), 2)
+
+        sess.flush()
+        sess.close()
+        del sess, alist
+
+        @profile_memory()
+        def go():
+            sess = create_session()
+            alist = sess.query(A).all()
+            alist[0].col2 = 'a0'
+            sess.flush()
+            sess.expire_all()
+            alist[1].col2
+            sess.close()
+        go()
+
+        metadata.drop_all()
+        del m1
+        assert_no_mappers()
+
     def test_sessionmaker(self):
         @profile_memory()
         def go():
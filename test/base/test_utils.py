@@ -722,6 +722,65 @@ class LRUTest(fixtures.TestBase):
         assert 25 in lru
         assert lru[25] is i2
 
+    def test_counters(self):
+        lru = util.LRUCache(10, threshold=.2)
+
+        for id_ in range(1, 13):
+            lru[id_] = id_
+        eq_(lru.evictions, 0)
+
+        lru[13] = 13
+        eq_(lru.evictions, 3)
+
+        eq_(lru.get(13), 13)
+        eq_(lru.get(1), None)
+        eq_(lru.get(2, 'default'), 'default')
+        eq_((lru.hits, lru.misses), (1, 2))
+
+
+class DependenciesTest(fixtures.TestBase):
+
+    def teardown(self):
+        imp = util.dependencies._by_key.pop(
+            "sqlalchemy.util._collections", None)
+        util.dependencies._unresolved.discard(imp)
+
+    def test_concurrent_resolve(self):
+        import threading
+        import time
+
+        imp = util.dependencies._importlater(
+            "sqlalchemy.util", "_collections")
+        assert imp in util.dependencies._unresolved
+
+        real_import = compat.import_
+
+        def slow_import(*arg, **kw):
+            time.sleep(.1)
+            return real_import(*arg, **kw)
+
+        results = []
+        errors = []
+
+        def go():
+            try:
+                results.append(imp.module)
+            except Exception as e:
+                errors.append(e)
+
+        with mock.patch.object(compat, "import_", slow_import):
+            threads = [threading.Thread(target=go) for i in range(5)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+
+        eq_(errors, [])
+        eq_(len(results), 5)
+        for mod in results:
+            is_(mod, util._collections)
+        assert imp not in util.dependencies._unresolved
+
 
 class ImmutableSubclass(str):
     pass
@@ -8,12 +8,13 @@ from sqlalchemy import testing
 import datetime
 from sqlalchemy import (
     Table, Column, select, MetaData, text, Integer, String, Sequence, Numeric,
-    DateTime, BigInteger, func, extract, SmallInteger, TypeDecorator)
+    DateTime, BigInteger, func, extract, SmallInteger, TypeDecorator,
+    bindparam)
 from sqlalchemy import exc, schema
 from sqlalchemy.dialects.postgresql import base as postgresql
 import logging
 import logging.handlers
-from sqlalchemy.testing.mock import Mock
+from sqlalchemy.testing.mock import Mock, call
 from sqlalchemy.engine import engine_from_config
 from sqlalchemy.engine import url
 from sqlalchemy.testing import is_
@@ -301,6 +302,231 @@ class MiscTest(fixtures.TestBase, AssertsExecutionResults, AssertsCompiledSQL):
             )
 
 
+class ExecutemanyModeTest(fixtures.TestBase):
+
+    def setup(self):
+        self.metadata = MetaData()
+        self.table = Table(
+            'data', self.metadata,
+            Column('id', Integer, primary_key=True),
+            Column('x', String),
+            Column('y', String)
+        )
+
+    def _fixture(self, **kw):
+        from sqlalchemy.dialects.postgresql import psycopg2
+        dialect = psycopg2.dialect(**kw)
+        dialect.psycopg2_version = (2, 8)
+        extras = Mock()
+        dialect._psycopg2_extras = Mock(return_value=extras)
+        return dialect, extras
+
+    def _context(self, dialect, stmt):
+        compiled = stmt.compile(dialect=dialect)
+        return compiled, Mock(
+            isinsert=compiled.isinsert, compiled=compiled,
+            _is_explicit_returning=bool(compiled.returning),
+            _psycopg2_fetched_rows=None)
+
+    def test_invalid_mode(self):
+        from sqlalchemy.dialects.postgresql import psycopg2
+        assert_raises_message(
+            exc.ArgumentError,
+            "Invalid value 'foo' for executemany_mode",
+            psycopg2.dialect, executemany_mode='foo'
+        )
+
+    def test_insert_single_values_expr(self):
+        dialect, extras = self._fixture()
+        compiled = self.table.insert().compile(dialect=dialect)
+        eq_(compiled.insert_single_values_expr,
+            "%(id)s, %(x)s, %(y)s")
+
+        compiled = self.table.insert().values(
+            [{"x": "a"}, {"x": "b"}]).compile(dialect=dialect)
+        is_(compiled.insert_single_values_expr, None)
+
+    def test_default_mode(self):
+        dialect, extras = self._fixture()
+        compiled, context = self._context(dialect, self.table.insert())
+        cursor = Mock()
+        params = [{"id": 1, "x": "a", "y": "b"}]
+        dialect.do_executemany(cursor, compiled.string, params, context)
+        eq_(
+            cursor.mock_calls,
+            [call.executemany(compiled.string, params)]
+        )
+        eq_(extras.mock_calls, [])
+        eq_(dialect.insert_executemany_returning, False)
+
+    def test_batch_mode(self):
+        dialect, extras = self._fixture(
+            executemany_mode='batch', executemany_batch_page_size=50)
+        compiled, context = self._context(dialect, self.table.insert())
+        cursor = Mock()
+        params = [{"id": 1, "x": "a", "y": "b"}]
+        dialect.do_executemany(cursor, compiled.string, params, context)
+        eq_(
+            extras.mock_calls,
+            [call.execute_batch(
+                cursor, compiled.string, params, page_size=50)]
+        )
+        eq_(cursor.mock_calls, [])
+
+    def test_values_mode(self):
+        dialect, extras = self._fixture(
+            executemany_mode='values', executemany_values_page_size=500)
+        compiled, context = self._context(dialect, self.table.insert())
+        cursor = Mock()
+        params = [{"id": 1, "x": "a", "y": "b"}]
+        dialect.do_executemany(cursor, compiled.string, params, context)
+        eq_(
+            extras.mock_calls,
+            [call.execute_values(
+                cursor, "INSERT INTO data (id, x, y) VALUES %s", params,
+                template="(%(id)s, %(x)s, %(y)s)", page_size=500)]
+        )
+        is_(context._psycopg2_fetched_rows, None)
+
+    def test_values_mode_returning(self):
+        dialect, extras = self._fixture(executemany_mode='values')
+        extras.execute_values.return_value = [(1, ), (2, )]
+        compiled, context = self._context(
+            dialect, self.table.insert().returning(self.table.c.id))
+        cursor = Mock()
+        params = [{"id": 1, "x": "a", "y": "b"},
+                  {"id": 2, "x": "c", "y": "d"}]
+        dialect.do_executemany(cursor, compiled.string, params, context)
+        eq_(
+            extras.mock_calls,
+            [call.execute_values(
+                cursor,
+                "INSERT INTO data (id, x, y) VALUES %s RETURNING data.id",
+                params, template="(%(id)s, %(x)s, %(y)s)",
+                page_size=1000, fetch=True)]
+        )
+        eq_(context._psycopg2_fetched_rows, [(1, ), (2, )])
+
+    def test_values_mode_returning_old_psycopg2(self):
+        dialect, extras = self._fixture(executemany_mode='values')
+        dialect.psycopg2_version = (2, 7)
+        eq_(dialect.insert_executemany_returning, False)
+        compiled, context = self._context(
+            dialect, self.table.insert().returning(self.table.c.id))
+        cursor = Mock()
+        params = [{"id": 1, "x": "a", "y": "b"}]
+        dialect.do_executemany(cursor, compiled.string, params, context)
+        eq_(
+            extras.mock_calls,
+            [call.execute_values(
+                cursor,
+                "INSERT INTO data (id, x, y) VALUES %s RETURNING data.id",
+                params, template="(%(id)s, %(x)s, %(y)s)",
+                page_size=1000)]
+        )
+
+    def test_values_mode_update_uses_batch(self):
+        dialect, extras = self._fixture(executemany_mode='values')
+        compiled, context = self._context(
+            dialect,
+            self.table.update().where(
+                self.table.c.id == bindparam('q')))
+        cursor = Mock()
+        params = [{"q": 1, "x": "a", "y": "b"}]
+        dialect.do_executemany(cursor, compiled.string, params, context)
+        eq_(
+            extras.mock_calls,
+            [call.execute_batch(
+                cursor, compiled.string, params, page_size=100)]
+        )
+
+    def test_values_mode_textual_uses_batch(self):
+        dialect, extras = self._fixture(executemany_mode='values')
+        cursor = Mock()
+        statement = "INSERT INTO data (id) VALUES (%(id)s)"
+        params = [{"id": 1}]
+        dialect.do_executemany(cursor, statement, params, None)
+        eq_(
+            extras.mock_calls,
+            [call.execute_batch(cursor, statement, params, page_size=100)]
+        )
+
+
+class ExecutemanyModeRoundTripTest(fixtures.TablesTest):
+    __only_on__ = 'postgresql+psycopg2'
+    __backend__ = True
+
+    @classmethod
+    def define_tables(cls, metadata):
+        Table(
+            'data', metadata,
+            Column('id', Integer, primary_key=True),
+            Column('x', String),
+            Column('y', String)
+        )
+
+    def _test_insert(self, **kw):
+        eng = engines.testing_engine(options=kw)
+        data = self.tables.data
+        with eng.connect() as conn:
+            conn.execute(
+                data.insert(),
+                [{"x": "x%d" % i, "y": "y%d" % i} for i in range(1, 251)]
+            )
+            eq_(
+                conn.execute(
+                    select([data.c.x, data.c.y]).order_by(data.c.id)
+                ).fetchall(),
+                [("x%d" % i, "y%d" % i) for i in range(1, 251)]
+            )
+
+    def test_insert_batch(self):
+        self._test_insert(
+            executemany_mode='batch', executemany_batch_page_size=20)
+
+    def test_insert_values(self):
+        self._test_insert(
+            executemany_mode='values', executemany_values_page_size=20)
+
+    def test_insert_values_returning(self):
+        eng = engines.testing_engine(
+            options={"executemany_mode": 'values',
+                     "executemany_values_page_size": 20})
+        if not eng.dialect.insert_executemany_returning:
+            return
+        data = self.tables.data
+        with eng.connect() as conn:
+            result = conn.execute(
+                data.insert().returning(data.c.x),
+                [{"x": "x%d" % i, "y": "y%d" % i} for i in range(1, 51)]
+            )
+            eq_(
+                [row[0] for row in result],
+                ["x%d" % i for i in range(1, 51)]
+            )
+
+    def test_update_batch(self):
+        eng = engines.testing_engine(options={"executemany_mode": 'values'})
+        data = self.tables.data
+        with eng.connect() as conn:
+            conn.execute(
+                data.insert(),
+                [{"x": "x%d" % i, "y": "y%d" % i} for i in range(1, 11)]
+            )
+            conn.execute(
+                data.update().where(data.c.x == bindparam('xval')).
+                values(y=bindparam('yval')),
+                [{"xval": "x%d" % i, "yval": "q%d" % i}
+                 for i in range(1, 11)]
+            )
+            eq_(
+                conn.execute(
+                    select([data.c.y]).order_by(data.c.id)
+                ).fetchall(),
+                [("q%d" % i, ) for i in range(1, 11)]
+            )
+
+
 class AutocommitTextTest(test_execute.AutocommitTextTest):
     __only_on__ = 'postgresql'
 
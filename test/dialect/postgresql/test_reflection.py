@@ -3,7 +3,7 @@
 from sqlalchemy.engine import reflection
 from sqlalchemy.sql.schema import CheckConstraint
 from sqlalchemy.testing.assertions import eq_, assert_raises, \
-    AssertsExecutionResults
+    AssertsExecutionResults, is_true
 from sqlalchemy.testing import fixtures
 from sqlalchemy import testing
 from sqlalchemy import inspect
@@ -1025,6 +1025,34 @@ class ReflectionTest(fixtures.TestBase):
             u'cc2': u'(a = 1) OR ((a > 2) AND (a < 5))'
         })
 
+    @testing.provide_metadata
+    def test_schema_fingerprint_comments(self):
+        Table('fp_t', self.metadata, Column('a', Integer)).create()
+
+        with testing.db.connect() as conn:
+            fp1 = conn.dialect.get_schema_fingerprint(conn)
+            conn.execute("COMMENT ON TABLE fp_t IS 'the table'")
+            fp2 = conn.dialect.get_schema_fingerprint(conn)
+            conn.execute("COMMENT ON COLUMN fp_t.a IS 'the column'")
+            fp3 = conn.dialect.get_schema_fingerprint(conn)
+
+        eq_(len(set([fp1, fp2, fp3])), 3)
+
+    @testing.provide_metadata
+    def test_schema_fingerprint_enum(self):
+        enum_type = postgresql.ENUM(
+            'a', 'b', name='fp_enum', metadata=self.metadata)
+        enum_type.create(testing.db)
+
+        with testing.db.connect() as conn:
+            # ADD VALUE can't run within a transaction block
+            conn = conn.execution_options(isolation_level="AUTOCOMMIT")
+            fp1 = conn.dialect.get_schema_fingerprint(conn)
+            conn.execute("ALTER TYPE fp_enum ADD VALUE 'c'")
+            fp2 = conn.dialect.get_schema_fingerprint(conn)
+
+        is_true(fp2 != fp1)
+
 
 class CustomTypeReflectionTest(fixtures.TestBase):
 
@@ -7,7 +7,7 @@ from sqlalchemy.testing.util import picklers
 from sqlalchemy.interfaces import ConnectionProxy
 from sqlalchemy import MetaData, Integer, String, INT, VARCHAR, func, \
     bindparam, select, event, TypeDecorator, create_engine, Sequence
-from sqlalchemy.sql import column, literal
+from sqlalchemy.sql import column, literal, literal_column, table
 from sqlalchemy.testing.schema import Table, Column
 import sqlalchemy as tsa
 from sqlalchemy import testing
@@ -817,7 +817,9 @@ class CompiledCacheTest(fixtures.TestBase):
             cached_conn.execute(ins, {'user_name': 'u2'})
             cached_conn.execute(ins, {'user_name': 'u3'})
         eq_(compile_mock.call_count, 1)
-        assert len(cache) == 1
+
+        # cached under the statement itself as well as its structure
+        eq_(len(cache), 2)
         eq_(conn.execute("select count(*) from users").scalar(), 3)
 
     def test_keys_independent_of_ordering(self):
@@ -855,7 +857,146 @@ class CompiledCacheTest(fixtures.TestBase):
                 ])
             )
         eq_(compile_mock.call_count, 1)
-        eq_(len(cache), 1)
+        eq_(len(cache), 2)
+
+    def test_structure_shared_select(self):
+        conn = testing.db.connect()
+        conn.execute(
+            users.insert(),
+            [{"user_id": 1, "user_name": "u1"},
+             {"user_id": 2, "user_name": "u2"}])
+        cache = {}
+        cached_conn = conn.execution_options(compiled_cache=cache)
+
+        def go(user_id):
+            return select([users.c.user_name.label('name')]).\
+                where(users.c.user_id == user_id)
+
+        s1 = go(1)
+        eq_(cached_conn.execute(s1).fetchall(), [("u1", )])
+        eq_(len(cache), 2)
+
+        s2 = go(2)
+        with patch.object(
+            s2, "compile",
+                Mock(side_effect=s2.compile)) as compile_mock:
+            row = cached_conn.execute(s2).first()
+        eq_(compile_mock.call_count, 0)
+        eq_(len(cache), 2)
+        eq_(row, ("u2", ))
+        eq_(row["name"], "u2")
+        eq_(row[s2.c.name], "u2")
+
+        eq_(cached_conn.execute(s1).fetchall(), [("u1", )])
+
+    def test_structure_shared_values(self):
+        conn = testing.db.connect()
+        cache = {}
+        cached_conn = conn.execution_options(compiled_cache=cache)
+
+        for i in range(1, 4):
+            cached_conn.execute(
+                users.insert().values(user_id=i, user_name="u%d" % i))
+        eq_(len(cache), 2)
+
+        for i in range(1, 3):
+            cached_conn.execute(
+                users.update().where(users.c.user_id == i).
+                values(extra_data="e%d" % i))
+        eq_(len(cache), 4)
+
+        eq_(
+            conn.execute(
+                select([users]).order_by(users.c.user_id)).fetchall(),
+            [(1, "u1", "e1"), (2, "u2", "e2"), (3, "u3", None)]
+        )
+
+    def test_structure_distinguishes_values(self):
+        conn = testing.db.connect()
+        conn.execute(
+            users.insert(),
+            [{"user_id": i, "user_name": "u%d" % i} for i in range(1, 4)])
+        cache = {}
+        cached_conn = conn.execution_options(compiled_cache=cache)
+
+        stmt = select([users.c.user_id]).order_by(users.c.user_id)
+        eq_(cached_conn.execute(stmt.limit(1)).fetchall(), [(1, )])
+        eq_(
+            cached_conn.execute(stmt.limit(2).offset(1)).fetchall(),
+            [(2, ), (3, )])
+        eq_(
+            cached_conn.execute(
+                stmt.where(users.c.user_name == "u3")).fetchall(),
+            [(3, )])
+        eq_(
+            cached_conn.execute(
+                stmt.where(users.c.user_name != "u3")).fetchall(),
+            [(1, ), (2, )])
+
+    def test_structure_distinguishes_repeated_from(self):
+        conn = testing.db.connect()
+        conn.execute(users.insert(), {"user_id": 1, "user_name": "u1"})
+        cache = {}
+        cached_conn = conn.execution_options(compiled_cache=cache)
+
+        t = table("users", column("user_id"))
+        eq_(
+            cached_conn.execute(
+                select([t.c.user_id]).where(
+                    t.c.user_id == bindparam("p")), p=1).fetchall(),
+            [(1, )])
+
+        # two equivalent table() objects render as "FROM t, t" and must
+        # not reuse the compiled form of the statement above
+        ta = table("users", column("user_id"))
+        tb = table("users", column("user_id"))
+        assert_raises(
+            tsa.exc.DBAPIError,
+            cached_conn.execute,
+            select([ta.c.user_id]).where(tb.c.user_id == bindparam("p")),
+            p=1
+        )
+
+    def test_engine_query_cache(self):
+        engine = engines.testing_engine(options={"query_cache_size": 10})
+        cache = engine.query_cache
+        eq_(cache.capacity, 10)
+
+        with engine.connect() as conn:
+            for i in range(1, 4):
+                eq_(conn.scalar(select([literal(i)])), i)
+            eq_(len(cache), 2)
+
+            # one compile; the two later statements are located
+            # by structure after missing on identity
+            eq_((cache.hits, cache.misses), (2, 4))
+
+            stmt = select([literal_column('1')])
+            conn.execute(stmt)
+            conn.execute(stmt)
+            eq_((cache.hits, cache.misses), (3, 6))
+
+        is_(engine.execution_options(foo='bar').query_cache, cache)
+
+    def test_engine_query_cache_evicts(self):
+        engine = engines.testing_engine(options={"query_cache_size": 4})
+        cache = engine.query_cache
+
+        with engine.connect() as conn:
+            for i in range(5):
+                conn.execute(select([literal_column(str(i))]))
+        eq_(cache.evictions, 6)
+        eq_(len(cache), 4)
+
+    def test_engine_query_cache_disabled(self):
+        engine = engines.testing_engine(options={"query_cache_size": 0})
+        is_(engine.query_cache, None)
+
+        engine = engines.testing_engine()
+        with engine.connect() as conn:
+            conn.execution_options(compiled_cache=None).execute(
+                select([literal(1)]))
+        eq_(len(engine.query_cache), 0)
 
     @testing.requires.schemas
     @testing.provide_metadata
@@ -1551,6 +1551,115 @@ class QueuePoolTest(PoolTestBase):
             c3 = p.connect()
             is_not_(c3.connection, c_ref())
 
+    def test_fifo(self):
+        p = self._queuepool_fixture(pool_size=3, max_overflow=0)
+        c1, c2, c3 = p.connect(), p.connect(), p.connect()
+        conns = [c1.connection, c2.connection, c3.connection]
+        c1.close()
+        c2.close()
+        c3.close()
+
+        c4 = p.connect()
+        is_(c4.connection, conns[0])
+
+    def test_lifo(self):
+        p = self._queuepool_fixture(
+            pool_size=3, max_overflow=0, use_lifo=True)
+        c1, c2, c3 = p.connect(), p.connect(), p.connect()
+        conns = [c1.connection, c2.connection, c3.connection]
+        c1.close()
+        c2.close()
+        c3.close()
+
+        c4 = p.connect()
+        is_(c4.connection, conns[2])
+        c5 = p.connect()
+        is_(c5.connection, conns[1])
+        c5.close()
+        c6 = p.connect()
+        is_(c6.connection, conns[1])
+
+    def test_lifo_recreate(self):
+        p = self._queuepool_fixture(
+            pool_size=3, max_overflow=0, use_lifo=True,
+            idle_timeout=30, min_size=1)
+        p2 = p.recreate()
+        is_(p2._pool.use_lifo, True)
+        eq_(p2._idle_timeout, 30)
+        eq_(p2._min_size, 1)
+
+    def test_idle_timeout(self):
+        with patch("sqlalchemy.pool.time.time") as mock:
+            mock.return_value = 10000
+
+            dbapi, p = self._queuepool_dbapi_fixture(
+                pool_size=3, max_overflow=0, use_lifo=True,
+                idle_timeout=30)
+            c1, c2, c3 = p.connect(), p.connect(), p.connect()
+            conns = [c1.connection, c2.connection, c3.connection]
+            c1.close()
+            c2.close()
+
+            mock.return_value = 10020
+            c3.close()
+
+            # c1 and c2 are now idle for longer than 30 seconds;
+            # c3 is not
+            mock.return_value = 10040
+            c4 = p.connect()
+            is_(c4.connection, conns[2])
+            eq_(p.checkedin(), 0)
+            eq_(p.checkedout(), 1)
+            for conn in conns[0:2]:
+                eq_(conn.mock_calls, [call.rollback(), call.close()])
+
+            c5 = p.connect()
+            is_not_(c5.connection, conns[0])
+            is_not_(c5.connection, conns[1])
+
+    def test_idle_timeout_min_size(self):
+        with patch("sqlalchemy.pool.time.time") as mock:
+            mock.return_value = 10000
+
+            p = self._queuepool_fixture(
+                pool_size=3, max_overflow=0,
+                idle_timeout=30, min_size=2)
+            c1, c2, c3 = p.connect(), p.connect(), p.connect()
+            conns = [c1.connection, c2.connection, c3.connection]
+            c1.close()
+            c2.close()
+            c3.close()
+
+            mock.return_value = 10040
+            c4 = p.connect()
+
+            # the oldest connection was closed; the remaining two
+            # stay in the pool as the minimum size
+            is_(c4.connection, conns[1])
+            eq_(p.checkedin(), 1)
+            eq_(p.checkedout(), 1)
+
+    def test_idle_timeout_overflow(self):
+        with patch("sqlalchemy.pool.time.time") as mock:
+            mock.return_value = 10000
+
+            p = self._queuepool_fixture(
+                pool_size=1, max_overflow=2,
+                idle_timeout=30)
+            c1, c2 = p.connect(), p.connect()
+            c1.close()
+            c2.close()
+            eq_(p.checkedin(), 1)
+            eq_(p.overflow(), 0)
+
+            mock.return_value = 10040
+            c3 = p.connect()
+            eq_(p.checkedin(), 0)
+            eq_(p.overflow(), 0)
+            c3.close()
+            eq_(p.checkedin(), 1)
+            eq_(p.overflow(), 0)
+
     @testing.requires.timing_intensive
     def test_recycle_on_invalidate(self):
         p = self._queuepool_fixture(
@@ -1908,6 +2017,106 @@ class QueuePoolTest(PoolTestBase):
         assert c2.connection is not None
 
 
+class PoolMetricsTest(PoolTestBase):
+    def test_checkout_checkin(self):
+        p = self._queuepool_fixture(pool_size=2, max_overflow=0)
+        c1 = p.connect()
+        c2 = p.connect()
+        c1.close()
+        c3 = p.connect()
+        c2.close()
+        c3.close()
+
+        m = p.metrics
+        eq_(m.checkouts, 3)
+        eq_(m.checkins, 3)
+        eq_(m.connects, 2)
+        eq_(sum(m.wait_histogram), 3)
+        eq_(m.timeouts, 0)
+
+    def test_threadlocal_checkout_counted_once(self):
+        p = self._queuepool_fixture(
+            pool_size=2, max_overflow=0, use_threadlocal=True)
+        c1 = p.connect()
+        c2 = p.connect()
+        is_(c1.connection, c2.connection)
+        eq_(p.metrics.checkouts, 1)
+
+    def _slow_connect_fixture(self, mock, delay, **kw):
+        dbapi = MockDBAPI()
+
+        def creator():
+            mock.return_value += delay
+            return dbapi.connect('foo.db')
+        return pool.QueuePool(creator=creator, **kw)
+
+    def test_wait_histogram(self):
+        with patch("sqlalchemy.pool.time.time") as mock:
+            mock.return_value = 10000
+            p = self._slow_connect_fixture(
+                mock, .5, pool_size=1, max_overflow=0)
+            c1 = p.connect()
+            c1.close()
+            c1 = p.connect()
+            c1.close()
+
+        m = p.metrics
+        eq_(m.wait_time, .5)
+        eq_(m.max_wait_time, .5)
+        eq_(m.wait_histogram, [1, 0, 0, 1, 0, 0])
+        eq_(
+            m.as_dict()["wait_histogram"],
+            [(.001, 1), (.01, 0), (.1, 0), (1, 1), (10, 0), (None, 0)]
+        )
+
+    def test_timeout(self):
+        p = self._queuepool_fixture(pool_size=1, max_overflow=0, timeout=0)
+        c1 = p.connect()  # noqa
+        assert_raises(tsa.exc.TimeoutError, p.connect)
+        eq_(p.metrics.timeouts, 1)
+        eq_(p.metrics.checkouts, 1)
+
+    def test_overflow_high_water(self):
+        p = self._queuepool_fixture(pool_size=1, max_overflow=5)
+        conns = [p.connect() for i in range(4)]
+        for c in conns:
+            c.close()
+        c1 = p.connect()
+        c1.close()
+        eq_(p.metrics.overflow_high_water, 3)
+
+    def test_invalidate(self):
+        p = self._queuepool_fixture(pool_size=1, max_overflow=0)
+        c1 = p.connect()
+        c1.invalidate(soft=True)
+        c1.invalidate()
+        c1.close()
+        eq_(p.metrics.soft_invalidations, 1)
+        eq_(p.metrics.invalidations, 1)
+
+    def test_connect_time(self):
+        with patch("sqlalchemy.pool.time.time") as mock:
+            mock.return_value = 10000
+            p = self._slow_connect_fixture(
+                mock, .25, pool_size=1, max_overflow=0)
+            c1 = p.connect()
+            c1.invalidate()
+            c1.close()
+            p.connect().close()
+
+        eq_(p.metrics.connects, 2)
+        eq_(p.metrics.connect_time, .5)
+        eq_(p.metrics.max_connect_time, .25)
+
+    def test_reset(self):
+        p = self._queuepool_fixture(pool_size=1, max_overflow=0)
+        p.connect().close()
+        p.metrics.reset()
+        eq_(p.metrics.checkouts, 0)
+        eq_(p.metrics.connects, 0)
+        eq_(p.metrics.wait_histogram, [0] * 6)
+
+
 class ResetOnReturnTest(PoolTestBase):
     def _fixture(self, **kw):
         dbapi = Mock()
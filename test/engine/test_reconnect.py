@@ -157,6 +157,24 @@ class PrePingMockTest(fixtures.TestBase):
             stale_cursor.execute, "hi"
         )
 
+    def test_metrics_across_restart(self):
+        pool = self._pool_fixture(pre_ping=True)
+
+        conn = pool.connect()
+        conn.close()
+
+        self.dbapi.shutdown("execute")
+        self.dbapi.restart()
+
+        conn = pool.connect()
+        conn.close()
+
+        eq_(pool.metrics.pre_ping_failures, 1)
+        eq_(pool.metrics.invalidations, 1)
+        eq_(pool.metrics.connects, 2)
+        eq_(pool.metrics.checkouts, 2)
+        eq_(pool.metrics.checkins, 2)
+
     def test_raise_db_is_stopped(self):
         pool = self._pool_fixture(pre_ping=True)
 
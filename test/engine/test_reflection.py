@@ -1,17 +1,22 @@
+import os
+import shutil
+import tempfile
 import unicodedata
 import sqlalchemy as sa
-from sqlalchemy import schema, inspect, sql
+from sqlalchemy import schema, inspect, sql, event
 from sqlalchemy import MetaData, Integer, String, Index, ForeignKey, \
     UniqueConstraint, FetchedValue, DefaultClause
 from sqlalchemy.testing import (
-    ComparesTables, engines, AssertsCompiledSQL,
+    ComparesTables, engines, AssertsCompiledSQL, AssertsExecutionResults,
     fixtures, skip)
 from sqlalchemy.testing.schema import Table, Column
 from sqlalchemy.testing import eq_, is_true, assert_raises, \
     assert_raises_message
 from sqlalchemy import testing
 from sqlalchemy.util import ue
+from sqlalchemy.engine.reflection import ReflectionCache
 from sqlalchemy.testing import config
+from sqlalchemy.testing import mock
 
 metadata, users = None, None
 
@@ -978,6 +983,58 @@ class ReflectionTest(fixtures.TestBase, ComparesTables):
         m1.reflect(bind=c)
         assert not c.closed
 
+    @testing.provide_metadata
+    def test_reflect_all_fetches_tables_at_once(self):
+        names = ['rt_%s' % name for name in ('a', 'b', 'c')]
+        for name in names:
+            Table(name, self.metadata,
+                  Column('id', sa.Integer, primary_key=True),
+                  Column('data', sa.String(30)))
+        Table('rt_d', self.metadata,
+              Column('id', sa.Integer, primary_key=True),
+              Column('a_id', sa.Integer, sa.ForeignKey('rt_a.id')),
+              test_needs_fk=True)
+        self.metadata.create_all()
+        names.append('rt_d')
+
+        dialect = testing.db.dialect
+        get_multi_columns = dialect.get_multi_columns
+        fetched = []
+
+        def spy(connection, schema=None, table_names=None, **kw):
+            result = get_multi_columns(
+                connection, schema, table_names, **kw)
+            fetched.append((table_names, result))
+            return result
+
+        m1 = MetaData()
+        reflected = []
+
+        def column_reflect(inspector, table, column_info):
+            if table.metadata is m1:
+                reflected.append(column_info)
+
+        event.listen(sa.Table, "column_reflect", column_reflect)
+        try:
+            with mock.patch.object(dialect, "get_multi_columns", spy):
+                m1.reflect(testing.db, only=names)
+        finally:
+            event.remove(sa.Table, "column_reflect", column_reflect)
+
+        eq_(set(m1.tables), set(names))
+        eq_(m1.tables['rt_b'].c.keys(), ['id', 'data'])
+        assert m1.tables['rt_d'].c.a_id.references(m1.tables['rt_a'].c.id)
+
+        # a single call fetched the columns of all tables; each Table
+        # was then reflected from that result
+        eq_(len(fetched), 1)
+        table_names, result = fetched[0]
+        eq_(table_names, names)
+        eq_(
+            set(id(col) for col in reflected),
+            set(id(col) for cols in result.values() for col in cols)
+        )
+
     def test_inspector_conn_closing(self):
         c = testing.db.connect()
         inspect(c)
@@ -1114,6 +1171,145 @@ class ReflectionTest(fixtures.TestBase, ComparesTables):
             _drop_views(metadata.bind)
 
 
+class ReflectionCacheTest(fixtures.TestBase, AssertsExecutionResults):
+    __backend__ = True
+
+    def setup(self):
+        self.dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.dir, "reflection.cache")
+        self.fingerprint = 1
+
+    def teardown(self):
+        shutil.rmtree(self.dir)
+
+    def _cache(self):
+        return ReflectionCache(
+            self.path, fingerprint=lambda conn, schema: self.fingerprint)
+
+    def _fixture(self, metadata):
+        Table('rc_a', metadata,
+              Column('id', sa.Integer, primary_key=True),
+              Column('data', sa.String(30)))
+        Table('rc_b', metadata,
+              Column('id', sa.Integer, primary_key=True),
+              Column('a_id', sa.Integer, sa.ForeignKey('rc_a.id')),
+              test_needs_fk=True)
+        metadata.create_all()
+
+    @testing.provide_metadata
+    def test_reflect_from_cache(self):
+        self._fixture(self.metadata)
+
+        m1 = MetaData()
+        m1.reflect(testing.db, only=['rc_a', 'rc_b'],
+                   reflection_cache=self._cache())
+        assert os.path.exists(self.path)
+
+        m2 = MetaData()
+
+        def go():
+            m2.reflect(testing.db, only=['rc_a', 'rc_b'],
+                       reflection_cache=self._cache())
+        self.assert_sql_count(testing.db, go, 0)
+
+        eq_(set(m2.tables), set(['rc_a', 'rc_b']))
+        eq_(m2.tables['rc_a'].c.keys(), ['id', 'data'])
+        assert m2.tables['rc_b'].c.a_id.references(m2.tables['rc_a'].c.id)
+        eq_(
+            [c.name for c in m2.tables['rc_b'].primary_key],
+            ['id']
+        )
+
+    @testing.provide_metadata
+    def test_fingerprint_mismatch(self):
+        self._fixture(self.metadata)
+
+        m1 = MetaData()
+        m1.reflect(testing.db, only=['rc_a'], reflection_cache=self._cache())
+
+        Table('rc_a', self.metadata,
+              Column('more_data', sa.String(30)), extend_existing=True)
+        self.metadata.tables['rc_a'].drop()
+        self.metadata.tables['rc_a'].create()
+
+        m2 = MetaData()
+        m2.reflect(testing.db, only=['rc_a'], reflection_cache=self._cache())
+        eq_(m2.tables['rc_a'].c.keys(), ['id', 'data'])
+
+        self.fingerprint = 2
+        m3 = MetaData()
+        m3.reflect(testing.db, only=['rc_a'], reflection_cache=self._cache())
+        eq_(m3.tables['rc_a'].c.keys(), ['id', 'data', 'more_data'])
+
+    @testing.provide_metadata
+    def test_additional_tables_added_to_cache(self):
+        self._fixture(self.metadata)
+
+        m1 = MetaData()
+        m1.reflect(testing.db, only=['rc_a'], reflection_cache=self._cache())
+
+        m2 = MetaData()
+        m2.reflect(testing.db, only=['rc_a', 'rc_b'],
+                   reflection_cache=self._cache())
+        eq_(set(m2.tables), set(['rc_a', 'rc_b']))
+
+        m3 = MetaData()
+
+        def go():
+            m3.reflect(testing.db, only=['rc_a', 'rc_b'],
+                       reflection_cache=self._cache())
+        self.assert_sql_count(testing.db, go, 0)
+        eq_(set(m3.tables), set(['rc_a', 'rc_b']))
+
+    @testing.provide_metadata
+    def test_unreadable_file(self):
+        self._fixture(self.metadata)
+
+        with open(self.path, 'wb') as file_:
+            file_.write(b"not a pickle")
+
+        m1 = MetaData()
+        with testing.expect_warnings("Ignoring unreadable reflection cache"):
+            m1.reflect(testing.db, only=['rc_a'],
+                       reflection_cache=self._cache())
+        eq_(m1.tables['rc_a'].c.keys(), ['id', 'data'])
+
+        m2 = MetaData()
+
+        def go():
+            m2.reflect(testing.db, only=['rc_a'],
+                       reflection_cache=self._cache())
+        self.assert_sql_count(testing.db, go, 0)
+
+    @testing.requires.schema_fingerprint
+    @testing.provide_metadata
+    def test_schema_fingerprint(self):
+        with testing.db.connect() as conn:
+            fp1 = conn.dialect.get_schema_fingerprint(conn)
+            eq_(conn.dialect.get_schema_fingerprint(conn), fp1)
+
+            self._fixture(self.metadata)
+            fp2 = conn.dialect.get_schema_fingerprint(conn)
+            is_true(fp2 != fp1)
+
+    @testing.requires.schema_fingerprint
+    @testing.provide_metadata
+    def test_default_fingerprint(self):
+        self._fixture(self.metadata)
+        cache = ReflectionCache(self.path)
+
+        m1 = MetaData()
+        m1.reflect(testing.db, only=['rc_a'], reflection_cache=cache)
+
+        Table('rc_c', self.metadata,
+              Column('id', sa.Integer, primary_key=True)).create()
+
+        m2 = MetaData()
+        m2.reflect(testing.db, only=['rc_a', 'rc_c'],
+                   reflection_cache=cache)
+        eq_(set(m2.tables), set(['rc_a', 'rc_c']))
+
+
 class CreateDropTest(fixtures.TestBase):
     __backend__ = True
 
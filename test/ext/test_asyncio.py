@@ -0,0 +1,245 @@
+from sqlalchemy import Column, Integer, String, select, exc
+from sqlalchemy.orm import mapper
+from sqlalchemy.pool import StaticPool
+from sqlalchemy.testing import fixtures, eq_, is_, assert_raises, \
+    assert_raises_message
+from sqlalchemy.testing.engines import testing_engine
+from sqlalchemy.testing.schema import Table
+
+
+class _AsyncFixture(object):
+    __requires__ = ('asyncio', 'sqlite')
+
+    @classmethod
+    def define_tables(cls, metadata):
+        Table(
+            'users', metadata,
+            Column('id', Integer, primary_key=True),
+            Column('name', String(30))
+        )
+
+    def setup(self):
+        super(_AsyncFixture, self).setup()
+        import asyncio
+        from sqlalchemy.ext.asyncio import AsyncEngine
+
+        self.sync_engine = testing_engine(
+            'sqlite://',
+            options=dict(
+                poolclass=StaticPool,
+                connect_args={"check_same_thread": False}))
+        self.metadata.create_all(self.sync_engine)
+        self.engine = AsyncEngine(self.sync_engine)
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+
+    def teardown(self):
+        import asyncio
+        self.loop.close()
+        asyncio.set_event_loop(None)
+        self.sync_engine.dispose()
+        super(_AsyncFixture, self).teardown()
+
+    def _run(self, awaitable):
+        return self.loop.run_until_complete(awaitable)
+
+    def _aiter(self, result):
+        rows = []
+        aiter = result.__aiter__()
+        while True:
+            try:
+                rows.append(self._run(aiter.__anext__()))
+            except StopAsyncIteration:
+                return rows
+
+
+class AsyncConnectionTest(_AsyncFixture, fixtures.TablesTest):
+
+    def test_connect_execute(self):
+        users = self.tables.users
+        conn = self._run(self.engine.connect())
+        self._run(conn.execute(
+            users.insert(), [{"id": 1, "name": "u1"}, {"id": 2, "name": "u2"}]
+        ))
+        result = self._run(
+            conn.execute(select([users]).order_by(users.c.id)))
+        eq_(result.fetchall(), [(1, "u1"), (2, "u2")])
+        eq_(self._run(conn.scalar(select([users.c.name]).
+                                  where(users.c.id == 2))), "u2")
+        self._run(conn.close())
+        is_(conn.closed, True)
+
+    def test_not_connected(self):
+        users = self.tables.users
+        conn = self.engine.connect()
+        assert_raises_message(
+            exc.InvalidRequestError,
+            "AsyncConnection is not connected",
+            conn.execute, users.select()
+        )
+
+    def test_context_manager(self):
+        users = self.tables.users
+        ctx = self.engine.connect()
+        conn = self._run(ctx.__aenter__())
+        is_(conn, ctx)
+        self._run(conn.execute(users.insert(), {"id": 1, "name": "u1"}))
+        self._run(ctx.__aexit__(None, None, None))
+        is_(conn.closed, True)
+
+    def test_transaction_commit(self):
+        users = self.tables.users
+        conn = self._run(self.engine.connect())
+        trans = conn.begin()
+        self._run(trans.__aenter__())
+        is_(trans.is_active, True)
+        self._run(conn.execute(users.insert(), {"id": 1, "name": "u1"}))
+        self._run(trans.__aexit__(None, None, None))
+        is_(trans.is_active, False)
+        eq_(self.sync_engine.scalar(select([users.c.name])), "u1")
+
+    def test_transaction_rollback(self):
+        users = self.tables.users
+        conn = self._run(self.engine.connect())
+        trans = self._run(conn.begin())
+        self._run(conn.execute(users.insert(), {"id": 1, "name": "u1"}))
+        self._run(trans.rollback())
+        eq_(self.sync_engine.scalar(select([users.c.name])), None)
+
+    def test_engine_begin(self):
+        users = self.tables.users
+
+        ctx = self.engine.begin()
+        conn = self._run(ctx.__aenter__())
+        self._run(conn.execute(users.insert(), {"id": 1, "name": "u1"}))
+        self._run(ctx.__aexit__(Exception, Exception(), None))
+        eq_(self.sync_engine.scalar(select([users.c.name])), None)
+
+        ctx = self.engine.begin()
+        conn = self._run(ctx.__aenter__())
+        self._run(conn.execute(users.insert(), {"id": 1, "name": "u1"}))
+        self._run(ctx.__aexit__(None, None, None))
+        eq_(self.sync_engine.scalar(select([users.c.name])), "u1")
+        is_(conn.closed, True)
+
+    def test_stream(self):
+        users = self.tables.users
+        conn = self._run(self.engine.connect())
+        self._run(conn.execute(
+            users.insert(),
+            [{"id": i, "name": "u%d" % i} for i in range(1, 11)]
+        ))
+        stmt = select([users]).order_by(users.c.id)
+
+        result = self._run(conn.stream(stmt))
+        result.chunksize = 3
+        eq_(self._aiter(result),
+            [(i, "u%d" % i) for i in range(1, 11)])
+
+        result = self._run(conn.stream(stmt))
+        result.chunksize = 3
+        eq_(self._run(result.__anext__()), (1, "u1"))
+        eq_(self._run(result.fetchone()), (2, "u2"))
+        eq_(self._run(result.fetchmany(3)), [(3, "u3"), (4, "u4"), (5, "u5")])
+        eq_(self._run(result.fetchall()),
+            [(i, "u%d" % i) for i in range(6, 11)])
+        self._run(result.close())
+
+    def test_run_sync(self):
+        users = self.tables.users
+        conn = self._run(self.engine.connect())
+
+        def go(sync_conn, value):
+            sync_conn.execute(users.insert(), {"id": 1, "name": value})
+            return sync_conn.scalar(select([users.c.name]))
+        eq_(self._run(conn.run_sync(go, "u1")), "u1")
+
+    def test_error_propagates(self):
+        conn = self._run(self.engine.connect())
+        assert_raises(
+            exc.DBAPIError,
+            self._run, conn.execute("select * from nonexistent")
+        )
+
+
+class AsyncSessionTest(_AsyncFixture, fixtures.MappedTest):
+
+    @classmethod
+    def setup_classes(cls):
+        class User(cls.Basic):
+            pass
+
+    @classmethod
+    def setup_mappers(cls):
+        mapper(cls.classes.User, cls.tables.users)
+
+    def _session(self):
+        from sqlalchemy.ext.asyncio import AsyncSession
+        return AsyncSession(self.engine)
+
+    def test_add_commit_get(self):
+        User = self.classes.User
+        session = self._session()
+        u1 = User(id=1, name="u1")
+        session.add(u1)
+        assert u1 in session
+        self._run(session.commit())
+
+        session = self._session()
+        u1 = self._run(session.get(User, 1))
+        eq_(u1.name, "u1")
+        self._run(session.close())
+
+    def test_execute_stream(self):
+        User = self.classes.User
+        users = self.tables.users
+        session = self._session()
+        session.add_all([User(id=i, name="u%d" % i) for i in range(1, 5)])
+        self._run(session.flush())
+
+        result = self._run(session.execute(
+            select([users.c.name]).order_by(users.c.id)))
+        eq_(result.fetchall(), [("u1", ), ("u2", ), ("u3", ), ("u4", )])
+
+        result = self._run(session.stream(
+            select([users.c.name]).order_by(users.c.id)))
+        eq_(self._aiter(result), [("u1", ), ("u2", ), ("u3", ), ("u4", )])
+
+        eq_(self._run(session.scalar(select([users.c.name]).
+                                     where(users.c.id == 3))), "u3")
+        self._run(session.rollback())
+        eq_(self.sync_engine.scalar(select([users.c.name])), None)
+
+    def test_run_sync(self):
+        User = self.classes.User
+        session = self._session()
+        session.add(User(id=1, name="u1"))
+        self._run(session.commit())
+
+        names = self._run(session.run_sync(
+            lambda sess: [u.name for u in sess.query(User)]))
+        eq_(names, ["u1"])
+
+    def test_delete_refresh(self):
+        User = self.classes.User
+        session = self._session()
+        u1 = User(id=1, name="u1")
+        session.add(u1)
+        self._run(session.commit())
+
+        self.sync_engine.execute(
+            self.tables.users.update().values(name="u1new"))
+        self._run(session.refresh(u1))
+        eq_(u1.name, "u1new")
+
+        self._run(session.delete(u1))
+        self._run(session.commit())
+        eq_(self.sync_engine.scalar(select([self.tables.users.c.id])), None)
+
+    def test_context_manager(self):
+        User = self.classes.User
+        session = self._session()
+        is_(self._run(session.__aenter__()), session)
+        session.add(User(id=1, name="u1"))
+        self._run(session.__aexit__(None, None, None))
+        eq_(list(session), [])
@@ -87,6 +87,7 @@ class AutomapTest(fixtures.MappedTest):
                 schema="some_schema",
                 extend_existing=True,
                 autoload_replace=False,
+                reflection_cache=None,
             )
 
     def test_prepare_defaults_to_no_schema(self):
@@ -105,6 +106,21 @@ class AutomapTest(fixtures.MappedTest):
                 schema=None,
                 extend_existing=True,
                 autoload_replace=False,
+                reflection_cache=None,
+            )
+
+    def test_prepare_passes_reflection_cache(self):
+        Base = automap_base(metadata=self.metadata)
+        engine_mock = Mock()
+        cache = Mock()
+        with patch.object(Base.metadata, "reflect") as reflect_mock:
+            Base.prepare(engine_mock, reflect=True, reflection_cache=cache)
+            reflect_mock.assert_called_once_with(
+                engine_mock,
+                schema=None,
+                extend_existing=True,
+                autoload_replace=False,
+                reflection_cache=cache,
             )
 
     def test_naming_schemes(self):
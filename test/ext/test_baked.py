@@ -360,7 +360,9 @@ class LikeQueryTest(BakedTest):
             eq_(u1.name, 'jack')
             sess.close()
 
-        eq_(len(bq._bakery), 2)
+        # the baked query plus the compiled statement, which is cached
+        # under both its identity and structural keys
+        eq_(len(bq._bakery), 3)
 
         # simulate race where mapper._get_clause
         # may be generated more than once
@@ -372,7 +374,10 @@ class LikeQueryTest(BakedTest):
             u1 = bq(sess).get(7)
             eq_(u1.name, 'jack')
             sess.close()
-        eq_(len(bq._bakery), 4)
+
+        # the new get clause uses new anonymous parameter names, so
+        # the statement is compiled again
+        eq_(len(bq._bakery), 6)
 
 
 class ResultTest(BakedTest):
@@ -804,7 +809,9 @@ class LazyLoaderTest(testing.AssertsCompiledSQL, BakedTest):
                 ad.dingalings
         l2 = len(lru)
         eq_(l1, 0)
-        eq_(l2, 2)
+        # the baked query plus the compiled statement, which is cached
+        # under both its identity and structural keys
+        eq_(l2, 3)
 
     def test_safe_bound_option_allows_bake(self):
         User, Address, Dingaling = self._o2m_twolevel_fixture(lazy="joined")
@@ -821,7 +828,9 @@ class LazyLoaderTest(testing.AssertsCompiledSQL, BakedTest):
                 ad.dingalings
         l2 = len(lru)
         eq_(l1, 0)
-        eq_(l2, 2)
+        # the baked query plus the compiled statement, which is cached
+        # under both its identity and structural keys
+        eq_(l2, 3)
 
     def test_baked_lazy_loading_relationship_flag_true(self):
         self._test_baked_lazy_loading_relationship_flag(True)
@@ -1,5 +1,6 @@
 import datetime
 import os
+import threading
 from sqlalchemy import *
 from sqlalchemy import event
 from sqlalchemy import sql, util
@@ -8,7 +9,7 @@ from sqlalchemy.ext.horizontal_shard import ShardedSession
 from sqlalchemy.sql import operators
 from sqlalchemy.testing import fixtures
 from sqlalchemy.testing.engines import testing_engine
-from sqlalchemy.testing import eq_
+from sqlalchemy.testing import eq_, assert_raises_message
 
 # TODO: ShardTest can be turned into a base for further subclasses
 
@@ -207,6 +208,85 @@ class ShardTest(object):
         )
 
 
+    def test_merge_by(self):
+        sess = self._fixture_data()
+        q = sess.query(WeatherLocation).order_by(WeatherLocation.id)
+
+        eq_(
+            [loc.id for loc in q.merge_by(lambda loc: loc.id)],
+            [1, 2, 3, 4, 5, 6, 7]
+        )
+        eq_(
+            [loc.id for loc in
+             q.order_by(None).order_by(WeatherLocation.id.desc()).
+             merge_by(lambda loc: loc.id, reverse=True)],
+            [7, 6, 5, 4, 3, 2, 1]
+        )
+
+    def test_merge_by_columns(self):
+        sess = self._fixture_data()
+        eq_(
+            sess.query(WeatherLocation.id, WeatherLocation.continent).
+            order_by(WeatherLocation.continent, WeatherLocation.id).
+            merge_by(lambda row: (row.continent, row.id)).all(),
+            [(1, 'Asia'), (4, 'Europe'), (5, 'Europe'),
+             (2, 'North America'), (3, 'North America'),
+             (6, 'South America'), (7, 'South America')]
+        )
+
+    def _count_statements(self):
+        # keyed on context, as option engines also invoke the
+        # listeners of their parent
+        canary = {}
+        for db in (db1, db2, db3, db4):
+            @event.listens_for(db, "before_cursor_execute")
+            def before_cursor_execute(
+                    conn, cursor, stmt, params, context, executemany):
+                if stmt.startswith("SELECT"):
+                    canary[id(context)] = context
+        return canary
+
+    def test_yield_per_streams(self):
+        sess = self._fixture_data()
+        canary = self._count_statements()
+
+        result = iter(
+            sess.query(WeatherLocation).yield_per(1).
+            enable_eagerloads(False))
+        loc = next(result)
+        eq_(loc.continent, 'North America')
+        eq_(len(canary), 1)
+
+        eq_(
+            [loc.continent for loc in result],
+            ['North America', 'Asia', 'Europe', 'Europe',
+             'South America', 'South America']
+        )
+        eq_(len(canary), 4)
+
+    def test_yield_per_merge_by(self):
+        canary = []
+
+        def load(instance, ctx):
+            canary.append((instance.id, ctx.attributes["shard_id"]))
+
+        event.listen(WeatherLocation, "load", load)
+        sess = self._fixture_data()
+
+        q = sess.query(WeatherLocation).order_by(WeatherLocation.id).\
+            yield_per(1).merge_by(lambda loc: loc.id)
+        eq_([loc.id for loc in q], [1, 2, 3, 4, 5, 6, 7])
+
+        # each shard is read ahead by one row, so loads don't
+        # take place in merged order
+        eq_(
+            sorted(canary),
+            [(1, 'asia'), (2, 'north_america'), (3, 'north_america'),
+             (4, 'europe'), (5, 'europe'), (6, 'south_america'),
+             (7, 'south_america')]
+        )
+
+
 class DistinctEngineShardTest(ShardTest, fixtures.TestBase):
 
     def _init_dbs(self):
@@ -227,6 +307,131 @@ class DistinctEngineShardTest(ShardTest, fixtures.TestBase):
             os.remove("shard%d.db" % i)
 
 
+class _ThreadExecutor(object):
+    def __init__(self):
+        self.threads = []
+
+    def submit(self, fn, *args):
+        t = threading.Thread(target=fn, args=args)
+        self.threads.append(t)
+        t.start()
+
+
+class _FailingExecutor(_ThreadExecutor):
+    def submit(self, fn, *args):
+        if self.threads:
+            raise Exception("executor failure")
+        super(_FailingExecutor, self).submit(fn, *args)
+
+
+class ParallelShardTest(DistinctEngineShardTest):
+
+    def _init_dbs(self):
+        return [
+            testing_engine(
+                'sqlite:///shard%d.db' % i,
+                options=dict(pool_threadlocal=i == 1,
+                             connect_args={"check_same_thread": False}))
+            for i in range(1, 5)
+        ]
+
+    @classmethod
+    def setup_session(cls):
+        super(ParallelShardTest, cls).setup_session()
+        cls.executor = _ThreadExecutor()
+        create_session.configure(shard_executor=cls.executor)
+
+    def test_runs_in_threads(self):
+        sess = self._fixture_data()
+        del self.executor.threads[:]
+        eq_(
+            sorted(loc.continent for loc in sess.query(WeatherLocation)),
+            ['Asia', 'Europe', 'Europe', 'North America', 'North America',
+             'South America', 'South America']
+        )
+        eq_(len(self.executor.threads), 4)
+
+        sess.query(WeatherLocation).filter(
+            WeatherLocation.continent == 'Asia').all()
+        eq_(len(self.executor.threads), 4)
+
+    def test_yield_per_streams(self):
+        sess = self._fixture_data()
+
+        result = sess.query(WeatherLocation).yield_per(1).\
+            enable_eagerloads(False)
+        eq_(
+            sorted(loc.continent for loc in result),
+            ['Asia', 'Europe', 'Europe', 'North America', 'North America',
+             'South America', 'South America']
+        )
+
+    def test_shard_id_event(self):
+        canary = []
+
+        def load(instance, ctx):
+            canary.append(ctx.attributes["shard_id"])
+
+        event.listen(WeatherLocation, "load", load)
+        sess = self._fixture_data()
+
+        # shards are loaded in the order in which they complete
+        sess.query(WeatherLocation).all()
+        eq_(
+            sorted(canary),
+            ['asia', 'europe', 'europe', 'north_america', 'north_america',
+             'south_america', 'south_america']
+        )
+
+    def test_error_raised(self):
+        sess = self._fixture_data()
+
+        def fail(conn, cursor, stmt, params, context, executemany):
+            raise Exception("shard failure")
+        event.listen(db3, "before_cursor_execute", fail)
+
+        assert_raises_message(
+            Exception, "shard failure",
+            sess.query(WeatherLocation).all
+        )
+
+    def test_loads_as_shards_complete(self):
+        sess = self._fixture_data()
+        loaded = threading.Event()
+        waited = []
+
+        def wait(conn, cursor, stmt, params, context, executemany):
+            waited.append(loaded.wait(5))
+        event.listen(db4, "before_cursor_execute", wait)
+
+        def load(instance, ctx):
+            loaded.set()
+        event.listen(WeatherLocation, "load", load)
+
+        # the last shard doesn't execute until another shard's rows
+        # have been loaded
+        eq_(len(sess.query(WeatherLocation).all()), 7)
+        eq_(waited, [True])
+
+    def test_submit_error_raised(self):
+        sess = self._fixture_data()
+        executor = _FailingExecutor()
+
+        q = sess.query(WeatherLocation)
+        q.shard_executor = executor
+        assert_raises_message(
+            Exception, "executor failure",
+            q.all
+        )
+        # the task which was submitted has completed
+        eq_(len(executor.threads), 1)
+        executor.threads[0].join(5)
+        assert not executor.threads[0].is_alive()
+
+        # the session remains usable
+        eq_(len(sess.query(WeatherLocation).all()), 7)
+
+
 class AttachedFileShardTest(ShardTest, fixtures.TestBase):
     schema = "changeme"
 
@@ -0,0 +1,162 @@
+import os
+import shutil
+import tempfile
+
+from . import _fixtures
+from sqlalchemy.orm import mapper, relationship, Session, \
+    configure_mappers, clear_mappers, class_mapper
+from sqlalchemy.orm.interfaces import ONETOMANY, MANYTOONE, MANYTOMANY
+from sqlalchemy.orm.artifacts import ArtifactCache
+from sqlalchemy.orm.relationships import JoinCondition
+from sqlalchemy.orm import unitofwork
+from sqlalchemy.testing.assertions import eq_, is_, expect_warnings
+from sqlalchemy.testing import mock
+from sqlalchemy import and_
+
+
+class ArtifactCacheTest(_fixtures.FixtureTest):
+    run_inserts = 'each'
+
+    def setup(self):
+        super(ArtifactCacheTest, self).setup()
+        self.dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.dir, "mappers.cache")
+
+    def teardown(self):
+        shutil.rmtree(self.dir)
+        super(ArtifactCacheTest, self).teardown()
+
+    def _setup_mappers(self, addresses_primaryjoin=None):
+        User, users, Address, addresses, Order, orders, Item, items, \
+            order_items = (
+                self.classes.User, self.tables.users,
+                self.classes.Address, self.tables.addresses,
+                self.classes.Order, self.tables.orders,
+                self.classes.Item, self.tables.items,
+                self.tables.order_items)
+
+        mapper(User, users, properties={
+            'addresses': relationship(
+                Address, backref='user', order_by=addresses.c.id,
+                primaryjoin=addresses_primaryjoin),
+            'orders': relationship(Order, order_by=orders.c.id)
+        })
+        mapper(Address, addresses)
+        mapper(Order, orders, properties={
+            'items': relationship(
+                Item, secondary=order_items, order_by=items.c.id)
+        })
+        mapper(Item, items)
+
+    def _dump(self, fn=None):
+        self._setup_mappers()
+        configure_mappers()
+        if fn is not None:
+            fn()
+        ArtifactCache(self.path).dump()
+        clear_mappers()
+
+    def _analyzed(self, fn):
+        """Run fn, returning the keys of the relationships whose join
+        conditions were analyzed."""
+
+        keys = []
+        annotate_fks = JoinCondition._annotate_fks
+
+        def _annotate_fks(jc):
+            keys.append(jc.prop.key)
+            annotate_fks(jc)
+
+        with mock.patch.object(
+                JoinCondition, "_annotate_fks", _annotate_fks):
+            fn()
+        return sorted(keys)
+
+    def test_join_conditions_restored(self):
+        self._dump()
+        self._setup_mappers()
+        is_(ArtifactCache(self.path).load(), True)
+
+        eq_(self._analyzed(configure_mappers), [])
+
+        User = self.classes.User
+        sess = Session()
+        eq_(
+            sess.query(User).order_by(User.id).all(),
+            self.static.user_all_result
+        )
+
+    def test_restored_matches_analyzed(self):
+        User, Address, Order, users, addresses = (
+            self.classes.User, self.classes.Address, self.classes.Order,
+            self.tables.users, self.tables.addresses)
+
+        self._dump()
+        self._setup_mappers()
+        ArtifactCache(self.path).load()
+        configure_mappers()
+
+        for cls, key, direction in (
+            (User, 'addresses', ONETOMANY),
+            (Address, 'user', MANYTOONE),
+        ):
+            prop = class_mapper(cls).attrs[key]
+            is_(prop.direction, direction)
+            eq_(len(prop.synchronize_pairs), 1)
+            is_(prop.synchronize_pairs[0][0], users.c.id)
+            is_(prop.synchronize_pairs[0][1], addresses.c.user_id)
+        is_(class_mapper(Order).attrs['items'].direction, MANYTOMANY)
+
+    def test_changed_arguments_analyzed(self):
+        Address, addresses = self.classes.Address, self.tables.addresses
+
+        self._dump()
+        self._setup_mappers(
+            addresses_primaryjoin=lambda: and_(
+                self.tables.users.c.id == addresses.c.user_id,
+                addresses.c.email_address != None))
+        ArtifactCache(self.path).load()
+
+        eq_(self._analyzed(configure_mappers), ['addresses', 'user'])
+
+    def test_flush_order_restored(self):
+        User, Address = self.classes.User, self.classes.Address
+
+        def flush():
+            sess = Session()
+            sess.add(User(name='u1', addresses=[Address(email_address='a')]))
+            sess.flush()
+            sess.rollback()
+
+        self._dump(flush)
+        self._setup_mappers()
+        ArtifactCache(self.path).load()
+
+        with mock.patch.object(
+                unitofwork.topological, "find_cycles",
+                wraps=unitofwork.topological.find_cycles) as find_cycles:
+            sess = Session()
+            u1 = User(name='u2', addresses=[Address(email_address='b')])
+            sess.add(u1)
+            sess.flush()
+        eq_(find_cycles.mock_calls, [])
+        eq_(
+            sess.query(Address).filter_by(email_address='b').one().user,
+            u1)
+
+    def test_missing_file(self):
+        self._setup_mappers()
+        is_(ArtifactCache(self.path).load(), False)
+
+    def test_other_version_ignored(self):
+        self._dump()
+        self._setup_mappers()
+        with mock.patch.object(ArtifactCache, "format_version", 0):
+            is_(ArtifactCache(self.path).load(), False)
+
+    def test_unreadable_file(self):
+        with open(self.path, 'wb') as file_:
+            file_.write(b'not a pickle')
+        self._setup_mappers()
+        with expect_warnings("Ignoring unreadable artifact cache"):
+            is_(ArtifactCache(self.path).load(), False)
@@ -11,7 +11,7 @@ from sqlalchemy.orm import mapper, relationship, backref, \
     create_session, class_mapper, configure_mappers, reconstructor, \
     aliased, deferred, synonym, attributes, \
     column_property, composite, dynamic_loader, \
-    comparable_property, Session
+    comparable_property, Session, set_lazy_configure
 from sqlalchemy.orm.persistence import _sort_states
 from sqlalchemy.testing import eq_, AssertsCompiledSQL, is_
 from sqlalchemy.testing import fixtures
@@ -1901,9 +1901,117 @@ class DocumentTest(fixtures.TestBase):
         eq_(Bar.foo.__doc__, "foo relationship")
 
 
+class LazyConfigureTest(_fixtures.FixtureTest):
+    run_inserts = None
+
+    def setup(self):
+        super(LazyConfigureTest, self).setup()
+        set_lazy_configure()
+
+    def teardown(self):
+        set_lazy_configure(False)
+        super(LazyConfigureTest, self).teardown()
+
+    def test_configures_linked_mappers_only(self):
+        User, users, Address, addresses, Order, orders = (
+            self.classes.User, self.tables.users,
+            self.classes.Address, self.tables.addresses,
+            self.classes.Order, self.tables.orders)
+
+        m1 = mapper(User, users, properties={
+            "addresses": relationship(Address)})
+        m2 = mapper(Address, addresses)
+        m3 = mapper(Order, orders)
+
+        create_session().query(User)
+        is_(m1.configured, True)
+        is_(m2.configured, True)
+        is_(m3.configured, False)
+
+        configure_mappers()
+        is_(m3.configured, True)
+
+    def test_backref_from_new_mapper(self):
+        User, users, Address, addresses = (
+            self.classes.User, self.tables.users,
+            self.classes.Address, self.tables.addresses)
+
+        m1 = mapper(User, users)
+        create_session().query(User)
+        is_(m1.configured, True)
+
+        m2 = mapper(Address, addresses, properties={
+            "user": relationship(User, backref="addresses")})
+        is_(m2.configured, False)
+
+        assert "addresses" in class_mapper(User).attrs
+        is_(m2.configured, True)
+
+    def test_inheritance(self):
+        users = self.tables.users
+
+        class Base(object):
+            pass
+
+        class Sub(Base):
+            pass
+
+        m1 = mapper(Base, users, polymorphic_on=users.c.name)
+        m2 = mapper(Sub, inherits=Base, polymorphic_identity='sub')
+
+        class_mapper(Base)
+        is_(m1.configured, True)
+        is_(m2.configured, True)
+
+    def test_events_per_group(self):
+        User, users, Order, orders = (
+            self.classes.User, self.tables.users,
+            self.classes.Order, self.tables.orders)
+
+        m1 = mapper(User, users)
+        m2 = mapper(Order, orders)
+
+        canary = []
+        sa.event.listen(
+            mapper, "before_configured", lambda: canary.append("before"))
+        sa.event.listen(
+            mapper, "mapper_configured",
+            lambda m, cls: canary.append(cls.__name__))
+        sa.event.listen(
+            mapper, "after_configured", lambda: canary.append("after"))
+
+        class_mapper(User)
+        class_mapper(Order)
+        class_mapper(User)
+        eq_(canary, ["before", "User", "after", "before", "Order", "after"])
+
+    def test_unrelated_failure_deferred(self):
+        User, users, Order, orders = (
+            self.classes.User, self.tables.users,
+            self.classes.Order, self.tables.orders)
+
+        def unresolvable():
+            raise sa.exc.InvalidRequestError("can't locate 'Nonexistent'")
+
+        m1 = mapper(User, users)
+        m2 = mapper(Order, orders, properties={
+            "thing": relationship(unresolvable)})
+
+        class_mapper(User)
+        is_(m1.configured, True)
+        is_(m2.configured, False)
+
+        assert_raises_message(
+            sa.exc.InvalidRequestError,
+            "can't locate 'Nonexistent'",
+            class_mapper, Order
+        )
+
+
 class ORMLoggingTest(_fixtures.FixtureTest):
 
     def setup(self):
+        super(ORMLoggingTest, self).setup()
         self.buf = logging.handlers.BufferingHandler(100)
         for log in [
             logging.getLogger('sqlalchemy.orm'),
@@ -1915,6 +2023,7 @@ class ORMLoggingTest(_fixtures.FixtureTest):
             logging.getLogger('sqlalchemy.orm'),
         ]:
             log.removeHandler(self.buf)
+        super(ORMLoggingTest, self).teardown()
 
     def _current_messages(self):
         return [b.getMessage() for b in self.buf.buffer]
@@ -1930,6 +2039,30 @@ class ORMLoggingTest(_fixtures.FixtureTest):
         for msg in self._current_messages():
             assert msg.startswith('(User|%%(%d anon)s) ' % id(tb))
 
+    def test_configure_timings(self):
+        User, users, Address, addresses = (
+            self.classes.User, self.tables.users,
+            self.classes.Address, self.tables.addresses)
+
+        mapper(User, users, properties={
+            "addresses": relationship(Address)})
+        mapper(Address, addresses)
+
+        logger = logging.getLogger('sqlalchemy.orm.mapper.Mapper')
+        level = logger.level
+        logger.setLevel(logging.INFO)
+        try:
+            configure_mappers()
+        finally:
+            logger.setLevel(level)
+
+        summary = [
+            msg for msg in self._current_messages()
+            if msg.startswith("configured ")]
+        eq_(len(summary), 1)
+        assert summary[0].startswith("configured 2 mappers in ")
+        assert "slowest properties: User.addresses (" in summary[0]
+
 
 class OptionsTest(_fixtures.FixtureTest):
 
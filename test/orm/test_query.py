@@ -6,9 +6,10 @@ from sqlalchemy.sql import operators, expression
 from sqlalchemy import column, table
 from sqlalchemy.engine import default
 from sqlalchemy.orm import (
-    attributes, mapper, relationship, create_session, synonym, Session,
+    attributes, loading, mapper, relationship, create_session, synonym, Session,
     aliased, column_property, joinedload_all, joinedload, Query, Bundle,
-    subqueryload, backref, lazyload, defer)
+    subqueryload, backref, lazyload, defer, selectinload,
+    exc as orm_exc)
 from sqlalchemy.testing.assertsql import CompiledSQL
 from sqlalchemy.testing.schema import Table, Column
 import sqlalchemy as sa
@@ -694,6 +695,231 @@ class GetTest(QueryTest):
         assert u.orders[1].items[2].description == 'item 5'
 
 
+class GetManyTest(QueryTest):
+    def test_get_many(self):
+        User = self.classes.User
+
+        s = Session()
+        users = s.query(User).get_many([9, 7, 19, 8])
+        eq_([u.id if u else None for u in users], [9, 7, None, 8])
+
+    def test_identity_map_hits(self):
+        User = self.classes.User
+
+        s = Session()
+        u7 = s.query(User).get(7)
+        u8 = s.query(User).get(8)
+
+        users = []
+
+        def go():
+            users.extend(s.query(User).get_many([8, 9, 7]))
+            eq_(users, [u8, User(id=9), u7])
+        self.assert_sql_count(testing.db, go, 1)
+
+        def go():
+            eq_(s.get_many(User, [7, 8, 9]), [u7, u8, users[1]])
+        self.assert_sql_count(testing.db, go, 0)
+
+    def test_expired_reloaded(self):
+        User = self.classes.User
+
+        s = Session()
+        u7 = s.query(User).get(7)
+        u8 = s.query(User).get(8)
+        s.expire(u7)
+
+        def go():
+            users = s.query(User).get_many([7, 8, 9])
+            eq_(users, [u7, u8, User(id=9, name='fred')])
+            assert 'name' in u7.__dict__
+        self.assert_sql_count(testing.db, go, 1)
+
+    def test_string_idents(self):
+        User = self.classes.User
+
+        s = Session()
+        users = s.query(User).get_many(['8', '7', '19'])
+        eq_([u.id if u else None for u in users], [8, 7, None])
+        is_(users[0], s.query(User).get('8'))
+
+    def test_duplicates(self):
+        User = self.classes.User
+
+        s = Session()
+
+        def go():
+            users = s.query(User).get_many([7, 8, 7])
+            is_(users[0], users[2])
+        self.assert_sql_count(testing.db, go, 1)
+
+    def test_empty(self):
+        User = self.classes.User
+
+        s = Session()
+        eq_(s.query(User).get_many([]), [])
+
+    def test_chunks(self):
+        User = self.classes.User
+
+        s = Session()
+        load_on_idents = loading.load_on_idents
+        with mock.patch.object(
+                loading, "load_on_idents",
+                lambda query, keys: load_on_idents(query, keys, 2)):
+            def go():
+                users = s.query(User).get_many([10, 9, 8, 7, 11])
+                eq_(
+                    [u.id if u else None for u in users],
+                    [10, 9, 8, 7, None])
+            self.assert_sql_count(testing.db, go, 3)
+
+    def test_composite_pk(self):
+        CompositePk = self.classes.CompositePk
+
+        s = Session()
+        one_two = s.query(CompositePk).get((1, 2))
+
+        def go():
+            objs = s.query(CompositePk).get_many(
+                [(2, 2), (1, 2), (100, 100), (2, 1)])
+            eq_(
+                [(o.i, o.j, o.k) if o else None for o in objs],
+                [(2, 2, 6), (1, 2, 3), None, (2, 1, 4)]
+            )
+            is_(objs[1], one_two)
+        self.assert_sql_count(testing.db, go, 1)
+
+    def test_wrong_params(self):
+        CompositePk = self.classes.CompositePk
+
+        s = Session()
+        q = s.query(CompositePk)
+        assert_raises_message(
+            sa_exc.InvalidRequestError,
+            r"Incorrect number of values in identifier to formulate "
+            r"primary key for query.get_many\(\)",
+            q.get_many, [(1, 2), (7, )])
+
+    def test_against_col(self):
+        User = self.classes.User
+
+        s = Session()
+        q = s.query(User.id)
+        assert_raises(sa_exc.InvalidRequestError, q.get_many, [5])
+
+    def test_existing_criterion(self):
+        User = self.classes.User
+
+        s = Session()
+        q = s.query(User).filter(User.name == 'jack')
+        assert_raises(sa_exc.InvalidRequestError, q.get_many, [7])
+
+    def test_options_applied(self):
+        User = self.classes.User
+
+        s = Session()
+
+        def go():
+            users = s.query(User).options(joinedload(User.addresses)).\
+                get_many([7, 8])
+            eq_([len(u.addresses) for u in users], [1, 3])
+        self.assert_sql_count(testing.db, go, 1)
+
+
+class ReadonlyTest(QueryTest):
+    def test_instances_detached(self):
+        User = self.classes.User
+
+        s = Session()
+        users = s.query(User).readonly().order_by(User.id).all()
+        eq_([u.name for u in users], ['jack', 'ed', 'fred', 'chuck'])
+        for u in users:
+            assert inspect(u).detached
+        eq_(len(s.identity_map), 0)
+
+    def test_identity_map_not_used(self):
+        User = self.classes.User
+
+        s = Session()
+        u7 = s.query(User).get(7)
+
+        u7_ro = s.query(User).readonly().filter_by(id=7).one()
+        is_not_(u7_ro, u7)
+
+        def go():
+            is_not_(s.query(User).readonly().get(7), u7)
+        self.assert_sql_count(testing.db, go, 1)
+
+        is_(s.query(User).get(7), u7)
+        eq_(len(s.identity_map), 1)
+
+    def test_changes_not_tracked(self):
+        User = self.classes.User
+
+        s = Session()
+        u7 = s.query(User).readonly().get(7)
+        u7.name = 'modified'
+        eq_(len(s.dirty), 0)
+        s.rollback()
+
+        eq_(s.query(User).get(7).name, 'jack')
+
+    def test_identity_within_result(self):
+        Address = self.classes.Address
+
+        s = Session()
+        addresses = s.query(Address).options(joinedload(Address.user)).\
+            readonly().filter_by(user_id=8).all()
+        eq_(len(addresses), 3)
+        is_(addresses[0].user, addresses[1].user)
+        is_(addresses[1].user, addresses[2].user)
+        assert inspect(addresses[0].user).detached
+
+    def _assert_eager(self, opt):
+        User = self.classes.User
+
+        s = Session()
+        users = s.query(User).options(opt(User.addresses)).\
+            readonly().order_by(User.id).all()
+        eq_([len(u.addresses) for u in users], [1, 3, 1, 0])
+        for u in users:
+            for a in u.addresses:
+                assert inspect(a).detached
+        eq_(len(s.identity_map), 0)
+
+    def test_joinedload(self):
+        self._assert_eager(joinedload)
+
+    def test_subqueryload(self):
+        self._assert_eager(subqueryload)
+
+    def test_selectinload(self):
+        self._assert_eager(selectinload)
+
+    def test_events(self):
+        User = self.classes.User
+
+        s = Session()
+        canary = mock.Mock()
+        sa.event.listen(User, "load", canary.load)
+        sa.event.listen(
+            s, "loaded_as_persistent", canary.loaded_as_persistent)
+
+        u7 = s.query(User).readonly().get(7)
+        eq_(canary.mock_calls, [mock.call.load(u7, mock.ANY)])
+
+    def test_lazyload_detached(self):
+        User = self.classes.User
+
+        s = Session()
+        u7 = s.query(User).readonly().get(7)
+        assert_raises(
+            orm_exc.DetachedInstanceError,
+            getattr, u7, 'addresses'
+        )
+
+
 class InvalidGenerationsTest(QueryTest, AssertsCompiledSQL):
     def test_no_limit_offset(self):
         User = self.classes.User
@@ -0,0 +1,355 @@
+from . import _fixtures
+from sqlalchemy.orm import Session, QueryCache, MemoryCacheBackend, \
+    ClientCacheBackend, joinedload, selectinload
+from sqlalchemy.testing.assertions import eq_, is_, is_not_
+from sqlalchemy.testing import mock
+from sqlalchemy import testing, inspect
+
+
+class _DictClient(object):
+    """Imitate a memcached client."""
+
+    def __init__(self):
+        self.data = {}
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def get_multi(self, keys):
+        return dict((k, self.data[k]) for k in keys if k in self.data)
+
+    def set(self, key, value, time=0):
+        self.data[key] = value
+
+    def delete(self, key):
+        self.data.pop(key, None)
+
+
+class QueryCacheTest(_fixtures.FixtureTest):
+    run_setup_mappers = 'once'
+    run_inserts = 'each'
+    run_deletes = 'each'
+
+    @classmethod
+    def setup_mappers(cls):
+        cls._setup_stock_mapping()
+
+    def _session(self, cache, **kw):
+        return Session(testing.db, query_cache=cache, **kw)
+
+    def _user_query(self, sess, name):
+        User = self.classes.User
+        return sess.query(User).filter(User.name == name).cache()
+
+    def test_hit_emits_no_sql(self):
+        cache = QueryCache()
+
+        s1 = self._session(cache)
+        u1 = self._user_query(s1, 'jack').one()
+        s1.close()
+        eq_(cache.misses, 1)
+
+        s2 = self._session(cache)
+
+        def go():
+            u2 = self._user_query(s2, 'jack').one()
+            eq_(u2.name, 'jack')
+            eq_(u2.id, 7)
+            is_not_(u2, u1)
+            is_(inspect(u2).session, s2)
+            assert inspect(u2).persistent
+        self.assert_sql_count(testing.db, go, 0)
+        eq_(cache.hits, 1)
+
+    def test_not_cached_without_cache_call(self):
+        User = self.classes.User
+        cache = QueryCache()
+        s1 = self._session(cache)
+        s1.query(User).filter(User.name == 'jack').all()
+        eq_(cache.misses, 0)
+        eq_(cache.hits, 0)
+
+    def test_no_query_cache_on_session(self):
+        s1 = Session(testing.db)
+        eq_(self._user_query(s1, 'jack').one().id, 7)
+
+    def test_bound_values_distinguish(self):
+        cache = QueryCache()
+        s1 = self._session(cache)
+        eq_(self._user_query(s1, 'jack').one().id, 7)
+        eq_(self._user_query(s1, 'ed').one().id, 8)
+        eq_(cache.misses, 2)
+
+        s2 = self._session(cache)
+        eq_(self._user_query(s2, 'ed').one().id, 8)
+        eq_(self._user_query(s2, 'jack').one().id, 7)
+        eq_(cache.hits, 2)
+
+    def test_entities_distinguish(self):
+        User = self.classes.User
+        cache = QueryCache()
+        s1 = self._session(cache)
+
+        users = s1.query(User).order_by(User.id).cache().all()
+        rows = s1.query(User.id, User.name).order_by(User.id).cache().all()
+        eq_(cache.misses, 2)
+        eq_([u.id for u in users], [7, 8, 9, 10])
+        eq_(rows, [(7, 'jack'), (8, 'ed'), (9, 'fred'), (10, 'chuck')])
+
+        s2 = self._session(cache)
+
+        def go():
+            rows = s2.query(User.id, User.name).\
+                order_by(User.id).cache().all()
+            eq_([row.name for row in rows], ['jack', 'ed', 'fred', 'chuck'])
+
+            rows = s2.query(User, User.name).\
+                order_by(User.id).cache().all()
+            eq_([row.User.id for row in rows], [7, 8, 9, 10])
+        self.assert_sql_count(testing.db, go, 1)
+
+    def _assert_loader_options_distinguish(self, cache):
+        User = self.classes.User
+
+        s1 = self._session(cache)
+        self._user_query(s1, 'ed').one()
+        s1.close()
+
+        s2 = self._session(cache)
+        ed = self._user_query(s2, 'ed').options(
+            selectinload(User.addresses)).one()
+        eq_(cache.misses, 2)
+
+        def go():
+            eq_(len(ed.addresses), 3)
+        self.assert_sql_count(testing.db, go, 0)
+        s2.close()
+
+        s3 = self._session(cache)
+
+        def go():
+            ed = self._user_query(s3, 'ed').options(
+                selectinload(User.addresses)).one()
+            eq_(len(ed.addresses), 3)
+        self.assert_sql_count(testing.db, go, 0)
+        eq_(cache.hits, 1)
+
+    def test_loader_options_distinguish(self):
+        self._assert_loader_options_distinguish(QueryCache())
+
+    def test_loader_options_distinguish_string_keys(self):
+        self._assert_loader_options_distinguish(
+            QueryCache(ClientCacheBackend(_DictClient())))
+
+    def test_multiple_entities(self):
+        User, Address = self.classes.User, self.classes.Address
+        cache = QueryCache()
+
+        def query(sess):
+            return sess.query(User, Address.email_address).\
+                join(User.addresses).filter(Address.id == 1).cache()
+
+        s1 = self._session(cache)
+        row = query(s1).one()
+        s1.close()
+
+        s2 = self._session(cache)
+
+        def go():
+            cached = query(s2).one()
+            eq_(cached.email_address, row.email_address)
+            eq_(cached.User.name, 'jack')
+            is_(inspect(cached.User).session, s2)
+        self.assert_sql_count(testing.db, go, 0)
+
+    def test_existing_identity_returned(self):
+        cache = QueryCache()
+        s1 = self._session(cache)
+        self._user_query(s1, 'jack').one()
+
+        s2 = self._session(cache, autoflush=False)
+        User = self.classes.User
+        u = s2.query(User).get(7)
+        u.name = 'modified'
+        is_(self._user_query(s2, 'jack').one(), u)
+        eq_(cache.hits, 1)
+
+    def test_invalidated_on_commit(self):
+        User = self.classes.User
+        cache = QueryCache()
+        s1 = self._session(cache)
+        self._user_query(s1, 'jack').one()
+        s1.close()
+
+        s2 = self._session(cache)
+        s2.query(User).get(7).name = 'jack2'
+        s2.flush()
+
+        # another session continues to use the cache until commit
+        s3 = self._session(cache)
+        eq_(self._user_query(s3, 'jack').one().id, 7)
+        eq_(cache.hits, 1)
+        s3.close()
+
+        # the flushing session bypasses the cache for the table
+        eq_(self._user_query(s2, 'jack').all(), [])
+        eq_(cache.hits, 1)
+        eq_(cache.misses, 1)
+        s2.commit()
+
+        s4 = self._session(cache)
+        eq_(self._user_query(s4, 'jack').all(), [])
+        eq_(self._user_query(s4, 'jack2').one().id, 7)
+        eq_(cache.misses, 3)
+
+    def test_not_invalidated_on_rollback(self):
+        User = self.classes.User
+        cache = QueryCache()
+        s1 = self._session(cache)
+        self._user_query(s1, 'jack').one()
+
+        s2 = self._session(cache)
+        s2.query(User).get(7).name = 'jack2'
+        s2.flush()
+        s2.rollback()
+
+        eq_(self._user_query(s2, 'jack').one().id, 7)
+        eq_(cache.hits, 1)
+
+    def test_invalidated_by_bulk_update(self):
+        User = self.classes.User
+        cache = QueryCache()
+        s1 = self._session(cache)
+        self._user_query(s1, 'jack').one()
+
+        s1.query(User).filter(User.id == 7).update(
+            {"name": "jack2"}, synchronize_session=False)
+        s1.commit()
+
+        eq_(self._user_query(s1, 'jack').all(), [])
+        eq_(cache.hits, 0)
+
+    def test_invalidated_by_related_table(self):
+        User, Address = self.classes.User, self.classes.Address
+        cache = QueryCache()
+
+        def query(sess):
+            return sess.query(User).options(joinedload(User.addresses)).\
+                filter(User.id == 8).cache()
+
+        s1 = self._session(cache)
+        eq_(len(query(s1).one().addresses), 3)
+        s1.close()
+
+        s2 = self._session(cache)
+
+        def go():
+            eq_(len(query(s2).one().addresses), 3)
+        self.assert_sql_count(testing.db, go, 0)
+        s2.close()
+
+        s3 = self._session(cache)
+        s3.delete(s3.query(Address).get(2))
+        s3.commit()
+
+        s4 = self._session(cache)
+        eq_(len(query(s4).one().addresses), 2)
+        eq_(cache.hits, 1)
+        eq_(cache.misses, 2)
+
+    def test_lazyloaded_related_dependency(self):
+        User, Address = self.classes.User, self.classes.Address
+        cache = QueryCache()
+
+        s1 = self._session(cache)
+        eq_(len(self._user_query(s1, 'ed').one().addresses), 3)
+        s1.close()
+
+        s2 = self._session(cache)
+        s2.delete(s2.query(Address).get(2))
+        s2.commit()
+
+        # the collection was loaded after the result was cached, so
+        # the result doesn't depend on the addresses table
+        s3 = self._session(cache)
+        eq_(len(self._user_query(s3, 'ed').one().addresses), 2)
+        eq_(cache.hits, 1)
+
+    def test_manual_invalidate(self):
+        User = self.classes.User
+        users = self.tables.users
+        cache = QueryCache()
+        s1 = self._session(cache)
+        self._user_query(s1, 'jack').one()
+        s1.close()
+
+        with testing.db.connect() as conn:
+            conn.execute(
+                users.update().where(users.c.id == 7).values(name='jack2'))
+
+        s2 = self._session(cache)
+        eq_(self._user_query(s2, 'jack').one().id, 7)
+        s2.close()
+
+        cache.invalidate(User)
+
+        s3 = self._session(cache)
+        eq_(self._user_query(s3, 'jack').all(), [])
+
+    def test_ttl(self):
+        cache = QueryCache(ttl=30)
+        with mock.patch("sqlalchemy.orm.query_cache.time.time") as time:
+            time.return_value = 10000
+            s1 = self._session(cache)
+            self._user_query(s1, 'jack').one()
+            self._user_query(s1, 'ed').cache(ttl=60).one()
+            s1.close()
+
+            time.return_value = 10040
+            s2 = self._session(cache)
+            self._user_query(s2, 'jack').one()
+            self._user_query(s2, 'ed').cache(ttl=60).one()
+
+        eq_(cache.hits, 1)
+        eq_(cache.misses, 3)
+
+    def test_for_update_bypasses(self):
+        cache = QueryCache()
+        s1 = self._session(cache)
+        self._user_query(s1, 'jack').with_for_update().one()
+        self._user_query(s1, 'jack').with_for_update().one()
+        eq_(cache.misses, 0)
+        eq_(cache.hits, 0)
+
+    def test_memory_backend_size(self):
+        cache = QueryCache(MemoryCacheBackend(size=2))
+        s1 = self._session(cache)
+        for name in ('jack', 'ed', 'fred', 'chuck'):
+            self._user_query(s1, name).one()
+        assert len(cache.backend._cache) <= 3
+
+    def test_client_backend(self):
+        client = _DictClient()
+        cache = QueryCache(ClientCacheBackend(client, prefix="test:"))
+
+        s1 = self._session(cache)
+        self._user_query(s1, 'jack').one()
+        s1.close()
+
+        for key in client.data:
+            assert key.startswith("test:")
+        eq_(len(client.data), 2)
+
+        s2 = self._session(cache)
+
+        def go():
+            eq_(self._user_query(s2, 'jack').one().id, 7)
+        self.assert_sql_count(testing.db, go, 0)
+        s2.close()
+
+        s3 = self._session(cache)
+        s3.query(self.classes.User).get(7).name = 'jack2'
+        s3.commit()
+
+        eq_(self._user_query(s3, 'jack').all(), [])
+        eq_(cache.misses, 2)
@@ -7,7 +7,7 @@ from sqlalchemy.orm import selectinload, selectinload_all, \
     aliased, joinedload, deferred, undefer,\
     Session, subqueryload
 from sqlalchemy.testing import assert_raises, \
-    assert_raises_message
+    assert_raises_message, expect_warnings
 from sqlalchemy.testing.assertsql import CompiledSQL
 from sqlalchemy.testing import fixtures
 from sqlalchemy.testing import mock
@@ -1351,6 +1351,8 @@ class ChunkingTest(fixtures.DeclarativeMappedTest):
             __tablename__ = 'a'
             id = Column(Integer, primary_key=True)
             bs = relationship("B", order_by="B.id")
+            chunked_bs = relationship(
+                "B", order_by="B.id", selectin_chunk_size=40, viewonly=True)
 
         class B(fixtures.ComparableEntity, Base):
             __tablename__ = 'b'
@@ -1411,6 +1413,130 @@ class ChunkingTest(fixtures.DeclarativeMappedTest):
             )
         )
 
+    def _assert_chunks(self, session, attr, opt, chunks):
+        A, B = self.classes('A', 'B')
+
+        def go():
+            q = session.query(A).options(opt).order_by(A.id)
+            for a in q:
+                eq_(
+                    getattr(a, attr),
+                    [B(id=(a.id * 6) + j) for j in range(1, 6)]
+                )
+        self.assert_sql_count(testing.db, go, 1 + chunks)
+
+    def test_chunk_size_option(self):
+        A = self.classes.A
+        self._assert_chunks(
+            Session(), "bs", selectinload(A.bs, chunk_size=30), 4)
+
+    def test_chunk_size_option_unbound(self):
+        self._assert_chunks(
+            Session(), "bs", selectinload("bs", chunk_size=30), 4)
+
+    def test_chunk_size_relationship(self):
+        A = self.classes.A
+        self._assert_chunks(
+            Session(), "chunked_bs", selectinload(A.chunked_bs), 3)
+
+    def test_chunk_size_option_overrides_relationship(self):
+        A = self.classes.A
+        self._assert_chunks(
+            Session(), "chunked_bs",
+            selectinload(A.chunked_bs, chunk_size=60), 2)
+
+    def test_chunk_size_dialect_limit(self):
+        A = self.classes.A
+        with mock.patch.object(
+                testing.db.dialect, "max_bind_parameters", 80):
+            # 80 parameters, less 50 reserved for other criteria
+            self._assert_chunks(Session(), "bs", selectinload(A.bs), 4)
+
+    def test_chunk_size_dialect_limit_composite(self):
+        A = self.classes.A
+        loader = A.bs.property._get_strategy((("lazy", "selectin"),))
+        dialect = mock.Mock(max_bind_parameters=999)
+        with mock.patch.object(loader, "_parent_pk_cols", [1, 2, 3]):
+            eq_(loader._effective_chunksize(None, dialect), 316)
+            eq_(loader._effective_chunksize(100, dialect), 100)
+
+        dialect = mock.Mock(max_bind_parameters=10)
+        eq_(loader._effective_chunksize(None, dialect), 1)
+
+        dialect = mock.Mock(max_bind_parameters=None)
+        eq_(loader._effective_chunksize(None, dialect), 500)
+
+    def _executor_fixture(self):
+        calls = []
+
+        class Executor(object):
+            def submit(self, fn, *args):
+                calls.append(args)
+                fn(*args)
+        return Executor(), calls
+
+    def test_executor(self):
+        A = self.classes.A
+        executor, calls = self._executor_fixture()
+        self._assert_chunks(
+            Session(autocommit=True), "bs",
+            selectinload(A.bs, chunk_size=30, executor=executor), 4)
+        eq_(len(calls), 4)
+
+    def test_executor_single_chunk(self):
+        A = self.classes.A
+        executor, calls = self._executor_fixture()
+        self._assert_chunks(
+            Session(autocommit=True), "bs",
+            selectinload(A.bs, executor=executor), 1)
+        eq_(len(calls), 0)
+
+    def test_executor_not_used_in_transaction(self):
+        A = self.classes.A
+        executor, calls = self._executor_fixture()
+        with expect_warnings(
+                "Executor given for selectin loading of A.bs is not used, "
+                "as the Session is within a transaction"):
+            self._assert_chunks(
+                Session(), "bs",
+                selectinload(A.bs, chunk_size=30, executor=executor), 4)
+        eq_(len(calls), 0)
+
+    def test_executor_not_used_for_connection_bind(self):
+        A = self.classes.A
+        executor, calls = self._executor_fixture()
+        with testing.db.connect() as conn:
+            with expect_warnings(
+                    "Executor given for selectin loading of A.bs is not "
+                    "used, as the Session is bound to a Connection"):
+                self._assert_chunks(
+                    Session(conn, autocommit=True), "bs",
+                    selectinload(A.bs, chunk_size=30, executor=executor),
+                    4)
+        eq_(len(calls), 0)
+
+    def test_executor_error_raised(self):
+        A = self.classes.A
+        executor, calls = self._executor_fixture()
+        session = Session(autocommit=True)
+        q = session.query(A).options(
+            selectinload(A.bs, chunk_size=30, executor=executor))
+
+        chunks = []
+
+        def fail(conn, cursor, stmt, params, context, executemany):
+            if "primary_keys" in context.compiled.binds:
+                chunks.append(params)
+                if len(chunks) == 2:
+                    raise Exception("chunk failure")
+
+        sa.event.listen(testing.db, "before_cursor_execute", fail)
+        try:
+            assert_raises_message(Exception, "chunk failure", q.all)
+        finally:
+            sa.event.remove(testing.db, "before_cursor_execute", fail)
+        eq_(len(calls), 4)
+
     @testing.requires.independent_cursors
     def test_yield_per(self):
         # the docs make a lot of guarantees about yield_per
@@ -1518,7 +1518,7 @@ class SessionInterface(fixtures.TestBase):
     def _public_session_methods(self):
         Session = sa.orm.session.Session
 
-        blacklist = set(('begin', 'query'))
+        blacklist = set(('begin', 'query', 'get_many'))
 
         ok = set()
         for meth in Session.public_methods:
@@ -1232,6 +1232,92 @@ class SingleCycleM2MTest(fixtures.MappedTest,
         )
 
 
+class FlushSortCacheTest(UOWTest):
+
+    def teardown(self):
+        engines.testing_reaper.rollback_all()
+        testing.db.execute(
+            self.tables.nodes.update().values(parent_id=None)
+        )
+        super(FlushSortCacheTest, self).teardown()
+
+    def _sort_spies(self):
+        return (
+            patch.object(
+                unitofwork.topological, "find_cycles",
+                Mock(side_effect=unitofwork.topological.find_cycles)),
+            patch.object(
+                unitofwork.topological, "sort",
+                Mock(side_effect=unitofwork.topological.sort))
+        )
+
+    def test_sort_memoized(self):
+        users, Address, addresses, User = (self.tables.users,
+                                           self.classes.Address,
+                                           self.tables.addresses,
+                                           self.classes.User)
+
+        mapper(User, users, properties={
+            'addresses': relationship(Address),
+        })
+        mapper(Address, addresses)
+        sess = create_session()
+
+        sess.add(User(name='u1', addresses=[Address(email_address='a1')]))
+        sess.flush()
+
+        u2 = User(name='u2', addresses=[Address(email_address='a2')])
+        sess.add(u2)
+
+        find_cycles, sort = self._sort_spies()
+        with find_cycles as find_cycles, sort as sort:
+            sess.flush()
+        eq_(find_cycles.mock_calls, [])
+        eq_(sort.mock_calls, [])
+
+        sess.expunge_all()
+        eq_(
+            [a.email_address for a in sess.query(User).
+             filter_by(name='u2').one().addresses],
+            ['a2']
+        )
+
+        # a different set of actions is sorted again
+        sess.query(Address).filter_by(email_address='a2').one().\
+            email_address = 'a3'
+        find_cycles, sort = self._sort_spies()
+        with find_cycles as find_cycles, sort as sort:
+            sess.flush()
+        eq_(len(find_cycles.mock_calls), 1)
+        eq_(len(sort.mock_calls), 1)
+
+    def test_cycles_memoized(self):
+        Node, nodes = self.classes.Node, self.tables.nodes
+
+        mapper(Node, nodes, properties={
+            'children': relationship(Node)
+        })
+        sess = create_session()
+
+        sess.add(Node(data='n1', children=[Node(data='n2')]))
+        sess.flush()
+
+        n3 = Node(data='n3', children=[Node(data='n4'), Node(data='n5')])
+        sess.add(n3)
+
+        find_cycles, sort = self._sort_spies()
+        with find_cycles as find_cycles, sort as sort:
+            sess.flush()
+        eq_(find_cycles.mock_calls, [])
+
+        sess.expunge_all()
+        eq_(
+            sorted(n.data for n in
+                   sess.query(Node).filter_by(data='n3').one().children),
+            ['n4', 'n5']
+        )
+
+
 class RowswitchAccountingTest(fixtures.MappedTest):
 
     @classmethod
@@ -1702,6 +1788,74 @@ class BatchInsertsTest(fixtures.MappedTest, testing.AssertsExecutionResults):
         )
 
 
+class BatchInsertsReturningTest(
+        fixtures.MappedTest, testing.AssertsExecutionResults):
+    __requires__ = ('insert_executemany_returning', )
+    __backend__ = True
+
+    @classmethod
+    def define_tables(cls, metadata):
+        Table('t', metadata,
+              Column('id', Integer, primary_key=True,
+                     test_needs_autoincrement=True),
+              Column('data', String(50)),
+              Column('def_', String(50), server_default='def1')
+              )
+
+    def _fixture(self, **kw):
+        t = self.tables.t
+
+        class T(fixtures.ComparableEntity):
+            pass
+        mapper(T, t, **kw)
+        return T
+
+    def test_server_pks_not_batched(self):
+        # there's no key on which to match rows returned in an
+        # unspecified order to objects without a primary key
+        T = self._fixture()
+        sess = Session()
+        objs = [T(data='t%d' % i) for i in range(1, 11)]
+        sess.add_all(objs)
+
+        self.assert_sql_count(testing.db, sess.flush, 10)
+
+        eq_(len(set(obj.id for obj in objs)), 10)
+        eq_(
+            sess.query(T.id, T.data).order_by(T.id).all(),
+            [(obj.id, obj.data) for obj in objs]
+        )
+
+    def test_eager_defaults_batched(self):
+        T = self._fixture(eager_defaults=True)
+        sess = Session()
+        objs = [T(id=i, data='t%d' % i) for i in range(1, 6)]
+        objs.append(T(id=6, data='t6', def_='def2'))
+        sess.add_all(objs)
+
+        self.assert_sql_count(testing.db, sess.flush, 2)
+
+        def go():
+            eq_(
+                [(obj.data, obj.def_) for obj in objs],
+                [('t%d' % i, 'def1') for i in range(1, 6)] +
+                [('t6', 'def2')]
+            )
+        self.assert_sql_count(testing.db, go, 0)
+
+    def test_sql_expression_not_batched(self):
+        T = self._fixture()
+        sess = Session()
+        objs = [T(data=func.lower('T%d' % i)) for i in range(1, 4)]
+        sess.add_all(objs)
+
+        self.assert_sql_count(testing.db, sess.flush, 3)
+        eq_(
+            sorted(data for data, in sess.query(T.data)),
+            ['t1', 't2', 't3']
+        )
+
+
 class LoadersUsingCommittedTest(UOWTest):
 
     """Test that events which occur within a flush()
@@ -2010,7 +2164,18 @@ class EagerDefaultsTest(fixtures.MappedTest):
 
         s.add_all([t1, t2])
 
-        if testing.db.dialect.implicit_returning:
+        if testing.db.dialect.insert_executemany_returning:
+            self.assert_sql_execution(
+                testing.db,
+                s.commit,
+                CompiledSQL(
+                    "INSERT INTO test (id) VALUES (%(id)s) "
+                    "RETURNING test.id, test.foo",
+                    [{'id': 1}, {'id': 2}],
+                    dialect='postgresql'
+                ),
+            )
+        elif testing.db.dialect.implicit_returning:
             self.assert_sql_execution(
                 testing.db,
                 s.commit,
@@ -2139,6 +2304,55 @@ class EagerDefaultsTest(fixtures.MappedTest):
 
         self.assert_sql_count(testing.db, go, 0)
 
+    @testing.requires.update_from_returning
+    def test_update_defaults_nonpresent_batched(self):
+        Thing2 = self.classes.Thing2
+        s = Session()
+
+        things = [Thing2(id=i, foo=i, bar=i + 1) for i in range(1, 5)]
+        s.add_all(things)
+        s.flush()
+
+        for thing in things:
+            thing.foo += 10
+
+        # a single UPDATE..FROM..RETURNING delivers "bar" for all rows
+        self.assert_sql_count(testing.db, s.flush, 1)
+
+        def go():
+            eq_([thing.bar for thing in things], [2, 3, 4, 5])
+
+        self.assert_sql_count(testing.db, go, 0)
+
+        s.expire_all()
+        eq_([thing.foo for thing in things], [11, 12, 13, 14])
+
+    @testing.requires.update_from_returning
+    def test_update_defaults_nonpresent_batched_chunks(self):
+        Thing2 = self.classes.Thing2
+        s = Session()
+
+        things = [Thing2(id=i, foo=i, bar=i + 1) for i in range(1, 6)]
+        s.add_all(things)
+        s.flush()
+
+        for thing in things:
+            thing.foo += 10
+
+        # five records in chunks of two
+        with patch(
+                "sqlalchemy.orm.persistence."
+                "_UPDATE_FROM_RETURNING_CHUNKSIZE", 2):
+            self.assert_sql_count(testing.db, s.flush, 3)
+
+        def go():
+            eq_([thing.bar for thing in things], [2, 3, 4, 5, 6])
+
+        self.assert_sql_count(testing.db, go, 0)
+
+        s.expire_all()
+        eq_([thing.foo for thing in things], [11, 12, 13, 14, 15])
+
     def test_update_defaults_present_as_expr(self):
         Thing2 = self.classes.Thing2
         s = Session()
@@ -130,6 +130,53 @@ class VersioningTest(fixtures.MappedTest):
             [(f1.id, 'f1rev2', 2), (f2.id, 'f2rev2', 2)]
         )
 
+    @testing.skip_if(
+        lambda config: not config.db.dialect.supports_sane_multi_rowcount and
+        not testing.requires.update_from_returning.enabled,
+        "no means of batching versioned UPDATE statements")
+    def test_multiple_updates_batched(self):
+        Foo = self.classes.Foo
+
+        s1 = self._fixture()
+        foos = [Foo(value='f%d' % i) for i in range(5)]
+        s1.add_all(foos)
+        s1.commit()
+
+        for foo in foos:
+            foo.value += 'rev2'
+        self.assert_sql_count(testing.db, s1.flush, 1)
+        eq_([foo.version_id for foo in foos], [2] * 5)
+        s1.commit()
+
+        eq_(
+            s1.query(Foo.value, Foo.version_id).order_by(Foo.id).all(),
+            [('f%drev2' % i, 2) for i in range(5)]
+        )
+
+    @testing.skip_if(
+        lambda config: not config.db.dialect.supports_sane_multi_rowcount and
+        not testing.requires.update_from_returning.enabled,
+        "no means of batching versioned UPDATE statements")
+    def test_multiple_updates_batched_stale(self):
+        Foo = self.classes.Foo
+
+        s1 = self._fixture()
+        f1, f2 = Foo(value='f1'), Foo(value='f2')
+        s1.add_all([f1, f2])
+        s1.commit()
+
+        s2 = create_session(autocommit=False)
+        s2.query(Foo).get(f2.id).value = 'f2rev2'
+        s2.commit()
+
+        f1.value = 'f1rev2mine'
+        f2.value = 'f2rev2mine'
+        assert_raises_message(
+            sa.orm.exc.StaleDataError,
+            r"UPDATE statement on table 'version_table' expected "
+            r"to update 2 row\(s\); 1 were matched.", s1.flush)
+        s1.rollback()
+
     def test_bulk_insert(self):
         Foo = self.classes.Foo
 
@@ -1065,6 +1112,13 @@ class ServerVersioningTest(fixtures.MappedTest):
         f2.value = 'f2a'
         f3.value = 'f3a'
 
+        if testing.requires.update_from_returning.enabled:
+            # the UPDATEs are batched into a single UPDATE..FROM which
+            # returns the new version ids
+            self.assert_sql_count(testing.db, sess.flush, 1)
+            eq_([f1.version_id, f2.version_id, f3.version_id], [2, 2, 2])
+            return
+
         statements = [
             # note that the assertsql tests the rule against
             # "default" - on a "returning" backend, the statement
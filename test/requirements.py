@@ -109,6 +109,10 @@ class DefaultRequirements(SuiteRequirements):
     def comment_reflection(self):
         return only_on(['postgresql', 'mysql', 'oracle'])
 
+    @property
+    def schema_fingerprint(self):
+        return only_on(['sqlite', 'postgresql'])
+
     @property
     def unbounded_varchar(self):
         """Target database must support VARCHAR with no length"""
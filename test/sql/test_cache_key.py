@@ -0,0 +1,251 @@
+from sqlalchemy.testing import fixtures, eq_, is_, is_not_, ne_
+from sqlalchemy import MetaData, Integer, String, select, bindparam, \
+    literal_column, text, func, and_, or_, case, cast, tuple_, \
+    exists, union
+from sqlalchemy.sql import table, column, ColumnElement
+from sqlalchemy.testing.schema import Table, Column
+from sqlalchemy.dialects import postgresql
+
+
+m = MetaData()
+
+t1 = Table(
+    't1', m,
+    Column('a', Integer, primary_key=True),
+    Column('b', String(20)),
+)
+
+t2 = Table(
+    't2', m,
+    Column('a', Integer, primary_key=True),
+    Column('b', String(20)),
+)
+
+lt = table('lt', column('x', Integer), column('y', String))
+
+
+class CacheKeyTest(fixtures.TestBase):
+
+    fixtures = [
+        lambda: (
+            select([t1.c.a]),
+            select([t1.c.b]),
+            select([t2.c.a]),
+            select([t1.c.a, t1.c.b]),
+            select([t1.c.a]).apply_labels(),
+            select([t1.c.a]).distinct(),
+            select([t1.c.a.label('x')]),
+            select([t1.c.a.label('y')]),
+            select([t1.c.a.label(None)]),
+        ),
+        lambda: (
+            select([t1]).where(t1.c.a == 5),
+            select([t1]).where(t1.c.a != 5),
+            select([t1]).where(t1.c.b == 5),
+            select([t1]).where(t1.c.a == bindparam('x')),
+            select([t1]).where(t1.c.a == bindparam('y')),
+            select([t1]).where(t1.c.a == literal_column('5')),
+            select([t1]).where(and_(t1.c.a == 5, t1.c.b == 'x')),
+            select([t1]).where(or_(t1.c.a == 5, t1.c.b == 'x')),
+            select([t1]).where(t1.c.a.in_([1, 2])),
+            select([t1]).where(t1.c.a.in_([1, 2, 3])),
+            select([t1]).where(t1.c.b.like('x')),
+            select([t1]).where(t1.c.b.like('x', escape='\\')),
+        ),
+        lambda: (
+            select([t1]).limit(5),
+            select([t1]).limit(6),
+            select([t1]).offset(5),
+            select([t1]).order_by(t1.c.a),
+            select([t1]).order_by(t1.c.a.desc()),
+            select([t1]).group_by(t1.c.a),
+            select([t1]).with_for_update(),
+            select([t1]).with_for_update(nowait=True),
+            select([t1]).with_hint(t1, 'some hint'),
+            select([t1]).prefix_with('SOME PREFIX'),
+        ),
+        lambda: (
+            select([lt.c.x]),
+            select([lt.c.y]),
+            select([lt.c.x]).where(lt.c.x == 5),
+            select([lt.alias().c.x]),
+            select([lt.alias('foo').c.x]),
+            select([lt.alias('bar').c.x]),
+            select([lt.join(t1, lt.c.x == t1.c.a)]),
+            select([lt.outerjoin(t1, lt.c.x == t1.c.a)]),
+            select([t1]).select_from(
+                t1.join(t2, t1.c.a == t2.c.a)),
+        ),
+        lambda: (
+            select([func.count(t1.c.a)]),
+            select([func.max(t1.c.a)]),
+            select([func.foo(t1.c.a)]),
+            select([func.foo(t1.c.b)]),
+            select([case([(t1.c.a == 5, 'x')])]),
+            select([case([(t1.c.a == 5, 'x')], else_='y')]),
+            select([cast(t1.c.a, String)]),
+            select([cast(t1.c.a, String(10))]),
+            select([cast(t1.c.a, String(20))]),
+            select([tuple_(t1.c.a, t1.c.b)]),
+            select([func.row_number().over(order_by=t1.c.a)]),
+            select([func.row_number().over(partition_by=t1.c.a)]),
+        ),
+        lambda: (
+            select([t1]).where(
+                t1.c.a == select([t2.c.a]).where(
+                    t2.c.b == t1.c.b).as_scalar()),
+            select([t1]).where(
+                exists().where(t2.c.b == t1.c.b)),
+            union(select([t1.c.a]), select([t2.c.a])),
+            union(select([t1.c.a]), select([t2.c.a])).order_by('a'),
+            select([t1]).cte().select(),
+            select([t1]).cte('foo').select(),
+            text("select a from t1"),
+            text("select b from t1"),
+            text("select a from t1 where a=:x").bindparams(x=5),
+            text("select a from t1").columns(t1.c.a),
+        ),
+        lambda: (
+            t1.insert(),
+            t1.insert().values(a=5),
+            t1.insert().values(b=5),
+            t1.insert().values(a=5, b='q'),
+            t1.insert().values(a=bindparam('x')),
+            t1.insert().values(a=t2.c.a + 5),
+            t1.insert().returning(t1.c.a),
+            t1.insert().from_select(['a'], select([t2.c.a])),
+            t1.update(),
+            t1.update().values(b='x'),
+            t1.update().where(t1.c.a == 5),
+            t1.update().where(t1.c.a == 5).values(b='x'),
+            t1.delete(),
+            t1.delete().where(t1.c.a == 5),
+        ),
+    ]
+
+    def test_cache_key(self):
+        for fixture in self.fixtures:
+            case_a = fixture()
+            case_b = fixture()
+
+            for a, b in zip(case_a, case_b):
+                key_a = a._generate_cache_key()
+                key_b = b._generate_cache_key()
+                is_not_(key_a, None)
+                eq_(key_a[0], key_b[0])
+                eq_(len(key_a[1]), len(key_b[1]))
+
+            keys = set(a._generate_cache_key()[0] for a in case_a)
+            eq_(len(keys), len(case_a))
+
+    def test_literal_values_not_in_key(self):
+        eq_(
+            select([t1]).where(t1.c.a == 5)._generate_cache_key()[0],
+            select([t1]).where(t1.c.a == 10)._generate_cache_key()[0]
+        )
+        eq_(
+            t1.insert().values(a=5)._generate_cache_key()[0],
+            t1.insert().values(a=10)._generate_cache_key()[0]
+        )
+        eq_(
+            t1.update().values({t1.c.b: 'x'})._generate_cache_key()[0],
+            t1.update().values({t1.c.b: 'y'})._generate_cache_key()[0]
+        )
+
+    def test_anon_names_numbered(self):
+        s1 = select([t1.c.a.label(None), func.foo(t1.c.b).label(None)])
+        s2 = select([t1.c.a.label(None), func.foo(t1.c.b).label(None)])
+        eq_(s1._generate_cache_key()[0], s2._generate_cache_key()[0])
+
+    def test_table_identity(self):
+        m2 = MetaData()
+        t1_copy = t1.tometadata(m2)
+        ne_(
+            select([t1])._generate_cache_key()[0],
+            select([t1_copy])._generate_cache_key()[0]
+        )
+
+    def test_repeated_from_identity(self):
+        ta = table('t', column('x', Integer))
+        tb = table('t', column('x', Integer))
+        t = table('t', column('x', Integer))
+
+        s1 = select([ta.c.x]).where(tb.c.x == bindparam('p'))
+        s2 = select([t.c.x]).where(t.c.x == bindparam('p'))
+        ne_(s1._generate_cache_key()[0], s2._generate_cache_key()[0])
+
+        tc = table('t', column('x', Integer))
+        td = table('t', column('x', Integer))
+        s3 = select([tc.c.x]).where(td.c.x == bindparam('p'))
+        eq_(s1._generate_cache_key()[0], s3._generate_cache_key()[0])
+
+    def test_uncacheable(self):
+        for stmt in [
+            t1.insert().values([{"a": 1}, {"a": 2}]),
+            postgresql.insert(t1).values(a=5).on_conflict_do_nothing(),
+            select([t1]).where(t1.c.a == _CustomElement()),
+            t1.insert().values(a=bindparam('x', callable_=lambda: 5)),
+        ]:
+            is_(stmt._generate_cache_key(), None)
+
+
+class _CustomElement(ColumnElement):
+    __visit_name__ = 'custom_element'
+
+
+class AdaptTest(fixtures.TestBase):
+
+    def _compile_and_adapt(self, stmt_a, stmt_b):
+        compiled = stmt_a.compile()
+        key_a = stmt_a._generate_cache_key()
+        key_b = stmt_b._generate_cache_key()
+        eq_(key_a[0], key_b[0])
+        assert compiled._supports_structural_cache(key_a[1])
+        return compiled, compiled._adapt_to_statement(
+            stmt_b, key_a[1], key_b[1])
+
+    def test_select(self):
+        stmt_a = select([t1.c.a.label('foo')]).where(t1.c.b == 'x')
+        stmt_b = select([t1.c.a.label('foo')]).where(t1.c.b == 'y')
+
+        compiled, adapted = self._compile_and_adapt(stmt_a, stmt_b)
+        eq_(adapted.string, compiled.string)
+        is_(adapted.statement, stmt_b)
+        eq_(compiled.params, {"b_1": "x"})
+        eq_(adapted.params, {"b_1": "y"})
+        label_b = stmt_b._raw_columns[0]
+        assert any(obj is label_b for obj in adapted._result_columns[0][2])
+        assert not any(
+            obj is label_b for obj in compiled._result_columns[0][2])
+
+    def test_named_bindparam(self):
+        stmt_a = select([t1]).where(t1.c.a == bindparam('q', 5))
+        stmt_b = select([t1]).where(t1.c.a == bindparam('q', 10))
+
+        compiled, adapted = self._compile_and_adapt(stmt_a, stmt_b)
+        eq_(compiled.construct_params(), {"q": 5})
+        eq_(adapted.construct_params(), {"q": 10})
+        eq_(adapted.construct_params({"q": 15}), {"q": 15})
+
+    def test_insert_values(self):
+        stmt_a = t1.insert().values(a=5, b='x')
+        stmt_b = t1.insert().values(a=10, b='y')
+
+        compiled, adapted = self._compile_and_adapt(stmt_a, stmt_b)
+        eq_(adapted.string, compiled.string)
+        eq_(compiled.params, {"a": 5, "b": "x"})
+        eq_(adapted.params, {"a": 10, "b": "y"})
+
+    def test_update_values(self):
+        stmt_a = t1.update().where(t1.c.a == 5).values(b='x')
+        stmt_b = t1.update().where(t1.c.a == 10).values(b='y')
+
+        compiled, adapted = self._compile_and_adapt(stmt_a, stmt_b)
+        eq_(compiled.params, {"a_1": 5, "b": "x"})
+        eq_(adapted.params, {"a_1": 10, "b": "y"})
+
+    def test_literal_binds_not_shared(self):
+        stmt = select([t1]).where(t1.c.a == 5)
+        compiled = stmt.compile(compile_kwargs={"literal_binds": True})
+        assert not compiled._supports_structural_cache(
+            stmt._generate_cache_key()[1])
@@ -6,7 +6,7 @@ from sqlalchemy import util
 from sqlalchemy import (
     exc, sql, func, select, String, Integer, MetaData, ForeignKey,
     VARCHAR, INT, CHAR, text, type_coerce, literal_column,
-    TypeDecorator, table, column, literal)
+    TypeDecorator, table, column, literal, event)
 from sqlalchemy.engine import result as _result
 from sqlalchemy.testing.schema import Table, Column
 import operator
@@ -1717,6 +1717,71 @@ class AlternateResultProxyTest(fixtures.TablesTest):
                     r = conn.execute(stmt)
                     eq_(r.scalar(), "HI THERE")
 
+    def test_fetch_columns_plain(self):
+        self._test_fetch_columns(_result.ResultProxy)
+
+    def test_fetch_columns_buffered_row(self):
+        self._test_fetch_columns(_result.BufferedRowResultProxy)
+
+    def test_fetch_columns_fully_buffered(self):
+        self._test_fetch_columns(_result.FullyBufferedResultProxy)
+
+    def test_fetch_columns_buffered_column(self):
+        self._test_fetch_columns(_result.BufferedColumnResultProxy)
+
+    def _test_fetch_columns(self, cls):
+        class MyType(TypeDecorator):
+            impl = Integer()
+
+            def process_result_value(self, value, dialect):
+                return value * 10
+
+        with self._proxy_fixture(cls):
+            stmt = select([
+                self.table.c.y, type_coerce(self.table.c.x, MyType)
+            ]).order_by(self.table.c.x)
+
+            r = self.engine.execute(stmt)
+            eq_(
+                r.fetch_columns(3),
+                [["t_1", "t_2", "t_3"], [10, 20, 30]]
+            )
+            eq_(
+                r.fetch_columns(),
+                [["t_%d" % i for i in range(4, 12)],
+                 [i * 10 for i in range(4, 12)]]
+            )
+            eq_(r.fetch_columns(3), [[], []])
+            r.close()
+            self._assert_result_closed(r)
+            assert_raises_message(
+                sa_exc.ResourceClosedError,
+                "object is closed",
+                r.fetch_columns, 2
+            )
+
+            r = self.engine.execute(stmt.where(self.table.c.x > 20))
+            eq_(r.fetch_columns(5), [[], []])
+
+    def test_fetch_columns_no_rows(self):
+        test = self.tables.test
+        r = self.engine.execute(test.insert(), {'x': 100, 'y': "t_100"})
+        assert_raises_message(
+            sa_exc.ResourceClosedError,
+            "This result object does not return rows",
+            r.fetch_columns
+        )
+
+    @testing.requires.numpy
+    def test_fetch_columns_numpy(self):
+        import numpy
+
+        test = self.tables.test
+        r = self.engine.execute(select([test.c.x]).order_by(test.c.x))
+        col, = r.fetch_columns(5, numpy=True)
+        assert isinstance(col, numpy.ndarray)
+        eq_(col.tolist(), [1, 2, 3, 4, 5])
+
     def test_buffered_row_growth(self):
         with self._proxy_fixture(_result.BufferedRowResultProxy):
             with self.engine.connect() as conn:
@@ -1752,3 +1817,44 @@ class AlternateResultProxyTest(fixtures.TablesTest):
                         len(result._BufferedRowResultProxy__rowbuffer),
                         27
                     )
+
+    def test_fetch_array_size_option(self):
+        with self._proxy_fixture(_result.BufferedRowResultProxy):
+            with self.engine.connect() as conn:
+                conn.execute(self.table.insert(), [
+                    {'x': i, 'y': "t_%d" % i} for i in range(15, 1200)
+                ])
+                result = conn.execution_options(fetch_array_size=300).\
+                    execute(self.table.select())
+                eq_(
+                    len(result._BufferedRowResultProxy__rowbuffer), 300)
+                for idx, row in enumerate(result, 0):
+                    if idx in (1, 299, 300, 900):
+                        eq_(result._bufsize, 300)
+                    le_(
+                        len(result._BufferedRowResultProxy__rowbuffer),
+                        300
+                    )
+                eq_(idx, 1199 - 15 + 11)
+
+    def test_fetch_array_size_cursor(self):
+        table = self.tables.test
+        canary = []
+
+        def before_cursor_execute(conn, cursor, stmt, params, ctx, many):
+            canary.append(cursor.arraysize)
+
+        event.listen(
+            self.engine, "before_cursor_execute", before_cursor_execute)
+        try:
+            with self.engine.connect() as conn:
+                conn.execute(table.select()).fetchall()
+                conn.execution_options(fetch_array_size=25).execute(
+                    table.select()).fetchall()
+                conn.execute(
+                    table.select().execution_options(fetch_array_size=500)
+                ).fetchall()
+        finally:
+            event.remove(
+                self.engine, "before_cursor_execute", before_cursor_execute)
+        eq_(canary, [1, 25, 500])
@@ -1,7 +1,7 @@
 """Test various algorithmic properties of selectables."""
 
 from sqlalchemy.testing import eq_, assert_raises, \
-    assert_raises_message, is_
+    assert_raises_message, is_, ne_
 from sqlalchemy import *
 from sqlalchemy.testing import fixtures, AssertsCompiledSQL, \
     AssertsExecutionResults
@@ -1981,6 +1981,14 @@ class AnnotationsTest(fixtures.TestBase):
         eq_(str(or_(b, b._annotate({"foo": "bar"}))),
             ":bind_1 OR :bind_1")
 
+    def test_bind_unique_unpickle(self):
+        b = bindparam("bind", value="x", unique=True)
+        b2 = util.pickle.loads(util.pickle.dumps(b))
+
+        # the key of the unpickled copy is specific to the copy
+        ne_(b2.key, b.key)
+        eq_(str(or_(b, b2)), ":bind_1 OR :bind_2")
+
     def test_comparators_cleaned_out_construction(self):
         c = column('a')
 